@@ -0,0 +1,128 @@
+"""Event-loop stalls while decoding a large timeline page: inline vs
+off the loop (yaylib.offload), on --posts posts (default 100).
+
+    python benchmarks/decode_offload.py [--posts N] [--rounds N]
+
+Run from packages/python with yaylib importable (pip install -e .).
+
+Each variant decodes the same response body --rounds times through the
+Client's ApiClient (the path a get_timeline response takes once it has
+arrived) while a ticker task asks to run every 0.5 ms; the longest gap
+between its runs is how long the loop was blocked. Reported per
+variant: wall time per decode and the p99 / max ticker gap, in
+milliseconds. "process" (a ProcessPoolExecutor) only applies to dict
+mode. Nothing touches the network.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+from multidict import CIMultiDict
+
+import yaylib
+from yaylib.client import Client
+from yaylib.offload import DecodeOffloadPolicy
+from yaylib.transport import BufferedResponse
+
+_URL = "https://api.yay.space/v2/posts/timeline"
+_TYPES = {"200": "PostsResponse"}
+
+
+def _body(posts: int) -> bytes:
+    items = []
+    for i in range(posts):
+        user = {
+            "id": 1000 + i,
+            "nickname": f"user{i}",
+            "biography": "bio " * 8,
+            "followers_count": 120,
+            "profile_icon": "https://cdn.example/icon.png",
+            "online_status": "offline",
+            "is_private": False,
+        }
+        items.append({
+            "id": i,
+            "text": f"post number {i} " * 4,
+            "created_at": 1700000000 + i,
+            "likes_count": i % 97,
+            "post_type": "text",
+            "liked": False,
+            "user": user,
+            "likers": [user, user],
+            "mentions": [user],
+        })
+    return json.dumps({"posts": items, "next_page_value": "x"}).encode()
+
+
+async def _ticker(gaps, stop: asyncio.Event) -> None:
+    last = time.perf_counter()
+    while not stop.is_set():
+        await asyncio.sleep(0.0005)
+        now = time.perf_counter()
+        gaps.append(now - last)
+        last = now
+
+
+async def _measure(client: Client, body: bytes, rounds: int):
+    api_client = client._api_client
+    gaps: list = []
+    stop = asyncio.Event()
+    ticker = asyncio.create_task(_ticker(gaps, stop))
+    await asyncio.sleep(0.01)
+    spent = 0.0
+    for _ in range(rounds):
+        resp = BufferedResponse(
+            200, "OK", CIMultiDict({"Content-Type": "application/json"}), body
+        )
+        started = time.perf_counter()
+        if api_client.decode_offload is not None:
+            await api_client._decode_off_loop(resp, "GET", _URL)
+        api_client.response_deserialize(resp, _TYPES)
+        spent += time.perf_counter() - started
+        await asyncio.sleep(0.01)
+    stop.set()
+    await ticker
+    gaps.sort()
+    return spent / rounds, gaps[int(len(gaps) * 0.99)], gaps[-1]
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--posts", type=int, default=100)
+    parser.add_argument("--rounds", type=int, default=30)
+    args = parser.parse_args()
+    body = _body(args.posts)
+    yaylib.warmup(models=["PostsResponse"])
+
+    threads = ThreadPoolExecutor(1)
+    processes = ProcessPoolExecutor(1)
+    variants = [
+        ("model", "inline", None),
+        ("model", "thread", DecodeOffloadPolicy(executor=threads)),
+        ("dict", "inline", None),
+        ("dict", "thread", DecodeOffloadPolicy(executor=threads)),
+        ("dict", "process", DecodeOffloadPolicy(executor=processes)),
+    ]
+    print(f"PostsResponse, {args.posts} posts, {len(body)} bytes")
+    try:
+        for mode, label, policy in variants:
+            client = Client(response_mode=mode, decode_offload=policy)
+            client.posts_api  # registers the operations' response types
+            await _measure(client, body, 2)  # warm the executor
+            per_decode, p99, worst = await _measure(client, body, args.rounds)
+            print(
+                f"{mode:>5} {label:>7}: {per_decode * 1e3:6.2f} ms/decode  "
+                f"loop stall p99 {p99 * 1e3:6.2f} ms  max {worst * 1e3:6.2f} ms"
+            )
+    finally:
+        threads.shutdown()
+        processes.shutdown()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,68 @@
+"""Cold import time of yaylib, from ``python -X importtime`` in a fresh
+interpreter per round.
+
+    python benchmarks/import_time.py [--repeat N] [--top N] [--statement S]
+
+Run from packages/python with yaylib importable (pip install -e .).
+
+--statement is what the child runs (default ``import yaylib``; try
+``import yaylib; yaylib.Client()`` or ``...; yaylib.Client().users_api``).
+The best of --repeat rounds is reported as the cumulative time of the
+top-level imports, with the --top slowest yaylib modules (cumulative,
+microseconds) from that round: the generated API modules and models
+dominate ``import yaylib``, and a hand-written module that adds to it
+shows up here.
+"""
+
+from __future__ import annotations
+
+import argparse
+import subprocess
+import sys
+from typing import List, Tuple
+
+
+def _importtime(statement: str) -> List[Tuple[int, int, str]]:
+    """(cumulative us, depth, module) for every import the child made."""
+    err = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True, text=True, check=True,
+    ).stderr
+    rows = []
+    for line in err.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        if not cumulative.strip().isdigit():
+            continue  # the header line
+        depth = (len(name) - len(name.lstrip())) // 2
+        rows.append((int(cumulative), depth, name.strip()))
+    return rows
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--top", type=int, default=10)
+    parser.add_argument("--statement", default="import yaylib")
+    args = parser.parse_args()
+
+    best = None
+    for _ in range(args.repeat):
+        rows = _importtime(args.statement)
+        total = sum(us for us, depth, _ in rows if depth == 0)
+        if best is None or total < best[0]:
+            best = (total, rows)
+    total, rows = best
+    ours = {}
+    for us, _, name in rows:
+        if name.split(".")[0] == "yaylib":
+            ours[name] = max(us, ours.get(name, 0))
+
+    print(f"{args.statement!r}: {total / 1e3:.1f} ms, {len(ours)} yaylib modules")
+    for name, us in sorted(ours.items(), key=lambda kv: -kv[1])[: args.top]:
+        print(f"{us / 1e3:10.1f} ms  {name}")
+
+
+if __name__ == "__main__":
+    main()
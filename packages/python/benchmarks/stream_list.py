@@ -0,0 +1,127 @@
+"""Buffered vs streamed (Client.stream_list) decoding of a large
+timeline page of --posts posts (default 1000) from a local server.
+
+    python benchmarks/stream_list.py [--posts N] [--chunk BYTES] [--delay MS]
+
+Run from packages/python with yaylib importable (pip install -e .).
+
+The server writes the body in --chunk byte pieces (default 16 KiB)
+--delay ms apart (default 1 ms), standing in for a slow link. Reported
+per variant: time to the first usable post, total time, and (in a
+separate run) the traced peak of Python memory allocated while the
+page is fetched and its posts consumed, in KiB.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import time
+import tracemalloc
+
+from aiohttp import web
+
+import yaylib
+from yaylib.client import Client
+from yaylib.models.noreply_mode import NoreplyMode
+
+
+def _body(posts: int) -> bytes:
+    items = []
+    for i in range(posts):
+        user = {
+            "id": 1000 + i,
+            "nickname": f"user{i}",
+            "biography": "bio " * 8,
+            "followers_count": 120,
+            "profile_icon": "https://cdn.example/icon.png",
+            "online_status": "offline",
+            "is_private": False,
+        }
+        items.append({
+            "id": i,
+            "text": f"post number {i} " * 4,
+            "created_at": 1700000000 + i,
+            "likes_count": i % 97,
+            "post_type": "text",
+            "liked": False,
+            "user": user,
+            "likers": [user, user],
+            "mentions": [user],
+        })
+    return json.dumps({"posts": items, "next_page_value": "x"}).encode()
+
+
+async def _serve(body: bytes, chunk: int, delay: float):
+    async def handler(request):
+        resp = web.StreamResponse(headers={"Content-Type": "application/json"})
+        await resp.prepare(request)
+        for at in range(0, len(body), chunk):
+            await resp.write(body[at:at + chunk])
+            await asyncio.sleep(delay)
+        await resp.write_eof()
+        return resp
+
+    app = web.Application()
+    app.router.add_route("*", "/{tail:.*}", handler)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    return runner, f"http://127.0.0.1:{site._server.sockets[0].getsockname()[1]}"
+
+
+async def _buffered(client: Client):
+    page = await client.get_timeline(noreply_mode=NoreplyMode.EMPTY)
+    first = None
+    for post in page.posts:
+        if first is None:
+            first = time.perf_counter()
+    return first
+
+
+async def _streamed(client: Client):
+    first = None
+    call = client.get_timeline(noreply_mode=NoreplyMode.EMPTY)
+    async with client.stream_list(call, "posts") as stream:
+        async for post in stream:
+            if first is None:
+                first = time.perf_counter()
+    return first
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--posts", type=int, default=1000)
+    parser.add_argument("--chunk", type=int, default=16 * 1024)
+    parser.add_argument("--delay", type=float, default=1.0)
+    args = parser.parse_args()
+    body = _body(args.posts)
+    yaylib.warmup(models=["PostsResponse", "Post"])
+    runner, base_url = await _serve(body, args.chunk, args.delay / 1000)
+    client = Client(base_url=base_url)
+    client._client_ip = "127.0.0.1"
+    print(f"PostsResponse, {args.posts} posts, {len(body)} bytes")
+    try:
+        for label, run in (("buffered", _buffered), ("streamed", _streamed)):
+            await run(client)  # warm the connection and the validators
+            started = time.perf_counter()
+            first = await run(client)
+            total = time.perf_counter() - started
+            # A separate run: tracing allocations slows everything down.
+            tracemalloc.start()
+            await run(client)
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+            print(
+                f"{label:>8}: first post {(first - started) * 1e3:7.1f} ms  "
+                f"total {total * 1e3:7.1f} ms  peak {peak / 1024:8.0f} KiB"
+            )
+    finally:
+        await client.close()
+        await runner.cleanup()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
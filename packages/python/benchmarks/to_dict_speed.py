@@ -0,0 +1,101 @@
+"""PostsResponse.to_dict / to_json: the generated methods vs the
+single-pass ones (yaylib._serialize), on a timeline page of --posts
+posts (default 50).
+
+    python benchmarks/to_dict_speed.py [--posts N] [--repeat N]
+
+Run from packages/python with yaylib importable (pip install -e .).
+
+The page is decoded with from_dict, as responses are, so every field
+counts as set and the nullable ones come out as explicit nulls. Every
+post carries a user, two likers and a mention. Both variants are
+checked to produce the same JSON before timing; the best of --repeat
+rounds is reported.
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import json
+import timeit
+
+import yaylib  # noqa: F401  (installs the single-pass methods)
+from yaylib import _serialize
+from yaylib.models.posts_response import PostsResponse
+
+
+def _page(posts: int) -> PostsResponse:
+    items = []
+    for i in range(posts):
+        user = {
+            "id": 1000 + i,
+            "nickname": f"user{i}",
+            "biography": "bio " * 8,
+            "followers_count": 120,
+            "profile_icon": "https://cdn.example/icon.png",
+            "online_status": "offline",
+            "is_private": False,
+        }
+        items.append({
+            "id": i,
+            "text": f"post number {i} " * 4,
+            "created_at": 1700000000 + i,
+            "likes_count": i % 97,
+            "post_type": "text",
+            "liked": False,
+            "user": user,
+            "likers": [user, user],
+            "mentions": [user],
+        })
+    return PostsResponse.from_dict({"posts": items, "next_page_value": "x"})
+
+
+@contextlib.contextmanager
+def _generated_methods():
+    for cls, fn in _serialize._generated.items():
+        cls.to_dict = fn
+    try:
+        yield
+    finally:
+        for cls in _serialize._generated:
+            cls.to_dict = _serialize.to_dict
+
+
+def _best(fn, number: int, repeat: int) -> float:
+    return min(timeit.repeat(fn, number=number, repeat=repeat)) / number
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--posts", type=int, default=50)
+    parser.add_argument("--repeat", type=int, default=15)
+    args = parser.parse_args()
+    page = _page(args.posts)
+
+    fast_json = page.to_json()
+    with _generated_methods():
+        assert json.dumps(page.to_dict()) == fast_json, "outputs differ"
+
+    results = {}
+    for label in ("generated", "single-pass"):
+        ctx = _generated_methods() if label == "generated" else contextlib.nullcontext()
+        with ctx:
+            results[label] = (
+                _best(page.to_dict, 20, args.repeat),
+                # to_json is json.dumps(to_dict()) in both
+                _best(lambda: json.dumps(page.to_dict()), 20, args.repeat),
+            )
+
+    print(f"PostsResponse, {args.posts} posts, {len(fast_json)} bytes of JSON")
+    for label, (to_dict, to_json) in results.items():
+        print(
+            f"{label:>11}: to_dict {to_dict * 1e3:7.2f} ms  "
+            f"to_json {to_json * 1e3:7.2f} ms"
+        )
+    gen, fast = results["generated"], results["single-pass"]
+    print(f"    speedup: to_dict {gen[0] / fast[0]:.1f}x  to_json {gen[1] / fast[1]:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
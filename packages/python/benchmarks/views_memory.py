@@ -0,0 +1,117 @@
+"""Bytes per post held in memory: pydantic Post vs PostView vs the
+parsed JSON dict, for a working set of --count posts (default 1M).
+
+    python benchmarks/views_memory.py [--count N] [--kinds view,dict,model]
+
+Run from packages/python with yaylib importable (pip install -e .).
+
+Each representation is built in its own interpreter and measured as
+the growth of resident memory (Linux /proc/self/statm; tracemalloc
+elsewhere, which is much slower). Every post carries a user, two likers
+and a mention, like a timeline page.
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import json
+import os
+import subprocess
+import sys
+import time
+import tracemalloc
+
+from yaylib.models.post import Post
+from yaylib.views import PostView
+
+
+def _post_json(i: int) -> bytes:
+    user = {
+        "id": 1000 + i % 5000,
+        "nickname": f"user{i % 5000}",
+        "biography": "bio " * 8,
+        "followers_count": 120,
+        "followings_count": 80,
+        "posts_count": 300,
+        "profile_icon": "https://cdn.example/icon.png",
+        "profile_icon_thumbnail": "https://cdn.example/icon_t.png",
+        "online_status": "offline",
+        "gender": 1,
+        "is_private": False,
+    }
+    post = {
+        "id": i,
+        "text": f"post number {i} " * 4,
+        "created_at": 1700000000 + i,
+        "updated_at": 1700000000 + i,
+        "likes_count": i % 97,
+        "reposts_count": i % 13,
+        "post_type": "text",
+        "liked": False,
+        "user": user,
+        "likers": [user, user],
+        "mentions": [user],
+    }
+    return json.dumps(post).encode()
+
+
+_BUILD = {
+    "model": lambda raw: Post.from_dict(json.loads(raw)),
+    "view": lambda raw: PostView.from_dict(json.loads(raw)),
+    "dict": lambda raw: json.loads(raw),
+}
+
+
+def _rss() -> int:
+    with open("/proc/self/statm") as f:
+        return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+
+
+def measure(kind: str, count: int) -> None:
+    build = _BUILD[kind]
+    build(_post_json(0))  # import / schema warm-up outside the window
+    use_rss = os.path.exists("/proc/self/statm")
+    gc.collect()
+    if use_rss:
+        before = _rss()
+    else:
+        tracemalloc.start()
+    started = time.perf_counter()
+    # Serialize per item so the measured set shares nothing between
+    # posts, the way objects decoded from responses do.
+    held = [build(_post_json(i)) for i in range(count)]
+    elapsed = time.perf_counter() - started
+    gc.collect()
+    if use_rss:
+        grown = _rss() - before
+    else:
+        grown, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+    print(
+        f"{kind:>5}: {grown / count:8.0f} bytes/post  "
+        f"{grown / 2**20:9.1f} MiB total  {elapsed:6.1f}s to build",
+        flush=True,
+    )
+    del held
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--count", type=int, default=1_000_000)
+    parser.add_argument("--kinds", default="view,dict,model")
+    parser.add_argument("--one", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.one:
+        measure(args.one, args.count)
+        return
+    print(f"{args.count} posts", flush=True)
+    for kind in args.kinds.split(","):
+        subprocess.run(
+            [sys.executable, __file__, "--count", str(args.count), "--one", kind],
+            check=True,
+        )
+
+
+if __name__ == "__main__":
+    main()
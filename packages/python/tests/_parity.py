@@ -93,13 +93,15 @@ def _install_scenario(client: Client, scenario: str, session_id: str) -> None:
     """
     transport = client._transport
 
-    def _ensure() -> aiohttp.ClientSession:
-        if transport._session is None or transport._session.closed:
+    def _ensure(pool: str = "primary") -> aiohttp.ClientSession:
+        session = transport._sessions.get(pool)
+        if session is None or session.closed:
             hdrs = {HDR_SESSION: session_id}
             if scenario:
                 hdrs[HDR_SCENARIO] = scenario
-            transport._session = aiohttp.ClientSession(headers=hdrs)
-        return transport._session
+            session = aiohttp.ClientSession(headers=hdrs)
+            transport._sessions[pool] = session
+        return session
 
     transport._ensure_session = _ensure  # type: ignore[method-assign]
 
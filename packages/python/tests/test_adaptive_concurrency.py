@@ -0,0 +1,140 @@
+# Opt-in AIMD concurrency window (Client adaptive_concurrency=...).
+# Python-only transport behaviour — no parity tag.
+
+import asyncio
+import contextlib
+import json
+
+import pytest
+from aiohttp import web
+
+from yaylib.client import Client
+from yaylib.exceptions import ApiException
+from yaylib.limiter import AdaptiveConcurrency, AdaptiveLimiter, LimiterSet
+from yaylib.retry import RetryPolicy
+
+from ._server import serve
+
+
+async def test_burst_of_congestion_halves_the_window_once():
+    lim = AdaptiveLimiter(AdaptiveConcurrency(initial_limit=8, latency_tolerance=0))
+    gens = [await lim.acquire() for _ in range(8)]
+    for gen in gens:
+        lim.release(gen, congested=True, latency=None)
+    assert lim.limit == 4
+    # A send admitted after the decrease may shrink it again.
+    gen = await lim.acquire()
+    lim.release(gen, congested=True, latency=None)
+    assert lim.limit == 2
+
+
+async def test_successes_grow_the_window_additively():
+    lim = AdaptiveLimiter(
+        AdaptiveConcurrency(initial_limit=4, max_limit=5, latency_tolerance=0)
+    )
+    # ~one whole step per window's worth of successes.
+    for _ in range(5):
+        lim.release(await lim.acquire(), congested=False, latency=0.01)
+    assert lim.limit == 5
+    for _ in range(50):
+        lim.release(await lim.acquire(), congested=False, latency=0.01)
+    assert lim.limit == 5
+
+
+async def test_latency_far_above_baseline_counts_as_congestion():
+    lim = AdaptiveLimiter(AdaptiveConcurrency(initial_limit=10, latency_tolerance=3.0))
+    lim.release(await lim.acquire(), congested=False, latency=0.01)
+    lim.release(await lim.acquire(), congested=False, latency=0.5)
+    assert lim.limit == 5
+
+
+async def test_window_caps_in_flight_and_cancelled_waiter_frees_its_place():
+    lim = AdaptiveLimiter(AdaptiveConcurrency(initial_limit=1))
+    gen = await lim.acquire()
+    first = asyncio.ensure_future(lim.acquire())
+    second = asyncio.ensure_future(lim.acquire())
+    await asyncio.sleep(0)
+    assert lim.stats().queued == 2
+    first.cancel()
+    await asyncio.sleep(0)
+    lim.release(gen, congested=False, latency=None)
+    await second
+    assert lim.stats().in_flight == 1
+    assert lim.stats().queued == 0
+
+
+@contextlib.asynccontextmanager
+async def _serve_held(received: asyncio.Event, release: asyncio.Event):
+    # Answers only once ``release`` is set, so sends stay in flight.
+    async def handler(request):
+        received.set()
+        await release.wait()
+        return web.json_response({"user": {"id": 2}})
+
+    app = web.Application()
+    app.router.add_route("*", "/{tail:.*}", handler)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]  # type: ignore[union-attr]
+    try:
+        yield f"http://127.0.0.1:{port}"
+    finally:
+        release.set()
+        await runner.cleanup()
+
+
+async def test_cancelled_sends_leave_the_window_unchanged():
+    received, release = asyncio.Event(), asyncio.Event()
+    async with _serve_held(received, release) as base_url:
+        client = Client(
+            base_url=base_url,
+            adaptive_concurrency=AdaptiveConcurrency(initial_limit=1),
+        )
+        client._client_ip = "127.0.0.1"
+        try:
+            for _ in range(3):
+                received.clear()
+                call = asyncio.ensure_future(client.users_api.get_user(id=2))
+                await asyncio.wait_for(received.wait(), 5)
+                call.cancel()
+                with pytest.raises(asyncio.CancelledError):
+                    await call
+            stats = client.limiter_stats()["default"]
+            assert (stats.limit, stats.in_flight) == (1, 0)
+        finally:
+            await client.close()
+
+
+def test_unknown_group_route_is_rejected():
+    with pytest.raises(ValueError):
+        LimiterSet(AdaptiveConcurrency(groups={"GET /v9/nope": "x"}))
+
+
+async def test_client_shrinks_window_on_429():
+    def handler(path, method, body):
+        if path.startswith("/v2/users/1"):
+            return 429, json.dumps({"error_code": -343}), {}
+        return 200, json.dumps({"user": {"id": 2}}), {}
+
+    cfg = AdaptiveConcurrency(
+        initial_limit=8,
+        groups={"GET /v2/users/{id}": "users"},
+    )
+    async with serve(handler) as base_url:
+        client = Client(
+            base_url=base_url,
+            adaptive_concurrency=cfg,
+            retry_policy=RetryPolicy(max_attempts=1),
+        )
+        client._client_ip = "127.0.0.1"
+        try:
+            await client.users_api.get_user(id=2)
+            with pytest.raises(ApiException):
+                await client.users_api.get_user(id=1)
+            stats = client.limiter_stats()
+            assert stats["users"].limit == 4
+            assert stats["users"].in_flight == 0
+        finally:
+            await client.close()
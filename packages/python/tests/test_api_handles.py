@@ -0,0 +1,26 @@
+# Per-service API handles built on first access: Client() sets up no
+# API instance until something uses one.
+# Python-only behaviour — no parity tag.
+
+import yaylib
+from yaylib.client import Client
+
+
+def test_handles_are_built_on_first_access():
+    client = Client()
+    assert "users_api" not in vars(client)
+    users = client.users_api
+    assert isinstance(users, yaylib.UsersApi)
+    assert vars(client)["users_api"] is users
+    assert "posts_api" not in vars(client)
+
+
+def test_api_handles_are_built_once_and_honour_validate_arguments():
+    client = Client()
+    users = client.users_api
+    assert client.users_api is users
+    assert users.api_client is client._api_client
+    assert "get_user" not in vars(users)
+
+    trusted = Client(validate_arguments=False).users_api
+    assert "get_user" in vars(trusted)
@@ -0,0 +1,105 @@
+# Opt-in per-host circuit breaker (Client circuit_breaker=...).
+# Python-only transport behaviour — no parity tag.
+
+import asyncio
+import json
+import logging
+
+import pytest
+
+from yaylib.breaker import (
+    CLOSED,
+    HALF_OPEN,
+    OPEN,
+    CircuitBreaker,
+    CircuitBreakerPolicy,
+)
+from yaylib.client import Client
+from yaylib.connection import HttpCore
+from yaylib.errors import APIError
+from yaylib.retry import RetryPolicy
+
+from ._server import serve
+
+
+def test_breaker_transitions():
+    b = CircuitBreaker(CircuitBreakerPolicy(failure_threshold=2, open_duration=0))
+    b.record_failure()
+    b.record_success()
+    b.record_failure()
+    assert b.state == CLOSED  # failures must be consecutive
+    b.record_failure()
+    assert b.state == OPEN
+    assert b.allow() and b.state == HALF_OPEN
+    assert not b.allow()  # one probe at a time
+    b.record_abandoned()
+    assert b.allow()
+    b.record_failure()
+    assert b.state == OPEN
+    assert b.allow()
+    b.record_success()
+    assert b.state == CLOSED
+
+
+async def test_open_circuit_fails_fast_then_recovers():
+    healthy = False
+    hits = []
+
+    def handler(path, method, body):
+        hits.append(path)
+        if healthy:
+            return 200, json.dumps({"user": {"id": 1}}), {}
+        return 503, '{"error":"down"}', {}
+
+    records = []
+
+    class _Capture(logging.Handler):
+        def emit(self, record):
+            records.append(record)
+
+    log = logging.getLogger("yaylib.test.breaker")
+    log.setLevel(logging.DEBUG)
+    log.propagate = False
+    log.handlers = [_Capture()]
+
+    async with serve(handler) as base_url:
+        client = Client(
+            base_url=base_url,
+            retry_policy=RetryPolicy(max_attempts=1),
+            circuit_breaker=CircuitBreakerPolicy(
+                failure_threshold=2, open_duration=0.1
+            ),
+            logger=log,
+        )
+        client._client_ip = "127.0.0.1"
+        host = base_url.split("//")[1]
+        try:
+            for _ in range(2):
+                with pytest.raises(APIError) as ei:
+                    await client.users_api.get_user(id=1)
+                assert ei.value.status == 503
+            assert client.circuit_states() == {host: OPEN}
+            sent = len(hits)
+            with pytest.raises(APIError) as ei:
+                await client.users_api.get_user(id=1)
+            assert ei.value.status == 0
+            with pytest.raises(APIError):
+                await client._transport.send_unwrapped(
+                    "GET", f"{base_url}/v2/users/1", {}, None
+                )
+            assert len(hits) == sent
+
+            healthy = True
+            await asyncio.sleep(0.1)
+            res = await client.users_api.get_user(id=1)
+            assert res.user is not None and res.user.id == 1
+            assert client.circuit_states() == {host: CLOSED}
+            states = [r.state for r in records if getattr(r, "event", "") == "circuit_state"]
+            assert states == [OPEN, HALF_OPEN, CLOSED]
+        finally:
+            await client.close()
+
+
+def test_policy_goes_on_a_shared_core():
+    with pytest.raises(ValueError):
+        Client(http_core=HttpCore(), circuit_breaker=CircuitBreakerPolicy())
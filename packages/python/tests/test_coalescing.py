@@ -0,0 +1,96 @@
+# Opt-in single-flight of identical in-flight GETs (Client
+# coalesce_requests=True). Python-only transport behaviour — no parity
+# tag.
+
+import asyncio
+import json
+from typing import List
+
+from yaylib.client import Client
+
+from ._server import serve
+
+
+def _user_handler(hits):
+    def handler(path, method, body):
+        hits.append(f"{method} {path}")
+        return 200, json.dumps({"user": {"id": 7, "nickname": "n"}}), {}
+
+    return handler
+
+
+async def test_concurrent_identical_gets_share_one_round_trip():
+    hits: List[str] = []
+    async with serve(_user_handler(hits)) as base_url:
+        client = Client(base_url=base_url, coalesce_requests=True)
+        client._client_ip = "127.0.0.1"
+        try:
+            results = await asyncio.gather(
+                *(client.users_api.get_user(id=7) for _ in range(5))
+            )
+            assert hits == ["GET /v2/users/7"]
+            assert client.coalesced_requests == 4
+            assert all(r.user is not None and r.user.id == 7 for r in results)
+            # Typed results are decoded per caller, not shared objects.
+            assert len({id(r) for r in results}) == 5
+            # Once settled, the next call goes to the network again.
+            await client.users_api.get_user(id=7)
+            assert len(hits) == 2
+        finally:
+            await client.close()
+
+
+async def test_distinct_urls_and_writes_are_not_coalesced():
+    hits: List[str] = []
+    async with serve(_user_handler(hits)) as base_url:
+        client = Client(base_url=base_url, coalesce_requests=True)
+        client._client_ip = "127.0.0.1"
+        try:
+            await asyncio.gather(
+                client.users_api.get_user(id=1),
+                client.users_api.get_user(id=2),
+                client.users_api.block_user(id=3),
+                client.users_api.block_user(id=3),
+            )
+            assert sorted(hits) == [
+                "GET /v2/users/1",
+                "GET /v2/users/2",
+                "POST /v1/users/3/block",
+                "POST /v1/users/3/block",
+            ]
+            assert client.coalesced_requests == 0
+        finally:
+            await client.close()
+
+
+async def test_cancelled_leader_does_not_cancel_joined_callers():
+    hits: List[str] = []
+    async with serve(_user_handler(hits)) as base_url:
+        client = Client(base_url=base_url, coalesce_requests=True)
+        client._client_ip = "127.0.0.1"
+        try:
+            leader = asyncio.ensure_future(client.users_api.get_user(id=7))
+            await asyncio.sleep(0)
+            follower = asyncio.ensure_future(client.users_api.get_user(id=7))
+            await asyncio.sleep(0)
+            leader.cancel()
+            res = await follower
+            assert res.user is not None
+            assert res.user.id == 7
+            assert client.coalesced_requests == 1
+        finally:
+            await client.close()
+
+
+async def test_coalescing_is_off_by_default():
+    hits: List[str] = []
+    async with serve(_user_handler(hits)) as base_url:
+        client = Client(base_url=base_url)
+        client._client_ip = "127.0.0.1"
+        try:
+            await asyncio.gather(
+                *(client.users_api.get_user(id=7) for _ in range(3))
+            )
+            assert len(hits) == 3
+        finally:
+            await client.close()
@@ -0,0 +1,137 @@
+# Pluggable JSON codec: request bodies, typed response decoding and
+# error payloads all go through the client's codec.
+# Python-only transport behaviour — no parity tag.
+
+import json
+
+import pytest
+
+from yaylib.client import Client
+from yaylib.codec import JsonCodec, OrjsonCodec, default_codec, fastest_codec, get_codec
+from yaylib.errors import APIError, code_of
+from yaylib.models.common_ids_request import CommonIdsRequest
+from yaylib.retry import RetryPolicy
+
+from ._server import serve
+
+
+def _available():
+    out = [JsonCodec()]
+    for name in ("orjson", "msgspec"):
+        try:
+            out.append(get_codec(name))
+        except ImportError:
+            pass
+    return out
+
+
+class _Counting(JsonCodec):
+    def __init__(self):
+        self.loads_calls = 0
+        self.dumps_calls = 0
+
+    def loads(self, data):
+        self.loads_calls += 1
+        return super().loads(data)
+
+    def dumps(self, obj):
+        self.dumps_calls += 1
+        return super().dumps(obj)
+
+
+def test_get_codec_resolves_names_and_instances():
+    assert get_codec("stdlib") is default_codec()
+    assert get_codec(None) is default_codec()
+    assert get_codec("auto") is fastest_codec()
+    codec = JsonCodec()
+    assert get_codec(codec) is codec
+    with pytest.raises(ValueError):
+        get_codec("simdjson")
+
+
+def test_auto_prefers_an_installed_fast_codec():
+    try:
+        import orjson  # noqa: F401
+    except ImportError:
+        pytest.skip("orjson not installed")
+    assert isinstance(fastest_codec(), OrjsonCodec)
+
+
+def test_default_codec_writes_what_json_dumps_does():
+    # Request bodies and session files are unchanged unless a fast
+    # codec is chosen.
+    assert Client().json_codec is default_codec()
+    obj = {"text": "こんにちは", "ids": [1, 2], "nested": {"ok": True, "none": None}}
+    codec = default_codec()
+    assert codec.dumps(obj) == json.dumps(obj).encode("utf-8")
+    assert codec.dumps_str(obj) == json.dumps(obj)
+    assert codec.dumps_pretty(obj) == json.dumps(obj, indent=2).encode("utf-8")
+
+
+@pytest.mark.parametrize("codec", _available(), ids=lambda c: c.name)
+def test_round_trip_and_errors(codec):
+    obj = {"text": "こんにちは", "ids": [1, 2], "nested": {"ok": True, "none": None}}
+    raw = codec.dumps(obj)
+    assert isinstance(raw, bytes)
+    if codec.name != "stdlib":
+        assert b" " not in raw  # compact
+    assert codec.loads(raw) == obj
+    assert codec.loads(raw.decode("utf-8")) == obj
+    assert codec.loads(memoryview(raw)) == obj
+    assert json.loads(codec.dumps_pretty(obj)) == obj
+    with pytest.raises(ValueError):
+        codec.loads(b"{not json")
+
+
+async def test_client_routes_bodies_and_retry_in_through_codec():
+    def handler(path, method, body):
+        if path.startswith("/v2/users/1"):
+            return 429, json.dumps({"error_code": -343, "retry_in": 0}), {}
+        if method == "PUT":
+            assert json.loads(body) == {"ids": [7, 8]}
+            return 200, json.dumps({"result": "success"}), {}
+        return 200, json.dumps({"user": {"id": 2, "nickname": "b"}}), {}
+
+    codec = _Counting()
+    async with serve(handler) as base_url:
+        client = Client(
+            base_url=base_url,
+            json_codec=codec,
+            retry_policy=RetryPolicy(max_attempts=2),
+        )
+        client._client_ip = "127.0.0.1"
+        try:
+            # Typed model responses are parsed and validated by
+            # pydantic-core (yaylib._decode), not the codec.
+            res = await client.users_api.get_user(id=2)
+            assert res.user is not None and res.user.nickname == "b"
+            assert codec.loads_calls == 0
+
+            with pytest.raises(APIError) as info:
+                await client.users_api.get_user(id=1)
+            assert codec.loads_calls >= 1  # retry_in parsed by the codec
+            calls = codec.loads_calls
+            assert code_of(info.value, client.json_codec) == -343
+            assert codec.loads_calls == calls + 1
+
+            await client.users_api.update_user_interests(
+                common_ids_request=CommonIdsRequest(ids=[7, 8])
+            )
+            assert codec.dumps_calls == 1
+        finally:
+            await client.close()
+
+
+async def test_stdlib_codec_end_to_end():
+    def handler(path, method, body):
+        return 200, json.dumps({"user": {"id": 3, "nickname": "ü"}}), {}
+
+    async with serve(handler) as base_url:
+        client = Client(base_url=base_url, json_codec="stdlib")
+        client._client_ip = "127.0.0.1"
+        try:
+            assert client.json_codec.name == "stdlib"
+            res = await client.users_api.get_user(id=3)
+            assert res.user is not None and res.user.nickname == "ü"
+        finally:
+            await client.close()
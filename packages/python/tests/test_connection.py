@@ -0,0 +1,110 @@
+# Connection pooling (yaylib.connection). Python-only — PORTING.md §17
+# leaves connection pools to each language — so there is no parity tag.
+
+import json
+
+import pytest
+
+from yaylib.client import Client
+from yaylib.connection import ConnectionOptions, HttpCore, build_connector
+
+from ._server import serve
+
+
+async def test_connector_honours_options():
+    conn = build_connector(
+        ConnectionOptions(limit=7, keepalive_timeout=3.0, ttl_dns_cache=0),
+        limit_per_host=2,
+    )
+    try:
+        assert conn.limit == 7
+        assert conn.limit_per_host == 2
+        assert conn.use_dns_cache is False
+    finally:
+        await conn.close()
+
+
+async def test_pool_stats_report_idle_keepalive_socket():
+    def handler(path, method, body):
+        return 200, json.dumps({"time": 1700000000, "ip_address": "1.2.3.4"}), {}
+
+    async with serve(handler) as base_url:
+        client = Client(base_url=base_url)
+        try:
+            assert client.pool_stats() == []
+            await client.users_api.get_user_timestamp()
+            stats = client.pool_stats()
+            assert len(stats) == 1
+            assert stats[0].pool == "primary"
+            assert stats[0].host == "127.0.0.1"
+            assert stats[0].acquired == 0
+            assert stats[0].idle == 1
+        finally:
+            await client.close()
+
+
+async def test_cassandra_host_uses_its_own_pool():
+    def handler(path, method, body):
+        return 200, json.dumps({"time": 1700000000}), {}
+
+    async with serve(handler) as primary_url:
+        async with serve(handler) as aux_url:
+            client = Client(
+                base_url=primary_url,
+                cassandra_base_url=aux_url,
+                connection_options=ConnectionOptions(
+                    limit_per_host=4, cassandra_limit_per_host=1
+                ),
+            )
+            client.set_tokens("ACC", "REF")
+            client._client_ip = "127.0.0.1"
+            try:
+                await client.activities_api.get_user_activities()
+                await client.users_api.get_user_timestamp()
+                pools = {s.pool: s for s in client.pool_stats()}
+                assert set(pools) == {"primary", "cassandra"}
+                assert pools["cassandra"].port != pools["primary"].port
+                sessions = client._transport._sessions
+                cassandra = sessions["cassandra"].connector
+                primary = sessions["primary"].connector
+                assert cassandra is not None and primary is not None
+                assert cassandra.limit_per_host == 1
+                assert primary.limit_per_host == 4
+            finally:
+                await client.close()
+
+
+async def test_shared_core_pools_sockets_across_clients():
+    seen_uuids = []
+
+    def handler(path, method, body, headers):
+        seen_uuids.append(headers.get("X-Device-UUID"))
+        return 200, json.dumps({"time": 1700000000, "ip_address": "1.2.3.4"}), {}
+
+    async with serve(handler) as base_url:
+        async with HttpCore() as core:
+            a = Client(base_url=base_url, http_core=core)
+            b = Client(base_url=base_url, http_core=core)
+            try:
+                await a.users_api.get_user_timestamp()
+                await b.users_api.get_user_timestamp()
+                # Identity headers stay per client ...
+                assert seen_uuids == [a.device_uuid, b.device_uuid]
+                # ... while the second client reused the first one's
+                # keep-alive socket instead of opening its own.
+                stats = core.pool_stats()
+                assert [(s.acquired, s.idle) for s in stats] == [(0, 1)]
+                assert a.pool_stats() == b.pool_stats() == stats
+            finally:
+                await a.close()
+            # Closing one client leaves the shared core usable.
+            assert not core.connector("primary").closed
+            try:
+                await b.users_api.get_user_timestamp()
+            finally:
+                await b.close()
+
+
+def test_connection_options_conflict_with_shared_core():
+    with pytest.raises(ValueError):
+        Client(http_core=HttpCore(), connection_options=ConnectionOptions())
@@ -0,0 +1,140 @@
+# Per-call deadlines (yaylib.deadline / call_options(deadline=...))
+# bounding sends, backoffs, pause-gate waits and the 401 refresh.
+# Python-only transport behaviour — no parity tag.
+
+import asyncio
+import json
+import time
+
+import pytest
+
+import yaylib
+from yaylib.client import Client
+from yaylib.errors import APIError
+from yaylib.limiter import AdaptiveConcurrency
+from yaylib.retry import RetryPolicy
+
+from ._server import serve
+
+
+def _unavailable(retry_in):
+    def handler(path, method, body):
+        return 503, json.dumps({"error": "down", "retry_in": retry_in}), {}
+
+    return handler
+
+
+async def test_backoff_past_deadline_surfaces_the_response_at_once():
+    async with serve(_unavailable(5)) as base_url:
+        client = Client(base_url=base_url)
+        client._client_ip = "127.0.0.1"
+        # Built on first access; keep that out of the timed call.
+        users = client.users_api
+        try:
+            started = time.monotonic()
+            with yaylib.deadline(1.0):
+                with pytest.raises(APIError) as ei:
+                    await users.get_user(id=1)
+            assert ei.value.status == 503
+            assert time.monotonic() - started < 0.5
+        finally:
+            await client.close()
+
+
+async def test_retries_stop_when_the_next_backoff_no_longer_fits():
+    hits = []
+
+    def handler(path, method, body):
+        hits.append(path)
+        return 503, json.dumps({"retry_in": 0.15}), {}
+
+    async with serve(handler) as base_url:
+        client = Client(
+            base_url=base_url, retry_policy=RetryPolicy(max_attempts=10)
+        )
+        client._client_ip = "127.0.0.1"
+        try:
+            started = time.monotonic()
+            with yaylib.deadline(0.4):
+                with pytest.raises(APIError):
+                    await client.users_api.get_user(id=1)
+            assert time.monotonic() - started < 0.4
+            assert 2 <= len(hits) <= 3
+        finally:
+            await client.close()
+
+
+async def test_pause_window_past_deadline_fails_fast():
+    def handler(path, method, body):
+        if path.startswith("/v2/users/1"):
+            return 429, json.dumps({"retry_in": 5}), {}
+        return 200, json.dumps({"user": {"id": 2}}), {}
+
+    async with serve(handler) as base_url:
+        client = Client(
+            base_url=base_url,
+            retry_policy=RetryPolicy(max_attempts=1),
+            pause_on_retry_window=True,
+        )
+        client._client_ip = "127.0.0.1"
+        try:
+            with pytest.raises(APIError):
+                await client.users_api.get_user(id=1)
+            with yaylib.deadline(1.0):
+                with pytest.raises(APIError) as ei:
+                    await client.users_api.get_user(id=2)
+            assert ei.value.status == 0
+            assert ei.value.reason == "deadline exceeded"
+        finally:
+            await client.close()
+
+
+async def test_waiting_for_a_send_slot_is_bounded():
+    async with serve(lambda p, m, b: (200, '{"user":{"id":1}}')) as base_url:
+        client = Client(
+            base_url=base_url,
+            adaptive_concurrency=AdaptiveConcurrency(initial_limit=1),
+        )
+        client._client_ip = "127.0.0.1"
+        try:
+            limiters = client._transport._limiters
+            assert limiters is not None
+            limiter = limiters.for_request("GET", "/v2/users/1")
+            generation = await limiter.acquire()
+            with yaylib.deadline(0.1):
+                with pytest.raises(APIError) as ei:
+                    await client.users_api.get_user(id=1)
+            assert ei.value.reason == "deadline exceeded"
+            assert limiter.stats().queued == 0
+            limiter.release(generation, congested=False, latency=None)
+        finally:
+            await client.close()
+
+
+async def test_refresh_wait_is_bounded_and_keeps_running():
+    finished = asyncio.Event()
+
+    async def slow_refresh(stale_access):
+        await asyncio.sleep(0.3)
+        finished.set()
+        return False
+
+    async with serve(lambda p, m, b: (401, '{"error_code":-3}')) as base_url:
+        client = Client(base_url=base_url)
+        client._client_ip = "127.0.0.1"
+        client._transport._refresh = slow_refresh
+        try:
+            with yaylib.deadline(0.1):
+                with pytest.raises(APIError) as ei:
+                    await client.users_api.get_user(id=1)
+            assert ei.value.reason == "deadline exceeded"
+            # Shielded: other waiters of the single-flight still get it.
+            await asyncio.wait_for(finished.wait(), 1.0)
+        finally:
+            await client.close()
+
+
+def test_nested_deadline_keeps_the_earlier_one():
+    with yaylib.deadline(1.0) as outer:
+        with yaylib.deadline(60.0) as inner:
+            assert inner.deadline == outer.deadline
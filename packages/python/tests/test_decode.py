@@ -0,0 +1,91 @@
+# Typed decoding straight from the response body (yaylib._decode): same
+# models, same to_dict output and same failure surface as the generated
+# from_dict path it short-circuits.
+# Python-only transport behaviour — no parity tag.
+
+import json
+
+import pytest
+
+from yaylib import _decode
+from yaylib.client import Client
+from yaylib.errors import APIError
+from yaylib.models.noreply_mode import NoreplyMode
+from yaylib.models.posts_response import PostsResponse
+from yaylib.models.walkthrough import Walkthrough
+
+from ._server import serve
+
+_USER = {"id": 5, "nickname": "a", "birth_date": None, "online_status": "online"}
+_POST = {
+    "id": 11,
+    "text": "hi",
+    "user": _USER,
+    "likers": [_USER],
+    "in_reply_to_post": {"id": 10, "user": {"id": 6}},
+    "created_at": 1700000000,
+    "unknown_field": {"ignored": True},
+}
+_TIMELINE = {"posts": [_POST, dict(_POST, id=12)], "next_page_value": "12"}
+
+
+def test_fast_path_matches_from_dict():
+    body = json.dumps(_TIMELINE).encode()
+    validate = _decode.json_validator("PostsResponse")
+    assert validate is not None
+    fast = validate(body)
+    slow = PostsResponse.from_dict(json.loads(body))
+    assert slow is not None and slow.posts is not None
+    assert fast == slow
+    assert fast.to_dict() == slow.to_dict()
+    assert fast.model_fields_set == slow.model_fields_set
+    post = slow.posts[0]
+    assert post.user is not None and post.in_reply_to_post is not None
+    assert post.in_reply_to_post.user is not None
+    assert fast.posts[0].user.model_fields_set == post.user.model_fields_set
+    assert (
+        fast.posts[0].in_reply_to_post.user.model_fields_set
+        == post.in_reply_to_post.user.model_fields_set
+    )
+
+
+def test_list_responses_and_unhandled_types():
+    body = b'[{"title": "t", "url": "u"}, {"title": "s"}]'
+    validate = _decode.json_validator("List[Walkthrough]")
+    assert validate is not None
+    items = validate(body)
+    assert items == [Walkthrough.from_dict(i) for i in json.loads(body)]
+    walkthrough = Walkthrough.from_dict({"title": "s"})
+    assert walkthrough is not None
+    assert items[1].to_dict() == walkthrough.to_dict()
+    assert _decode.json_validator("Dict[str, str]") is None
+    assert _decode.json_validator("object") is None
+
+
+async def test_client_decodes_timeline_and_keeps_raw_body_on_failure():
+    bodies = {
+        "ok": json.dumps(_TIMELINE),
+        "bad": json.dumps({"posts": [{"id": "not-an-int"}]}),
+    }
+    state = {"body": bodies["ok"]}
+
+    def handler(path, method, body):
+        return 200, state["body"], {}
+
+    async with serve(handler) as base_url:
+        client = Client(base_url=base_url)
+        client._client_ip = "127.0.0.1"
+        try:
+            res = await client.posts_api.get_timeline(noreply_mode=NoreplyMode.EMPTY)
+            assert res.posts is not None
+            assert [p.id for p in res.posts] == [11, 12]
+            assert res.posts[0].likers is not None
+            assert res.posts[0].likers[0].nickname == "a"
+
+            state["body"] = bodies["bad"]
+            with pytest.raises(APIError) as info:
+                await client.posts_api.get_timeline(noreply_mode=NoreplyMode.EMPTY)
+            assert info.value.status == 200
+            assert info.value.body == bodies["bad"]
+        finally:
+            await client.close()
@@ -0,0 +1,173 @@
+# Off-event-loop decoding of large responses (yaylib.offload): results
+# and errors are the same as inline decoding, small bodies stay inline,
+# a process pool only takes dict-mode bodies, and a response shared
+# through the cache decodes per caller.
+# Python-only transport behaviour — no parity tag.
+
+import json
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+
+import pytest
+
+import yaylib
+from yaylib.cache import CachePolicy
+from yaylib.client import Client
+from yaylib.errors import APIError
+from yaylib.models.noreply_mode import NoreplyMode
+from yaylib.models.posts_response import PostsResponse
+from yaylib.offload import DecodeOffloadPolicy
+
+from ._server import serve
+
+_USER = {"id": 5, "nickname": "あ", "biography": None}
+_TIMELINE = {
+    "posts": [{"id": i, "text": "x" * 40, "user": _USER} for i in range(50)],
+    "next_page_value": "50",
+}
+
+
+def _handler(path, method, body):
+    if path.startswith("/v2/users/timestamp"):
+        return 200, json.dumps({"time": 0, "ip_address": "10.0.0.1"}), {}
+    if path.startswith("/v2/posts/following_timeline"):
+        # A 2xx body that does not validate.
+        return 200, json.dumps({"posts": "nope" * 20}), {}
+    if path.startswith("/v2/users/8"):
+        return 200, "not json", {}
+    return 200, json.dumps(_TIMELINE), {}
+
+
+class _Counting(Executor):
+    jobs = 0
+
+    def submit(self, *args, **kwargs):
+        self.jobs += 1
+        return super().submit(*args, **kwargs)
+
+
+class _Threads(_Counting, ThreadPoolExecutor):
+    pass
+
+
+class _Processes(_Counting, ProcessPoolExecutor):
+    pass
+
+
+def _client(base_url, executor=None, min_bytes=0, **kwargs):
+    client = Client(
+        base_url=base_url,
+        decode_offload=DecodeOffloadPolicy(min_bytes=min_bytes, executor=executor),
+        **kwargs,
+    )
+    client._client_ip = "127.0.0.1"
+    return client
+
+
+async def _outcome(call):
+    try:
+        res = await call()
+    except APIError as exc:
+        return "error", (exc.status, exc.body)
+    if isinstance(res, PostsResponse):
+        # Lazy models validate nested fields on access.
+        try:
+            res = res.to_dict()
+        except APIError as exc:
+            return "lazy error", (exc.status, exc.body)
+    return "ok", res
+
+
+async def test_results_and_errors_match_inline_decoding():
+    counting = _Threads(1)
+    async with serve(_handler) as base_url:
+        inline = Client(base_url=base_url)
+        inline._client_ip = "127.0.0.1"
+        offloaded = _client(base_url, counting)
+        try:
+            for mode in ("model", "lazy", "dict"):
+                with yaylib.call_options(response_mode=mode):
+                    for call in (
+                        lambda c: c.get_timeline(noreply_mode=NoreplyMode.EMPTY),
+                        lambda c: c.posts_api.get_following_timeline(),
+                        lambda c: c.users_api.get_user(id=8),
+                    ):
+                        expected = await _outcome(lambda: call(inline))
+                        got = await _outcome(lambda: call(offloaded))
+                        assert got == expected
+            assert counting.jobs == 9
+        finally:
+            await inline.close()
+            await offloaded.close()
+            counting.shutdown()
+
+
+async def test_call_options_apply_in_the_executor():
+    counting = _Threads(1)
+    async with serve(_handler) as base_url:
+        client = _client(base_url, counting, response_mode="dict")
+        try:
+            with yaylib.call_options(fields={"posts": {"id"}}):
+                res = await client.get_timeline(noreply_mode=NoreplyMode.EMPTY)
+            assert res == {"posts": [{"id": i} for i in range(50)]}
+            assert counting.jobs == 1
+        finally:
+            await client.close()
+            counting.shutdown()
+
+
+async def test_small_bodies_decode_inline():
+    counting = _Threads(1)
+    async with serve(_handler) as base_url:
+        client = _client(base_url, counting, min_bytes=1 << 20)
+        try:
+            res = await client.get_timeline(noreply_mode=NoreplyMode.EMPTY)
+            assert isinstance(res, PostsResponse)
+            assert counting.jobs == 0
+        finally:
+            await client.close()
+            counting.shutdown()
+
+
+async def test_process_pool_takes_dict_mode_only():
+    counting = _Processes(1)
+    async with serve(_handler) as base_url:
+        client = _client(base_url, counting)
+        try:
+            res = await client.get_timeline(noreply_mode=NoreplyMode.EMPTY)
+            assert isinstance(res, PostsResponse)
+            assert counting.jobs == 0
+            with yaylib.call_options(response_mode="dict"):
+                res = await client.get_timeline(noreply_mode=NoreplyMode.EMPTY)
+                assert res == _TIMELINE
+                with pytest.raises(APIError) as info:
+                    await client.users_api.get_user(id=8)
+                assert (info.value.status, info.value.body) == (200, "not json")
+            assert counting.jobs == 2
+        finally:
+            await client.close()
+            counting.shutdown()
+
+
+async def test_cached_response_decodes_per_call_options():
+    counting = _Processes(1)
+    async with serve(_handler) as base_url:
+        client = _client(
+            base_url,
+            counting,
+            response_cache=CachePolicy(ttls={"GET /v2/posts/{noreply_mode}timeline": 60}),
+        )
+        try:
+            with yaylib.call_options(response_mode="dict"):
+                res = await client.get_timeline(noreply_mode=NoreplyMode.EMPTY)
+                assert res == _TIMELINE
+            res = await client.get_timeline(noreply_mode=NoreplyMode.EMPTY)
+            assert isinstance(res, PostsResponse)
+            with yaylib.call_options(response_mode="dict", fields={"next_page_value"}):
+                res = await client.get_timeline(noreply_mode=NoreplyMode.EMPTY)
+                assert res == {"next_page_value": "50"}
+            stats = client.cache_stats()
+            assert stats is not None and stats.hits == 2
+            assert counting.jobs == 2
+        finally:
+            await client.close()
+            counting.shutdown()
@@ -0,0 +1,93 @@
+# Field projection: call_options(fields=...) decodes only the named
+# keys of a model response, in every response mode.
+# Python-only transport behaviour — no parity tag.
+
+import asyncio
+import json
+
+import pytest
+
+import yaylib
+from yaylib.call_options import normalize_fields
+from yaylib.client import Client
+from yaylib.models.noreply_mode import NoreplyMode
+from yaylib.models.posts_response import PostsResponse
+
+from ._server import serve
+
+_USER = {"id": 5, "nickname": "a", "biography": "b"}
+_POST = {"id": 11, "text": "hi", "likes_count": 3, "user": _USER, "likers": [_USER]}
+_TIMELINE = {"posts": [_POST, dict(_POST, id=12)], "next_page_value": "12"}
+
+_FIELDS = {"posts": {"id": True, "text": True, "user": {"id"}}}
+_PROJECTED = {
+    "posts": [
+        {"id": 11, "text": "hi", "user": {"id": 5}},
+        {"id": 12, "text": "hi", "user": {"id": 5}},
+    ]
+}
+
+
+def _handler(path, method, body):
+    return 200, json.dumps(_TIMELINE), {}
+
+
+def test_normalize_fields():
+    assert normalize_fields({"id", "text"}) == {"id": None, "text": None}
+    assert normalize_fields({"posts": ["id"], "next_page_value": True}) == {
+        "posts": {"id": None},
+        "next_page_value": None,
+    }
+    spec = normalize_fields(_FIELDS)
+    assert normalize_fields(spec) == spec
+    with pytest.raises(TypeError):
+        normalize_fields("id")
+    with pytest.raises(TypeError):
+        normalize_fields({1: True})
+
+
+async def test_projection_in_each_response_mode():
+    async with serve(_handler) as base_url:
+        client = Client(base_url=base_url)
+        client._client_ip = "127.0.0.1"
+        try:
+            with yaylib.call_options(fields=_FIELDS):
+                page = await client.get_timeline(noreply_mode=NoreplyMode.EMPTY)
+                assert page == PostsResponse.from_dict(_PROJECTED)
+                post = page.posts[0]
+                assert (post.id, post.text, post.user.id) == (11, "hi", 5)
+                assert post.likes_count is None and post.user.nickname is None
+                assert page.next_page_value is None
+
+                with yaylib.call_options(response_mode="dict"):
+                    raw = await client.get_timeline(noreply_mode=NoreplyMode.EMPTY)
+                assert raw == _PROJECTED
+
+                with yaylib.call_options(response_mode="lazy"):
+                    lazy = await client.get_timeline(noreply_mode=NoreplyMode.EMPTY)
+                assert lazy == PostsResponse.from_dict(_PROJECTED)
+
+            page = await client.get_timeline(noreply_mode=NoreplyMode.EMPTY)
+            assert page.posts[0].likes_count == 3
+        finally:
+            await client.close()
+
+
+async def test_projection_does_not_reach_the_client_ip_fetch():
+    def handler(path, method, body):
+        if path.startswith("/v2/users/timestamp"):
+            return 200, json.dumps({"time": 0, "ip_address": "10.0.0.1"}), {}
+        return _handler(path, method, body)
+
+    async with serve(handler) as base_url:
+        client = Client(base_url=base_url)
+        try:
+            # The first response kicks off the background X-Client-IP
+            # fetch from inside the caller's options block.
+            with yaylib.call_options(fields=_FIELDS, response_mode="dict"):
+                with yaylib.deadline(30):
+                    await client.get_timeline(noreply_mode=NoreplyMode.EMPTY)
+                await asyncio.gather(*client._bg_tasks)
+            assert client._client_ip == "10.0.0.1"
+        finally:
+            await client.close()
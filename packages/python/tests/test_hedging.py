@@ -0,0 +1,91 @@
+# Opt-in hedged GETs (Client hedging=HedgePolicy(...)). Python-only
+# transport behaviour — no parity tag.
+
+import asyncio
+import contextlib
+import json
+from typing import List
+
+from aiohttp import web
+
+from yaylib.client import Client
+from yaylib.hedging import HedgePolicy, Hedger
+
+_MESSAGES = "GET /v2/chat_rooms/{id}/messages"
+
+
+@contextlib.asynccontextmanager
+async def _serve(delays):
+    # Async handler (the shared test server is sync): the n-th request
+    # sleeps delays[n] before answering.
+    hits: List[str] = []
+
+    async def handler(request):
+        n = len(hits)
+        hits.append(request.path)
+        await asyncio.sleep(delays[n] if n < len(delays) else 0)
+        return web.Response(
+            text=json.dumps({"messages": [{"id": n}]}),
+            content_type="application/json",
+        )
+
+    app = web.Application()
+    app.router.add_route("*", "/{tail:.*}", handler)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]  # type: ignore[union-attr]
+    try:
+        yield f"http://127.0.0.1:{port}", hits
+    finally:
+        await runner.cleanup()
+
+
+async def test_slow_get_is_hedged_and_the_loser_cancelled():
+    policy = HedgePolicy(operations=(_MESSAGES,), initial_delay=0.05)
+    async with _serve([0.5]) as (base_url, hits):
+        client = Client(base_url=base_url, hedging=policy)
+        client._client_ip = "127.0.0.1"
+        try:
+            res = await asyncio.wait_for(
+                client.chat_rooms_api.get_chat_messages(id=1), 1.0
+            )
+            assert res.messages is not None and res.messages[0].id == 1
+            stats = client.hedge_stats()
+            assert stats is not None
+            assert (stats.hedged, stats.wins) == (1, 1)
+            # The losing send was cancelled: no connection is held.
+            await asyncio.sleep(0)
+            assert all(p.acquired == 0 for p in client.pool_stats())
+        finally:
+            await client.close()
+
+
+async def test_writes_and_unlisted_operations_are_never_hedged():
+    policy = HedgePolicy(operations=(_MESSAGES,), initial_delay=0.01)
+    async with _serve([0.1, 0.1]) as (base_url, hits):
+        client = Client(base_url=base_url, hedging=policy)
+        client._client_ip = "127.0.0.1"
+        try:
+            await client.users_api.get_user(id=1)
+            await client.users_api.block_user(id=1)
+            assert len(hits) == 2
+            stats = client.hedge_stats()
+            assert stats is not None and stats.hedged == 0
+        finally:
+            await client.close()
+
+
+def test_threshold_tracks_the_percentile_and_budget_caps_hedges():
+    hedger = Hedger(
+        HedgePolicy(
+            operations=(_MESSAGES,), min_samples=10, budget_ratio=0.5, budget_burst=1
+        )
+    )
+    for ms in range(1, 21):
+        hedger.observe(_MESSAGES, ms / 1000)
+    assert hedger.delay(_MESSAGES) == 0.02
+    assert hedger.try_hedge()
+    assert not hedger.try_hedge()
+    assert hedger.stats().denied == 1
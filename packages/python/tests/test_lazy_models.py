@@ -0,0 +1,112 @@
+# Lazy response models (response_mode="lazy"): nested models decode on
+# first access, and a lazy model is indistinguishable from the eagerly
+# built one wherever it is compared, dumped, copied or pickled.
+# Python-only transport behaviour — no parity tag.
+
+import copy
+import json
+import pickle
+
+import pytest
+
+import yaylib
+from yaylib import _lazy
+from yaylib.client import Client
+from yaylib.errors import APIError
+from yaylib.models.noreply_mode import NoreplyMode
+from yaylib.models.post import Post
+from yaylib.models.posts_response import PostsResponse
+from yaylib.models.realm_user import RealmUser
+
+from ._server import serve
+
+_USER = {"id": 5, "nickname": "a", "birth_date": None}
+_POST = {
+    "id": 11,
+    "text": "hi",
+    "user": _USER,
+    "likers": [_USER, dict(_USER, id=6)],
+    "in_reply_to_post": {"id": 10, "user": _USER},
+}
+_TIMELINE = {"posts": [_POST, dict(_POST, id=12)], "next_page_value": "12"}
+
+
+def _lazy_timeline():
+    return _lazy.decode(json.loads(json.dumps(_TIMELINE)), "PostsResponse")
+
+
+def test_nested_fields_decode_on_access():
+    page = _lazy_timeline()
+    assert isinstance(page, PostsResponse)
+    assert page.next_page_value == "12"
+    assert "posts" not in page.__dict__
+
+    assert page.posts is not None
+    post = page.posts[0]
+    assert isinstance(post, Post)
+    assert (post.id, post.text) == (11, "hi")
+    assert "user" not in post.__dict__ and "likers" not in post.__dict__
+
+    assert isinstance(post.user, RealmUser)
+    assert post.user.nickname == "a"
+    assert post.likers is not None
+    assert [u.id for u in post.likers] == [5, 6]
+    reply = post.in_reply_to_post
+    assert reply is not None and reply.user is not None
+    assert reply.user.id == 5
+
+
+def test_lazy_models_match_eager_models():
+    eager = PostsResponse.from_dict(_TIMELINE)
+    assert eager is not None and eager.posts is not None
+    assert _lazy_timeline() == eager
+    assert eager == _lazy_timeline()
+    assert _lazy_timeline().to_dict() == eager.to_dict()
+    assert _lazy_timeline().to_json() == eager.to_json()
+    assert repr(_lazy_timeline()) == repr(eager)
+    assert copy.deepcopy(_lazy_timeline()) == eager
+    assert _lazy_timeline().posts[0].model_fields_set == eager.posts[0].model_fields_set
+
+    restored = pickle.loads(pickle.dumps(_lazy_timeline()))
+    assert type(restored) is PostsResponse
+    assert restored.posts is not None
+    assert type(restored.posts[0].user) is RealmUser
+    assert restored == eager
+
+
+def test_assignment_replaces_a_pending_field():
+    post = _lazy_timeline().posts[0]
+    post.user = RealmUser(id=9)
+    assert post.user.id == 9
+    assert post.to_dict()["user"] == {"id": 9}
+
+
+def test_malformed_nested_value_fails_on_access():
+    page = _lazy.decode({"posts": [{"id": 1, "user": {"id": "x"}}]}, "PostsResponse")
+    post = page.posts[0]
+    assert post.id == 1
+    for _ in range(2):
+        with pytest.raises(APIError) as info:
+            post.user
+        assert (info.value.status, info.value.body) == (200, '{"id": "x"}')
+    with pytest.raises(APIError):
+        post.to_dict()
+
+
+async def test_client_lazy_mode():
+    def handler(path, method, body):
+        return 200, json.dumps(_TIMELINE), {}
+
+    async with serve(handler) as base_url:
+        client = Client(base_url=base_url, response_mode="lazy")
+        client._client_ip = "127.0.0.1"
+        try:
+            page = await client.get_timeline(noreply_mode=NoreplyMode.EMPTY)
+            assert isinstance(page, PostsResponse)
+            assert "posts" not in page.__dict__
+            assert page == PostsResponse.from_dict(_TIMELINE)
+            with yaylib.call_options(response_mode="model"):
+                page = await client.get_timeline(noreply_mode=NoreplyMode.EMPTY)
+            assert type(page) is PostsResponse
+        finally:
+            await client.close()
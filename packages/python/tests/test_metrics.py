@@ -0,0 +1,117 @@
+# Opt-in metrics registry (Client metrics=MetricsRegistry()).
+# Python-only — no parity tag.
+
+import asyncio
+import json
+
+import yaylib
+from yaylib.client import Client
+from yaylib.connection import ConnectionOptions
+from yaylib.metrics import MetricsRegistry, prometheus_text
+from yaylib.retry import RetryPolicy
+
+from ._server import serve
+
+
+def _series(snapshot, kind, name, **labels):
+    return [
+        s for s in snapshot[kind].get(name, [])
+        if all(s["labels"].get(k) == v for k, v in labels.items())
+    ]
+
+
+async def test_calls_are_recorded_per_operation():
+    flaky = [503]
+
+    def handler(path, method, body):
+        if path.startswith("/v2/users/2") and flaky:
+            return flaky.pop(), '{"error":"x"}', {}
+        return 200, json.dumps({"user": {"id": 1}}), {}
+
+    metrics = MetricsRegistry()
+    async with serve(handler) as base_url:
+        client = Client(
+            base_url=base_url,
+            metrics=metrics,
+            retry_policy=RetryPolicy(base_delay=0.001, max_delay=0.001),
+        )
+        client._client_ip = "127.0.0.1"
+        try:
+            await client.users_api.get_user(id=1)
+            await client.users_api.get_user(id=2)
+            await client.users_api.block_user(id=3)
+        finally:
+            await client.close()
+
+    snap = metrics.snapshot()
+    (ok,) = _series(snap, "counters", "yaylib_responses_total",
+                    operation="get_user", status="200")
+    assert ok["value"] == 2
+    (retries,) = _series(snap, "counters", "yaylib_retries_total", operation="get_user")
+    assert retries["value"] == 1
+    (attempts,) = _series(snap, "counters", "yaylib_attempts_total", operation="get_user")
+    assert attempts["value"] == 3
+    assert _series(snap, "counters", "yaylib_responses_total", operation="block_user")
+    phases = {
+        s["labels"]["phase"]: s["count"]
+        for s in _series(snap, "histograms", "yaylib_call_phase_seconds",
+                         operation="get_user")
+    }
+    assert phases == {"wait": 2, "send": 2, "read": 2, "decode": 2}
+    (gauge,) = _series(snap, "gauges", "yaylib_in_flight", operation="get_user")
+    assert gauge["value"] == 0
+    # No raw paths as labels.
+    assert "/v2/users" not in json.dumps(snap)
+
+
+def test_prometheus_text_format():
+    metrics = MetricsRegistry(buckets=(0.1, 1.0))
+    metrics.inc("yaylib_responses_total", (("operation", 'a"b'), ("status", "200")))
+    metrics.observe("yaylib_call_phase_seconds", (("operation", "x"), ("phase", "send")), 0.5)
+    text = prometheus_text(metrics)
+    assert '# TYPE yaylib_responses_total counter' in text
+    assert 'yaylib_responses_total{operation="a\\"b",status="200"} 1' in text
+    assert 'yaylib_call_phase_seconds_bucket{operation="x",phase="send",le="0.1"} 0' in text
+    assert 'yaylib_call_phase_seconds_bucket{operation="x",phase="send",le="1"} 1' in text
+    assert 'yaylib_call_phase_seconds_bucket{operation="x",phase="send",le="+Inf"} 1' in text
+    assert 'yaylib_call_phase_seconds_count{operation="x",phase="send"} 1' in text
+    assert yaylib.prometheus_text is prometheus_text
+
+
+async def test_connection_phases_and_reuse_are_traced():
+    def handler(path, method, body):
+        return 200, json.dumps({"user": {"id": 1}}), {}
+
+    metrics = MetricsRegistry()
+    async with serve(handler) as base_url:
+        client = Client(
+            base_url=base_url,
+            metrics=metrics,
+            connection_options=ConnectionOptions(limit=1),
+        )
+        client._client_ip = "127.0.0.1"
+        try:
+            await client.users_api.get_user(id=1)
+            await client.users_api.get_user(id=1)
+            # One connection for two concurrent calls: one must queue.
+            await asyncio.gather(
+                client.users_api.get_user(id=1), client.users_api.get_user(id=1)
+            )
+        finally:
+            await client.close()
+
+    snap = metrics.snapshot()
+    conns = {
+        s["labels"]["reused"]: s["value"]
+        for s in _series(snap, "counters", "yaylib_connections_total",
+                         operation="get_user")
+    }
+    assert conns == {"false": 1, "true": 3}
+    phases = {
+        s["labels"]["phase"]: s["count"]
+        for s in _series(snap, "histograms", "yaylib_connection_phase_seconds",
+                         operation="get_user")
+    }
+    assert phases["connect"] == 1
+    assert phases["server"] == 4
+    assert phases["pool_wait"] == 1
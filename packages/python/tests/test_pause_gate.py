@@ -0,0 +1,106 @@
+# Opt-in 429 pause gate: a retry window announced by the server
+# (retry_in body / Retry-After header) holds back every new send of a
+# Client(pause_on_retry_window=True), or of every client on an
+# HttpCore(share_pause_gate=True).
+# Python-only transport behaviour — no parity tag.
+
+import email.utils
+import json
+import time
+
+import pytest
+from multidict import CIMultiDict
+
+from yaylib.client import Client
+from yaylib.connection import HttpCore
+from yaylib.errors import APIError
+from yaylib.retry import RetryPolicy
+from yaylib.transport import BufferedResponse, Transport
+
+from ._server import serve
+
+NO_RETRY = RetryPolicy(max_attempts=1, max_delay=5.0)
+
+
+def _handler(path, method, body):
+    if path.startswith("/v2/users/1"):
+        return 429, json.dumps({"error_code": -343, "retry_in": 0.2}), {}
+    return 200, json.dumps({"user": {"id": 2}}), {}
+
+
+async def test_retry_window_pauses_other_sends():
+    async with serve(_handler) as base_url:
+        client = Client(
+            base_url=base_url, retry_policy=NO_RETRY, pause_on_retry_window=True
+        )
+        client._client_ip = "127.0.0.1"
+        try:
+            with pytest.raises(APIError):
+                await client.users_api.get_user(id=1)
+            started = time.monotonic()
+            await client.users_api.get_user(id=2)
+            assert time.monotonic() - started >= 0.15
+            stats = client.pause_stats()
+            assert stats is not None
+            assert stats.pauses == 1
+            assert stats.waits == 1
+            assert stats.paused_seconds == pytest.approx(0.2, abs=0.05)
+        finally:
+            await client.close()
+
+
+async def test_gate_is_off_by_default():
+    async with serve(_handler) as base_url:
+        client = Client(base_url=base_url, retry_policy=NO_RETRY)
+        client._client_ip = "127.0.0.1"
+        try:
+            with pytest.raises(APIError):
+                await client.users_api.get_user(id=1)
+            started = time.monotonic()
+            await client.users_api.get_user(id=2)
+            assert time.monotonic() - started < 0.15
+            assert client.pause_stats() is None
+        finally:
+            await client.close()
+
+
+async def test_gate_is_per_client_unless_shared_on_the_core():
+    async with serve(_handler) as base_url:
+        async with HttpCore(share_pause_gate=True) as core:
+            shared = [
+                Client(base_url=base_url, retry_policy=NO_RETRY, http_core=core)
+                for _ in range(2)
+            ]
+            alone = Client(
+                base_url=base_url, retry_policy=NO_RETRY, pause_on_retry_window=True
+            )
+            for c in (*shared, alone):
+                c._client_ip = "127.0.0.1"
+            try:
+                with pytest.raises(APIError):
+                    await shared[0].users_api.get_user(id=1)
+                await alone.users_api.get_user(id=2)
+                alone_stats = alone.pause_stats()
+                assert alone_stats is not None and alone_stats.waits == 0
+                await shared[1].users_api.get_user(id=2)
+                shared_stats = shared[1].pause_stats()
+                assert shared_stats is not None and shared_stats.waits == 1
+            finally:
+                for c in (*shared, alone):
+                    await c.close()
+
+
+def test_retry_after_header_forms():
+    def resp(value):
+        return BufferedResponse(429, "", CIMultiDict({"Retry-After": value}), b"")
+
+    assert Transport._retry_hint_seconds(resp("3")) == 3.0
+    future = email.utils.formatdate(time.time() + 60, usegmt=True)
+    wait = Transport._retry_hint_seconds(resp(future))
+    assert wait is not None and 55 <= wait <= 60
+    assert Transport._retry_hint_seconds(resp("soon")) is None
+    # The body's retry_in wins over the header.
+    body = BufferedResponse(
+        429, "", CIMultiDict({"Retry-After": "3"}), b'{"retry_in": 0.5}'
+    )
+    assert Transport._retry_hint_seconds(body) == 0.5
@@ -0,0 +1,98 @@
+# Compiled request templates (yaylib._template) and the per-client
+# static header block: requests come out exactly as the generic
+# ApiClient.param_serialize / header injection builds them.
+# Python-only transport behaviour — no parity tag.
+
+import base64
+import contextlib
+
+from yaylib import _template
+from yaylib.api_client import ApiClient
+from yaylib.client import Client, _WrappedApiClient
+from yaylib.models.noreply_mode import NoreplyMode
+
+_OVERRIDES = ("param_serialize", "select_header_accept", "select_header_content_type")
+_COMMON = dict(_request_auth=None, _content_type=None, _host_index=0)
+
+
+@contextlib.contextmanager
+def _generic():
+    saved = {name: _WrappedApiClient.__dict__[name] for name in _OVERRIDES}
+    for name in _OVERRIDES:
+        setattr(_WrappedApiClient, name, getattr(ApiClient, name))
+    try:
+        yield
+    finally:
+        for name, fn in saved.items():
+            setattr(_WrappedApiClient, name, fn)
+
+
+def _requests(client):
+    posts, users = client.posts_api, client.users_api
+    yield lambda: users._get_user_serialize(id=12, _headers={"X-A": 1}, **_COMMON)
+    yield lambda: users._get_user_serialize(id="a b/é", _headers=None, **_COMMON)
+    yield lambda: posts._get_timeline_serialize(
+        noreply_mode=NoreplyMode.EMPTY, order_by="new", experiment_older_age_rules=True,
+        var_from="2024-01-01 00:00", from_post_id=9, number=50, mxn=2.5, en=None,
+        vn=None, reduce_selfie=False, custom_generation_range=None, _headers=None,
+        **_COMMON,
+    )
+    yield lambda: posts._create_post_serialize(
+        x_jwt="jwt", attachment_2_filename=None, attachment_3_filename=None,
+        attachment_4_filename=None, attachment_5_filename=None,
+        attachment_6_filename=None, attachment_7_filename=None,
+        attachment_8_filename=None, attachment_9_filename=None,
+        attachment_filename="a.jpg", choices=["x y", "z"], color=3, font_size=1,
+        group_id=None, in_reply_to=None, language="ja", mention_ids=[1, 2],
+        message_tags={"k": "v"}, post_type="image", shared_url=None, text="hi",
+        video_file_name=None, _headers=None, **_COMMON,
+    )
+    # "multi" collection format on a query parameter
+    yield lambda: users._get_users_by_ids_serialize(
+        x_jwt="jwt", user_ids=[3, 4], _headers=None, **_COMMON
+    )
+
+
+def test_requests_match_the_generic_path():
+    client = Client()
+    for build in _requests(client):
+        compiled = build()
+        with _generic():
+            expected = build()
+        assert compiled == expected
+        assert list(compiled[2]) == list(expected[2])
+
+
+def test_path_templates_are_compiled_once():
+    template = _template.path_template("/v2/posts/{noreply_mode}timeline")
+    assert _template.path_template("/v2/posts/{noreply_mode}timeline") is template
+    assert template.chunks == ("/v2/posts/", "timeline")
+    assert template.names == ("noreply_mode",)
+    # Unfilled placeholders stay, as the generic path leaves them.
+    assert template.fill({}, "", str) == "/v2/posts/{noreply_mode}timeline"
+
+
+def test_injected_headers_respect_caller_headers():
+    client = Client(device_info="dev")
+    client._client_ip = "10.0.0.1"
+    transport = client._transport
+    headers = transport._build_headers(
+        {"user-agent": "mine", "x-timestamp": "1", "content-type": "application/JSON"},
+        "https://example/v2/users/1",
+    )
+    assert headers["user-agent"] == "mine" and "User-Agent" not in headers
+    assert headers["X-Client-IP"] == "10.0.0.1"
+    assert headers["X-Device-Info"] == "dev"
+    assert "x-timestamp" not in headers and headers["X-Timestamp"] != "1"
+    assert headers["content-type"] == "application/json;charset=UTF-8"
+
+    basic = transport._build_headers({}, "https://example/api/v1/oauth/token")
+    token = base64.b64encode(client.api_key.encode()).decode()
+    assert basic["Authorization"] == f"Basic {token}"
+
+
+def test_static_headers_follow_context_updates():
+    client = Client()
+    client.set_device_uuid("uuid-2")
+    headers = client._transport._build_headers({}, "https://example/v2/users/1")
+    assert headers["X-Device-UUID"] == "uuid-2"
@@ -0,0 +1,164 @@
+# Opt-in response cache (Client(response_cache=CachePolicy(...))).
+# Python-only transport behaviour — no parity tag.
+
+import ast
+import json
+from pathlib import Path
+from typing import Any, Dict, List
+
+import pytest
+
+import yaylib.api
+from yaylib._operations import OPERATIONS
+from yaylib.cache import CachePolicy, ResponseCache
+from yaylib.call_options import call_options
+from yaylib.client import Client
+from yaylib.transport import BufferedResponse
+
+from ._server import serve
+
+
+def _genres_handler(hits):
+    def handler(path, method, body):
+        hits.append(path)
+        if path.startswith("/v1/genres"):
+            return 200, json.dumps({"genres": [{"id": len(hits)}]}), {}
+        return 200, json.dumps({"user": {"id": 7}}), {}
+
+    return handler
+
+
+async def test_cached_get_skips_network_and_decodes_identically():
+    hits: List[str] = []
+    async with serve(_genres_handler(hits)) as base_url:
+        client = Client(base_url=base_url, response_cache=CachePolicy())
+        client._client_ip = "127.0.0.1"
+        try:
+            first = await client.genres_api.list_genres()
+            second = await client.genres_api.list_genres()
+            assert len(hits) == 1
+            assert type(second) is type(first)
+            assert second.to_dict() == first.to_dict()
+            assert second is not first
+            stats = client.cache_stats()
+            assert stats is not None
+            assert (stats.hits, stats.misses, stats.entries) == (1, 1, 1)
+        finally:
+            await client.close()
+
+
+async def test_bypass_goes_to_network_and_refreshes_entry():
+    hits: List[str] = []
+    async with serve(_genres_handler(hits)) as base_url:
+        client = Client(base_url=base_url, response_cache=CachePolicy())
+        client._client_ip = "127.0.0.1"
+        try:
+            await client.genres_api.list_genres()
+            with call_options(bypass_cache=True):
+                fresh = await client.genres_api.list_genres()
+            assert len(hits) == 2
+            again = await client.genres_api.list_genres()
+            assert len(hits) == 2
+            assert again.to_dict() == fresh.to_dict()
+        finally:
+            await client.close()
+
+
+async def test_unlisted_operations_and_other_identities_miss():
+    hits: List[str] = []
+    async with serve(_genres_handler(hits)) as base_url:
+        client = Client(base_url=base_url, response_cache=CachePolicy())
+        client._client_ip = "127.0.0.1"
+        try:
+            await client.users_api.get_user(id=7)
+            await client.users_api.get_user(id=7)
+            assert len(hits) == 2
+            client.set_tokens("A", "R")
+            await client.genres_api.list_genres()
+            client.set_tokens("B", "R")
+            await client.genres_api.list_genres()
+            assert len(hits) == 4
+        finally:
+            await client.close()
+
+
+def test_policy_rejects_unknown_and_non_get_templates():
+    with pytest.raises(ValueError):
+        ResponseCache(CachePolicy(ttls={"GET /v1/genre": 60}))
+    with pytest.raises(ValueError):
+        ResponseCache(CachePolicy(ttls={"POST /v1/users/{id}/block": 60}))
+
+
+def test_templated_ttl_and_lru_byte_budget():
+    cache = ResponseCache(
+        CachePolicy(ttls={"GET /api/apps/{app}": 60}, max_bytes=10)
+    )
+    assert cache.ttl_for("/api/apps/yay") == 60
+    assert cache.ttl_for("/api/apps") is None
+
+    def resp(n):
+        return BufferedResponse(200, "OK", {}, b"x" * n)
+
+    cache.put(("a",), resp(4), 60)
+    cache.put(("b",), resp(4), 60)
+    assert cache.get(("a",)) is not None  # a is now most recent
+    cache.put(("c",), resp(4), 60)  # evicts b, the LRU entry
+    assert cache.get(("b",)) is None
+    assert cache.get(("a",)) is not None
+    cache.put(("big",), resp(11), 60)  # over budget: not stored
+    assert cache.get(("big",)) is None
+    assert cache.stats().bytes == 8
+
+
+def test_route_table_prefers_literal_and_allows_empty_param():
+    from yaylib._routes import RouteTable
+
+    table = RouteTable(
+        {
+            "GET /v1/users/{id}": "by_id",
+            "GET /v1/users/search": "search",
+            "GET /v2/posts/{noreply_mode}timeline": "timeline",
+        }
+    )
+    assert table.lookup("get", "/v1/users/search") == "search"
+    assert table.lookup("GET", "/v1/users/42") == "by_id"
+    assert table.lookup("GET", "/v1/users/42/x") is None
+    assert table.lookup("GET", "/v2/posts/timeline") == "timeline"
+    assert table.lookup("GET", "/v2/posts/noreply_timeline") == "timeline"
+    assert table.lookup("POST", "/v1/users/42") is None
+
+
+def _generated_operations() -> Dict[str, str]:
+    # "METHOD path" -> operation id, read from the param_serialize call
+    # of every generated _<operation>_serialize method. Parsed, not
+    # imported: importing every API module builds every validator.
+    found: Dict[str, str] = {}
+    for path in sorted(Path(yaylib.api.__file__).parent.glob("*_api.py")):
+        for node in ast.walk(ast.parse(path.read_text(encoding="utf-8"))):
+            if not (
+                isinstance(node, ast.FunctionDef)
+                and node.name.startswith("_")
+                and node.name.endswith("_serialize")
+            ):
+                continue
+            for call in ast.walk(node):
+                if not (
+                    isinstance(call, ast.Call)
+                    and isinstance(call.func, ast.Attribute)
+                    and call.func.attr == "param_serialize"
+                ):
+                    continue
+                args: Dict[Any, Any] = {
+                    kw.arg: kw.value.value
+                    for kw in call.keywords
+                    if isinstance(kw.value, ast.Constant)
+                }
+                key = f"{args['method'].upper()} {args['resource_path']}"
+                found[key] = node.name[1:-len("_serialize")]
+    return found
+
+
+def test_operation_table_matches_the_generated_operations():
+    # _operations.py is kept by hand; this catches it drifting from a
+    # regenerated API (cache TTLs, hedging and offload are keyed by it).
+    assert OPERATIONS == _generated_operations()
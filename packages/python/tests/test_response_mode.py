@@ -0,0 +1,99 @@
+# Response modes: "model" (typed pydantic models, the default) and
+# "dict" (parsed JSON, no model construction), per client or per call.
+# Python-only transport behaviour — no parity tag.
+
+import asyncio
+import json
+
+import pytest
+
+import yaylib
+from yaylib.client import Client
+from yaylib.errors import APIError
+from yaylib.models.noreply_mode import NoreplyMode
+from yaylib.models.posts_response import PostsResponse
+
+from ._server import serve
+
+_TIMELINE = {"posts": [{"id": 1, "user": {"id": 5}}], "next_page_value": "1"}
+
+
+def _handler(path, method, body):
+    if path.startswith("/v2/users/timestamp"):
+        return 200, json.dumps({"time": 1700000000, "ip_address": "10.0.0.1"}), {}
+    if path.startswith("/v2/users/9"):
+        return 404, json.dumps({"error_code": -5, "message": "nope"}), {}
+    if path.startswith("/v2/users/8"):
+        return 200, "not json", {}
+    return 200, json.dumps(_TIMELINE), {}
+
+
+async def test_client_wide_dict_mode():
+    async with serve(_handler) as base_url:
+        client = Client(base_url=base_url, response_mode="dict")
+        client._client_ip = "127.0.0.1"
+        try:
+            res = await client.get_timeline(noreply_mode=NoreplyMode.EMPTY)
+            assert res == _TIMELINE
+            with yaylib.call_options(response_mode="model"):
+                res = await client.get_timeline(noreply_mode=NoreplyMode.EMPTY)
+            assert isinstance(res, PostsResponse)
+        finally:
+            await client.close()
+
+
+async def test_per_call_dict_mode_keeps_error_surfacing():
+    async with serve(_handler) as base_url:
+        client = Client(base_url=base_url)
+        client._client_ip = "127.0.0.1"
+        try:
+            with yaylib.call_options(response_mode="dict"):
+                res = await client.get_timeline(noreply_mode=NoreplyMode.EMPTY)
+                assert res == _TIMELINE
+                with pytest.raises(APIError) as info:
+                    await client.users_api.get_user(id=9)
+                assert info.value.status == 404
+                with pytest.raises(APIError) as info:
+                    await client.users_api.get_user(id=8)
+                assert info.value.status == 200
+                assert info.value.body == "not json"
+            res = await client.get_timeline(noreply_mode=NoreplyMode.EMPTY)
+            assert isinstance(res, PostsResponse)
+        finally:
+            await client.close()
+
+
+async def test_internal_calls_keep_models_in_dict_mode():
+    # The lazy client-IP fetch runs under the caller's call options but
+    # reads the timestamp model.
+    async with serve(_handler) as base_url:
+        client = Client(base_url=base_url, response_mode="dict")
+        try:
+            await client.get_timeline(noreply_mode=NoreplyMode.EMPTY)
+            for _ in range(50):
+                if client._client_ip:
+                    break
+                await asyncio.sleep(0.01)
+            assert client._client_ip == "10.0.0.1"
+        finally:
+            await client.close()
+
+
+async def test_signed_info_reads_the_timestamp_model_in_dict_mode():
+    async with serve(_handler) as base_url:
+        client = Client(base_url=base_url, response_mode="dict")
+        client._client_ip = "127.0.0.1"
+        try:
+            with yaylib.call_options(fields={"ip_address"}):
+                info = await client.generate_signed_info()
+            assert info == client.generate_signed_info_at(1700000000)
+        finally:
+            await client.close()
+
+
+def test_unknown_mode_is_rejected():
+    with pytest.raises(ValueError):
+        Client(response_mode="raw")
+    with pytest.raises(ValueError):
+        with yaylib.call_options(response_mode="raw"):
+            pass
@@ -179,3 +179,40 @@ async def test_zero_policy_disables_retry():
             assert hits == 1
         finally:
             await client.close()
+
+
+async def test_retry_budget_caps_retries_across_requests():
+    # Python-only: RetryPolicy.retry_budget_ratio (token bucket shared by
+    # every request of the client).
+    hits = 0
+
+    def handler(path, method, body):
+        nonlocal hits
+        hits += 1
+        return 503, '{"error":"down"}', {}
+
+    policy = RetryPolicy(
+        max_attempts=3,
+        base_delay=0.001,
+        max_delay=0.005,
+        retry_budget_ratio=0.5,
+        retry_budget_burst=1,
+    )
+    async with serve(handler) as base_url:
+        client = Client(base_url=base_url, retry_policy=policy)
+        client._client_ip = "127.0.0.1"
+        try:
+            sent = []
+            for _ in range(3):
+                before = hits
+                with pytest.raises(APIError) as ei:
+                    await client.users_api.get_user(id=1)
+                # Out of budget: the original 503 surfaces, not a retry.
+                assert ei.value.status == 503
+                sent.append(hits - before)
+            # Burst token, then one retry per two first attempts.
+            assert sent == [2, 1, 2]
+            budget = client._transport._retry_budget
+            assert budget is not None and budget.denied == 3
+        finally:
+            await client.close()
@@ -0,0 +1,93 @@
+# Single-pass to_dict / to_json (yaylib._serialize): the output of every
+# generated model is identical to what the generated methods produce —
+# keys, order, explicit nulls and all.
+# Python-only transport behaviour — no parity tag.
+
+import contextlib
+import json
+
+import yaylib
+from yaylib import _decode, _lazy, _serialize
+from yaylib.models import ContactStatusResponse, Post, PostsResponse
+from yaylib.models.contact_status import ContactStatus
+from yaylib.models.realm_user import RealmUser
+
+_USER = {"id": 5, "nickname": "あ", "birth_date": None, "biography": None}
+_POST = {
+    "id": 11,
+    "text": "hi",
+    "attachment": None,
+    "user": _USER,
+    "likers": [_USER, dict(_USER, id=6)],
+    "in_reply_to_post": {"id": 10, "user": _USER},
+}
+_TIMELINE = {"posts": [_POST, dict(_POST, id=12)], "next_page_value": "12"}
+
+
+@contextlib.contextmanager
+def _generated_methods():
+    installed = {cls: cls.__dict__["to_dict"] for cls in _serialize._generated}
+    for cls, fn in _serialize._generated.items():
+        setattr(cls, "to_dict", fn)
+    try:
+        yield
+    finally:
+        for cls, fn in installed.items():
+            setattr(cls, "to_dict", fn)
+
+
+def _assert_same_as_generated(model):
+    fast = model.to_dict()
+    fast_json = model.to_json()
+    with _generated_methods():
+        expected = model.to_dict()
+    assert list(fast) == list(expected)
+    assert fast == expected
+    assert fast_json == json.dumps(expected)
+
+
+def test_installed_on_generated_models():
+    # Installed on every class in yaylib.models at package import.
+    assert Post.__dict__["to_dict"] is _serialize.to_dict
+    assert Post.__dict__["to_json"] is _serialize.to_json
+    assert _serialize.generated_to_dict(Post) is not _serialize.to_dict
+    assert RealmUser.__dict__["to_dict"] is _serialize.to_dict
+    assert ContactStatus.__dict__["to_dict"] is _serialize.to_dict
+    assert yaylib.ContactStatus is ContactStatus
+
+
+def test_matches_generated_output():
+    _assert_same_as_generated(PostsResponse.from_dict(_TIMELINE))
+    # Decoded straight from bytes (every field marked set).
+    decoder = _decode.json_validator("PostsResponse")
+    assert decoder is not None
+    _assert_same_as_generated(decoder(json.dumps(_TIMELINE).encode()))
+    # Built by hand: only the passed fields are set, so unset nullable
+    # fields get no explicit null.
+    post = Post(id=1, attachment=None, user=RealmUser(id=2, biography=None))
+    _assert_same_as_generated(post)
+    assert post.to_dict() == {
+        "id": 1, "user": {"id": 2, "biography": None}, "attachment": None,
+    }
+
+
+def test_none_items_of_nested_collections_are_dropped():
+    # Only unvalidated models (model_construct) can hold these.
+    post = Post.from_dict(_POST)
+    assert post is not None and post.likers is not None
+    post.__dict__["likers"] = [None, *post.likers, None]
+    _assert_same_as_generated(post)
+    assert [u["id"] for u in post.to_dict()["likers"]] == [5, 6]
+
+    contacts = ContactStatusResponse.model_construct(
+        contacts={"a": ContactStatus(status="x"), "b": None}
+    )
+    _assert_same_as_generated(contacts)
+    assert list(contacts.to_dict()["contacts"]) == ["a"]
+
+
+def test_lazy_models_serialize_like_eager_ones():
+    page = _lazy.decode(json.loads(json.dumps(_TIMELINE)), "PostsResponse")
+    eager = PostsResponse.from_dict(_TIMELINE)
+    assert eager is not None
+    assert page.to_json() == eager.to_json()
@@ -0,0 +1,214 @@
+# Streamed list responses (Client.stream_list / yaylib.streaming): the
+# items and the rest of the page match the buffered call in every
+# response mode, items come out before the body has ended, and error
+# statuses / bad items / broken bodies surface as APIError.
+# Python-only transport behaviour — no parity tag.
+
+import asyncio
+import contextlib
+import json
+
+import pytest
+from aiohttp import web
+
+import yaylib
+from yaylib.client import Client
+from yaylib.errors import APIError
+from yaylib.models.noreply_mode import NoreplyMode
+from yaylib.models.post import Post
+from yaylib.models.realm_user import RealmUser
+
+from ._server import serve
+
+_USER = {"id": 5, "nickname": "あ", "biography": None}
+_TIMELINE = {
+    "pinned_posts": [{"id": 99, "text": "pinned"}],
+    "posts": [{"id": i, "text": "x\"]}" * 10, "user": _USER} for i in range(50)],
+    "next_page_value": "50",
+}
+_FOLLOWERS = {
+    "users": [{"id": i, "nickname": f"u{i}"} for i in range(20)],
+    "next_page_value": "20",
+}
+
+
+def _handler(path, method, body):
+    if path.startswith("/v2/users/timestamp"):
+        return 200, json.dumps({"time": 0, "ip_address": "10.0.0.1"}), {}
+    if path.startswith("/v2/posts/timeline"):
+        return 200, json.dumps(_TIMELINE, ensure_ascii=False), {}
+    if path.startswith("/v3/users/7/followers"):
+        return 200, json.dumps(_FOLLOWERS), {}
+    if path.startswith("/v3/users/8/followers"):
+        return 200, json.dumps({"users": [{"id": 1}, {"id": "x"}]}), {}
+    if path.startswith("/v3/users/9/followers"):
+        return 200, '{"users": [{"id": 1}, {"id": 2', {}
+    return 404, json.dumps({"error_code": -5, "message": "not found"}), {}
+
+
+def _client(base_url, **kwargs):
+    client = Client(base_url=base_url, **kwargs)
+    client._client_ip = "127.0.0.1"
+    return client
+
+
+def _timeline(client):
+    return client.get_timeline(noreply_mode=NoreplyMode.EMPTY, number=50)
+
+
+async def test_items_and_page_match_the_buffered_call():
+    async with serve(_handler) as base_url:
+        client = _client(base_url)
+        try:
+            for mode in ("model", "lazy", "dict"):
+                with yaylib.call_options(response_mode=mode):
+                    page = await _timeline(client)
+                    async with client.stream_list(_timeline(client), "posts") as stream:
+                        items = [item async for item in stream]
+                if mode == "dict":
+                    assert items == page["posts"]
+                    assert stream.page == {
+                        k: v for k, v in page.items() if k != "posts"
+                    }
+                else:
+                    assert all(isinstance(item, Post) for item in items)
+                    assert [i.to_dict() for i in items] == [
+                        p.to_dict() for p in page.posts
+                    ]
+                    assert stream.page.posts is None
+                    assert stream.page.pinned_posts == page.pinned_posts
+                assert stream.next_page_value == "50"
+        finally:
+            await client.close()
+
+
+async def test_the_only_list_field_is_streamed_by_default():
+    async with serve(_handler) as base_url:
+        client = _client(base_url)
+        try:
+            stream = client.stream_list(client.get_user_followers(id=7))
+            users = [user async for user in stream]
+            assert stream.field == "users"
+            assert all(isinstance(user, RealmUser) for user in users)
+            assert [user.id for user in users] == list(range(20))
+            assert stream.next_page_value == "20"
+
+            with pytest.raises(ValueError, match="pinned_posts"):
+                async with client.stream_list(_timeline(client)):
+                    pass
+        finally:
+            await client.close()
+
+
+async def test_field_projection_applies_to_each_item():
+    async with serve(_handler) as base_url:
+        client = _client(base_url, response_mode="dict")
+        try:
+            with yaylib.call_options(fields={"posts": {"id"}, "next_page_value": True}):
+                stream = client.stream_list(_timeline(client), "posts")
+                items = [item async for item in stream]
+            assert items == [{"id": i} for i in range(50)]
+            assert stream.page == {"next_page_value": "50"}
+        finally:
+            await client.close()
+
+
+async def test_errors_surface_as_api_error():
+    async with serve(_handler) as base_url:
+        client = _client(base_url)
+        try:
+            with pytest.raises(APIError) as info:
+                async with client.stream_list(client.get_user_followers(id=6)):
+                    pass
+            assert info.value.status == 404
+
+            stream = client.stream_list(client.get_user_followers(id=8))
+            with pytest.raises(APIError) as info:
+                [user async for user in stream]
+            assert (info.value.status, info.value.body) == (200, '{"id": "x"}')
+
+            stream = client.stream_list(client.get_user_followers(id=9))
+            with pytest.raises(APIError) as info:
+                [user async for user in stream]
+            assert info.value.body == '{"id": 2'
+
+            with pytest.raises(TypeError):
+                async with client.stream_list(
+                    client.users_api.get_user_followers_without_preload_content(id=7)
+                ):
+                    pass
+        finally:
+            await client.close()
+
+
+async def test_a_401_is_refreshed_and_replayed_before_streaming():
+    def handler(path, method, body, headers):
+        if path == "/api/v1/oauth/token":
+            return 200, json.dumps(
+                {"access_token": "fresh", "refresh_token": "fresh-r", "user_id": 7}
+            ), {}
+        if headers.get("Authorization") != "Bearer fresh":
+            return 401, '{"error_code": -1}', {}
+        return _handler(path, method, body)
+
+    async with serve(handler) as base_url:
+        client = _client(base_url)
+        client.set_tokens("stale", "stale-r")
+        try:
+            stream = client.stream_list(client.get_user_followers(id=7))
+            assert len([user async for user in stream]) == 20
+            assert client.tokens.access == "fresh"
+        finally:
+            await client.close()
+
+
+@contextlib.asynccontextmanager
+async def _serve_in_two_parts(release: asyncio.Event):
+    body = json.dumps(_FOLLOWERS).encode()
+    half = body.index(b"{", len(body) // 2)
+
+    async def handler(request):
+        resp = web.StreamResponse(headers={"Content-Type": "application/json"})
+        await resp.prepare(request)
+        await resp.write(body[:half])
+        await release.wait()
+        await resp.write(body[half:])
+        await resp.write_eof()
+        return resp
+
+    app = web.Application()
+    app.router.add_route("*", "/{tail:.*}", handler)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]  # type: ignore[union-attr]
+    try:
+        yield f"http://127.0.0.1:{port}"
+    finally:
+        await runner.cleanup()
+
+
+async def test_items_come_out_before_the_body_ends():
+    release = asyncio.Event()
+    async with _serve_in_two_parts(release) as base_url:
+        client = _client(base_url)
+        try:
+            async with client.stream_list(client.get_user_followers(id=7)) as stream:
+                first = await asyncio.wait_for(stream.__anext__(), 5)
+                assert first.id == 0
+                assert stream.next_page_value is None
+                release.set()
+                rest = [user.id async for user in stream]
+            assert rest == list(range(1, 20))
+            assert stream.next_page_value == "20"
+
+            # Leaving early drops the connection; the client carries on.
+            release.clear()
+            async with client.stream_list(client.get_user_followers(id=7)) as stream:
+                await asyncio.wait_for(stream.__anext__(), 5)
+            release.set()
+            page = await client.get_user_followers(id=7)
+            assert len(page.users) == 20
+        finally:
+            await client.close()
@@ -0,0 +1,54 @@
+# Trusted-input mode: Client(validate_arguments=False) skips pydantic
+# @validate_call on generated operations; the default keeps it.
+# Python-only transport behaviour — no parity tag.
+
+import json
+from typing import Any
+
+import pytest
+from pydantic import ValidationError
+
+from yaylib.api.users_api import UsersApi
+from yaylib.client import Client
+
+from ._server import serve
+
+# The generated class seen untyped: @validate_call leaves __wrapped__ on
+# each operation, which its declared type does not know about.
+_USERS_API: Any = UsersApi
+
+
+def _handler(path, method, body):
+    return 200, json.dumps({"user": {"id": 7, "nickname": "n"}}), {}
+
+
+async def test_default_validates_arguments():
+    client = Client()
+    try:
+        assert client.validate_arguments
+        with pytest.raises(ValidationError):
+            await client.users_api.get_user(id="7")  # type: ignore[arg-type]
+    finally:
+        await client.close()
+
+
+async def test_trusted_mode_dispatches_unvalidated():
+    async with serve(_handler) as base_url:
+        client = Client(base_url=base_url, validate_arguments=False)
+        client._client_ip = "127.0.0.1"
+        try:
+            api: Any = client.users_api
+            assert api.get_user.__func__ is _USERS_API.get_user.__wrapped__
+            assert (
+                api.get_user_with_http_info.__func__
+                is _USERS_API.get_user_with_http_info.__wrapped__
+            )
+            res = await client.users_api.get_user(id=7)
+            assert res.user is not None and res.user.nickname == "n"
+            # Not re-validated: a str id is passed through to the path.
+            res = await client.get_user(id="7")
+            assert res.user.id == 7
+        finally:
+            await client.close()
+    # Other clients and the class itself keep validation.
+    assert _USERS_API.get_user is not _USERS_API.get_user.__wrapped__
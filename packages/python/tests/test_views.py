@@ -0,0 +1,72 @@
+# Read-only slotted views (yaylib.views) of Post, RealmUser,
+# RealmMessage and RealmChatRoom.
+# Python-only behaviour — no parity tag.
+
+import dataclasses
+import pickle
+
+import pytest
+
+from yaylib.models.post import Post
+from yaylib.models.realm_chat_room import RealmChatRoom
+from yaylib.models.realm_message import RealmMessage
+from yaylib.models.realm_user import RealmUser
+from yaylib.views import PostView, RealmChatRoomView, RealmMessageView, RealmUserView
+
+_USER = {"id": 5, "nickname": "a", "online_status": "offline", "connected_by": ["line"]}
+_POST = {
+    "id": 11,
+    "text": "hi",
+    "user": _USER,
+    "likers": [_USER, dict(_USER, id=6)],
+    "in_reply_to_post": {"id": 10, "user": _USER},
+    "group": {"id": 7, "title": "g"},
+    "message_tags": [{"type": "user", "user_id": 5}],
+}
+
+
+def test_views_mirror_model_fields():
+    for view, model in (
+        (PostView, Post),
+        (RealmUserView, RealmUser),
+        (RealmMessageView, RealmMessage),
+        (RealmChatRoomView, RealmChatRoom),
+    ):
+        assert view.__slots__ == tuple(model.model_fields)
+    assert not hasattr(PostView.from_dict(_POST), "__dict__")
+
+
+def test_from_dict_builds_nested_views():
+    view = PostView.from_dict(_POST)
+    assert (view.id, view.text, view.color) == (11, "hi", None)
+    assert isinstance(view.user, RealmUserView)
+    assert [u.id for u in view.likers] == [5, 6]
+    assert isinstance(view.likers, tuple)
+    assert view.in_reply_to_post.user.nickname == "a"
+    assert view.group == {"id": 7, "title": "g"}
+    assert view.message_tags == ({"type": "user", "user_id": 5},)
+    assert view.user.connected_by == ("line",)
+
+
+def test_round_trips_with_the_model():
+    model = Post.from_dict(_POST)
+    assert model is not None
+    view = PostView.from_dict(_POST)
+    assert view.to_model() == model
+    assert PostView.from_model(model) == view
+    room = {"id": 1, "members": [_USER], "owner": _USER, "last_message": {"id": 2}}
+    assert RealmChatRoomView.from_dict(room).to_model() == RealmChatRoom.from_dict(room)
+    message = {"id": 3, "text": "x", "message_type": "text", "gif": {"id": 1}}
+    assert RealmMessageView.from_dict(message).to_model() == RealmMessage.from_dict(message)
+
+
+def test_views_are_frozen_and_picklable():
+    view = PostView.from_dict(_POST)
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        view.text = "changed"
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        del view.text
+    assert pickle.loads(pickle.dumps(view)) == view
+    assert RealmUserView(id=5, nickname="a") == RealmUserView.from_dict({"id": 5, "nickname": "a"})
+    with pytest.raises(TypeError):
+        RealmUserView(nope=1)
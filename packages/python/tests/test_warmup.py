@@ -0,0 +1,50 @@
+# yaylib.warmup: completes the models left incomplete at import and
+# sets up the Client's decoders for the named response types.
+# Python-only behaviour — no parity tag.
+
+import subprocess
+import sys
+from typing import List
+
+import pytest
+
+import yaylib
+from yaylib import _decode
+
+
+def _run(code: str) -> List[str]:
+    return subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    ).stdout.split()
+
+
+def test_warmup_completes_models_left_incomplete_at_import():
+    out = _run(
+        "import yaylib\n"
+        "from yaylib.models import PostsResponse, ThreadInfo\n"
+        "print(PostsResponse.__pydantic_complete__, ThreadInfo.__pydantic_complete__)\n"
+        "yaylib.warmup(models=['ThreadInfo'])\n"
+        "print(ThreadInfo.__pydantic_complete__)"
+    )
+    assert out == ["True", "False", "True"]
+
+
+def test_warmup_sets_up_the_decoders():
+    yaylib.warmup(models=["PostsResponse", yaylib.UserResponse])
+    assert _decode._json_validators["PostsResponse"] is not None
+    assert _decode._python_validators["UserResponse"] is not None
+
+
+def test_warmed_models_decode_as_before():
+    yaylib.warmup(models=["PostsResponse"])
+    page = yaylib.PostsResponse.from_dict({"posts": [{"id": 1, "user": {"id": 2}}]})
+    assert page is not None and page.posts is not None
+    user = page.posts[0].user
+    assert user is not None and user.id == 2
+
+
+def test_warmup_rejects_non_models():
+    with pytest.raises(ValueError):
+        yaylib.warmup(models=["NoSuchModel"])
+    with pytest.raises(ValueError):
+        yaylib.warmup(models=["PostType"])  # an enum
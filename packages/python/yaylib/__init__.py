@@ -578,6 +578,29 @@ from yaylib.signing import (
     generate_x_jwt,
 )
 from yaylib.retry import RetryPolicy, DEFAULT_RETRY_POLICY
+from yaylib.connection import (
+    ConnectionOptions,
+    DEFAULT_CONNECTION_OPTIONS,
+    HttpCore,
+    PoolStats,
+)
+from yaylib.cache import CachePolicy, CacheStats, DEFAULT_CACHE_TTLS
+from yaylib.codec import JsonCodec, get_codec
+from yaylib.call_options import CallOptions, call_options, deadline
+from yaylib.breaker import CircuitBreakerPolicy
+from yaylib.hedging import HedgePolicy, HedgeStats
+from yaylib.limiter import AdaptiveConcurrency, LimiterStats
+from yaylib.metrics import MetricsRegistry, prometheus_text
+from yaylib.offload import DecodeOffloadPolicy
+from yaylib.streaming import ListStream
+from yaylib.pause import PauseStats
+from yaylib.views import (
+    PostView,
+    RealmChatRoomView,
+    RealmMessageView,
+    RealmUserView,
+)
+from yaylib._warmup import warmup
 from yaylib.upload import (
     Upload,
     UploadCategory,
@@ -604,3 +627,11 @@ from yaylib.event_stream import (
     Subscription,
     EventStream,
 )
+
+# Single-pass to_dict / to_json for every generated model.
+import yaylib.models as _models
+from yaylib._serialize import install as _install_serializer
+
+for _model in list(vars(_models).values()):
+    _install_serializer(_model)
+del _model
@@ -0,0 +1,160 @@
+# Typed decoding straight from the response body. The generated path
+# decodes a body three times over — text to dicts (json.loads), dicts
+# re-keyed by Model.from_dict, then model_validate — while pydantic-core
+# can parse and validate the JSON text (or UTF-8 bytes) in one pass:
+#
+#     Model.model_validate_json(body)
+#     TypeAdapter(List[Model]).validate_json(body)
+#
+# _WrappedApiClient.deserialize (client.py) uses this for JSON bodies of
+# model and List[model] responses, and falls back to the generated path
+# when it raises, so anything the old path accepted still decodes (and
+# anything it rejected still surfaces as an ApiException carrying the
+# raw body).
+#
+# A field projection (call_options(fields=...)) is applied to the parsed
+# JSON by ``project`` before any model is built; the pruned data is then
+# validated by the python-mode twin of the same validators.
+#
+# One difference is patched up: from_dict passes every field of every
+# model, so all of them count as set (to_dict emits explicit nulls for
+# nullable fields that were "set"); validate_json only marks keys that
+# were present. mark_all_fields_set restores the from_dict view.
+#
+# Hand-written; it relies on the generated models only through their
+# pydantic field tables.
+
+from __future__ import annotations
+
+import typing
+from typing import Any, Callable, Dict, FrozenSet, List, Optional, Tuple, Type
+
+from pydantic import BaseModel, TypeAdapter
+
+import yaylib.models
+
+Validator = Callable[[Any], Any]
+
+# response type string ("Post", "List[Walkthrough]") -> validator, or
+# None for types the fast path does not handle; JSON bytes / parsed JSON.
+_json_validators: Dict[str, Optional[Validator]] = {}
+_python_validators: Dict[str, Optional[Validator]] = {}
+# model class -> (all field names, fields that may hold nested models)
+_field_info: Dict[type, Tuple[FrozenSet[str], Tuple[str, ...]]] = {}
+
+
+def json_validator(response_type: str) -> Optional[Validator]:
+    """Bytes -> typed value validator for ``response_type``, or None
+    when the generated path has to handle it.
+    """
+    try:
+        return _json_validators[response_type]
+    except KeyError:
+        pass
+    validator = _json_validators[response_type] = _build(response_type, True)
+    return validator
+
+
+def python_validator(response_type: str) -> Optional[Validator]:
+    """Like json_validator, for already-parsed JSON (dicts / lists)."""
+    try:
+        return _python_validators[response_type]
+    except KeyError:
+        pass
+    validator = _python_validators[response_type] = _build(response_type, False)
+    return validator
+
+
+def project(data: Any, fields: Dict[str, Any]) -> Any:
+    """Keep only the keys named by the (normalized) projection
+    ``fields``; a projection applies to each item of a list.
+    """
+    if isinstance(data, list):
+        return [project(item, fields) for item in data]
+    if not isinstance(data, dict):
+        return data
+    out = {}
+    for key, sub in fields.items():
+        if key in data:
+            value = data[key]
+            out[key] = value if sub is None else project(value, sub)
+    return out
+
+
+def model_class(name: str) -> Optional[Type[BaseModel]]:
+    klass = getattr(yaylib.models, name, None)
+    if isinstance(klass, type) and issubclass(klass, BaseModel):
+        return klass
+    return None
+
+
+def _build(response_type: str, from_json: bool) -> Optional[Validator]:
+    if response_type.startswith("List[") and response_type.endswith("]"):
+        klass = model_class(response_type[5:-1])
+        if klass is None:
+            return None
+        adapter = TypeAdapter(List[klass])  # type: ignore[valid-type]
+        validate_items = adapter.validate_json if from_json else adapter.validate_python
+
+        def validate_list(body: Any) -> Any:
+            items = validate_items(body)
+            for item in items:
+                if item is not None:
+                    mark_all_fields_set(item)
+            return items
+
+        return validate_list
+
+    klass = model_class(response_type)
+    if klass is None:
+        return None
+
+    validate = klass.model_validate_json if from_json else klass.model_validate
+
+    def validate_model(body: Any) -> Any:
+        return mark_all_fields_set(validate(body))
+
+    return validate_model
+
+
+def mark_all_fields_set(model: BaseModel) -> BaseModel:
+    """Mark every field of ``model`` and of the models nested in it as
+    set, the way Model.from_dict leaves them.
+    """
+    all_fields, nested = _info(type(model))
+    object.__setattr__(model, "__pydantic_fields_set__", set(all_fields))
+    values = model.__dict__
+    for name in nested:
+        value = values.get(name)
+        if value is None:
+            continue
+        if isinstance(value, BaseModel):
+            mark_all_fields_set(value)
+        elif isinstance(value, list):
+            for item in value:
+                if isinstance(item, BaseModel):
+                    mark_all_fields_set(item)
+        elif isinstance(value, dict):
+            for item in value.values():
+                if isinstance(item, BaseModel):
+                    mark_all_fields_set(item)
+    return model
+
+
+def _info(cls: type) -> Tuple[FrozenSet[str], Tuple[str, ...]]:
+    info = _field_info.get(cls)
+    if info is None:
+        fields = cls.model_fields  # type: ignore[attr-defined]
+        info = _field_info[cls] = (
+            frozenset(fields),
+            tuple(n for n, f in fields.items() if _may_hold_model(f.annotation)),
+        )
+    return info
+
+
+def _may_hold_model(tp: Any) -> bool:
+    if isinstance(tp, type) and typing.get_origin(tp) is None:
+        return issubclass(tp, BaseModel)
+    if isinstance(tp, (str, typing.ForwardRef)):
+        return True  # unresolved reference: assume it may
+    return any(_may_hold_model(arg) for arg in typing.get_args(tp))
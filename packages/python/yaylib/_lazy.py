@@ -0,0 +1,330 @@
+# Lazy response models (response_mode="lazy"). A feed scanner that reads
+# post.id and post.text should not pay for the RealmUser, Group,
+# likers, mentions, videos, survey ... models of every post. In lazy
+# mode only a model's scalar fields are validated up front; fields that
+# hold models (or lists / dicts of them) keep their parsed JSON and are
+# decoded — lazily again, one level at a time — on first attribute
+# access:
+#
+#     with yaylib.call_options(response_mode="lazy"):
+#         page = await client.get_timeline(...)
+#     for post in page.posts:          # decodes the list: lazy Posts
+#         print(post.id, post.text)    # user / likers / ... stay JSON
+#
+# Lazy instances are per-class subclasses of the generated models
+# (isinstance(post, Post) holds, the class is named Post) with every
+# field counted as set, as Model.from_dict leaves them. Dumping
+# (model_dump / to_dict / to_json), comparing, copying, iterating and
+# pickling decode whatever is still pending first; a pickled lazy model
+# loads as the plain model class.
+#
+# Validation of a nested field happens on its first access, so a
+# malformed nested value raises there rather than at call time — still
+# as an ApiException (status 200, the offending JSON as its body), like
+# any other 2xx body that fails to decode.
+#
+# Hand-written; it relies on the generated models only through their
+# pydantic field tables.
+
+from __future__ import annotations
+
+import typing
+from typing import Any, Callable, Dict, FrozenSet, Optional, Tuple, Type
+
+from pydantic import BaseModel, PrivateAttr, TypeAdapter, ValidationError
+
+from yaylib._decode import mark_all_fields_set, model_class
+from yaylib.codec import default_codec
+from yaylib.exceptions import ApiException
+
+Decoder = Callable[[Any], Any]
+
+
+class _Plan:
+    __slots__ = ("base", "order", "all_fields", "scalars", "nested", "decoders")
+
+    def __init__(self, base: Type[BaseModel]) -> None:
+        self.base = base
+        fields = base.model_fields
+        self.order: Tuple[str, ...] = tuple(fields)
+        self.all_fields: FrozenSet[str] = frozenset(fields)
+        # JSON keys of the fields validated up front.
+        self.scalars: Tuple[str, ...] = ()
+        # (field name, JSON key) of the fields decoded on access.
+        self.nested: Tuple[Tuple[str, str], ...] = ()
+        self.decoders: Dict[str, Decoder] = {}
+        scalars = []
+        nested = []
+        for name, info in fields.items():
+            key = info.alias or name
+            decoder = _field_decoder(info.annotation)
+            if decoder is None:
+                scalars.append(key)
+            else:
+                nested.append((name, key))
+                self.decoders[name] = decoder
+        self.scalars = tuple(scalars)
+        self.nested = tuple(nested)
+
+
+# lazy class -> plan; base class -> lazy class
+_plans: Dict[type, _Plan] = {}
+_lazy_classes: Dict[type, Type[BaseModel]] = {}
+
+
+def _pending_of(model: BaseModel) -> Optional[Dict[str, Any]]:
+    private = object.__getattribute__(model, "__pydantic_private__")
+    return private.get("_pending") if private else None
+
+
+def _decode_field(model: BaseModel, name: str, raw: Any) -> Any:
+    try:
+        return _plans[type(model)].decoders[name](raw)
+    except ValidationError as exc:
+        raise ApiException(
+            status=200,
+            reason=f"invalid {type(model).__name__}.{name}",
+            body=default_codec().dumps_str(raw),
+        ) from exc
+
+
+class _LazyModel(BaseModel):
+    """Mixin of the lazy subclasses: decodes pending fields on access."""
+
+    _pending: Optional[Dict[str, Any]] = PrivateAttr(default=None)
+
+    if not typing.TYPE_CHECKING:
+        # Hidden from type checkers, like BaseModel's own __getattr__,
+        # so fields keep their declared types.
+        def __getattr__(self, name: str) -> Any:
+            pending = _pending_of(self)
+            if pending is not None and name in pending:
+                value = _decode_field(self, name, pending[name])
+                del pending[name]
+                self.__dict__[name] = value
+                if not pending:
+                    self._restore_order()
+                return value
+            return super().__getattr__(name)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        pending = _pending_of(self)
+        if pending:
+            pending.pop(name, None)
+        super().__setattr__(name, value)
+
+    def _materialize(self, deep: bool = False) -> None:
+        plan = _plans[type(self)]
+        pending = _pending_of(self)
+        values = self.__dict__
+        if pending:
+            for name, raw in list(pending.items()):
+                values[name] = _decode_field(self, name, raw)
+                del pending[name]
+            values = self._restore_order()
+        if deep:
+            for name, _ in plan.nested:
+                _materialize_value(values.get(name))
+
+    def _restore_order(self) -> Dict[str, Any]:
+        # Decoded fields were appended; repr, iteration and to_dict
+        # follow __dict__ order, which must match an eager model's.
+        values = self.__dict__
+        ordered = {n: values[n] for n in _plans[type(self)].order if n in values}
+        object.__setattr__(self, "__dict__", ordered)
+        return ordered
+
+    def model_dump(self, **kwargs: Any) -> Dict[str, Any]:
+        self._materialize(deep=True)
+        return super().model_dump(**kwargs)
+
+    def model_dump_json(self, **kwargs: Any) -> str:
+        self._materialize(deep=True)
+        return super().model_dump_json(**kwargs)
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, BaseModel):
+            return NotImplemented
+        self._materialize()
+        if isinstance(other, _LazyModel):
+            other._materialize()
+        return (
+            _plans[type(self)].base is _base_of(type(other))
+            and self.__dict__ == other.__dict__
+            and self.__pydantic_extra__ == other.__pydantic_extra__
+        )
+
+    def __iter__(self):
+        self._materialize()
+        return super().__iter__()
+
+    def __repr_args__(self):
+        self._materialize()
+        return super().__repr_args__()
+
+    def __copy__(self):
+        self._materialize()
+        return super().__copy__()
+
+    def __deepcopy__(self, memo=None):
+        self._materialize()
+        return super().__deepcopy__(memo)
+
+    def __reduce__(self):
+        self._materialize()
+        state = self.__getstate__()
+        state["__pydantic_private__"] = None
+        return _restore, (_plans[type(self)].base, state)
+
+
+def _restore(cls: Type[BaseModel], state: Dict[str, Any]) -> BaseModel:
+    model = cls.__new__(cls)
+    model.__setstate__(state)
+    return model
+
+
+def _base_of(cls: type) -> type:
+    plan = _plans.get(cls)
+    return plan.base if plan is not None else cls
+
+
+def _materialize_value(value: Any) -> None:
+    if isinstance(value, _LazyModel):
+        value._materialize(deep=True)
+    elif isinstance(value, list):
+        for item in value:
+            _materialize_value(item)
+    elif isinstance(value, dict):
+        for item in value.values():
+            _materialize_value(item)
+
+
+def lazy_class(base: Type[BaseModel]) -> Type[BaseModel]:
+    cls = _lazy_classes.get(base)
+    if cls is None:
+        # The models' own metaclass (pydantic's), so the subclass is
+        # a full model class.
+        meta: Any = type(base)
+        cls = meta(
+            base.__name__,
+            (_LazyModel, base),
+            {
+                "__module__": base.__module__,
+                "__qualname__": base.__qualname__,
+                "__doc__": base.__doc__,
+            },
+        )
+        _plans[cls] = _Plan(base)
+        _lazy_classes[base] = cls
+    return cls
+
+
+def build(base: Type[BaseModel], raw: Any) -> Any:
+    """A lazy ``base`` from its parsed JSON object."""
+    if not isinstance(raw, dict):
+        # None or a wrong shape: fail (or pass) exactly as eagerly.
+        return base.model_validate(raw)
+    cls = lazy_class(base)
+    plan = _plans[cls]
+    model = cls.model_validate({k: raw[k] for k in plan.scalars if k in raw})
+    values = model.__dict__
+    pending = {}
+    for name, key in plan.nested:
+        value = raw.get(key)
+        if value is not None:
+            del values[name]
+            pending[name] = value
+    object.__setattr__(model, "__pydantic_fields_set__", set(plan.all_fields))
+    private = model.__pydantic_private__
+    assert private is not None  # _LazyModel declares _pending
+    private["_pending"] = pending
+    return model
+
+
+def _response_model(response_type: str) -> Tuple[Optional[Type[BaseModel]], bool]:
+    if response_type.startswith("List[") and response_type.endswith("]"):
+        return model_class(response_type[5:-1]), True
+    return model_class(response_type), False
+
+
+def decode(data: Any, response_type: str) -> Any:
+    """Lazily decode the parsed JSON ``data`` of a model or
+    List[model] ``response_type`` response.
+    """
+    klass, many = _response_model(response_type)
+    if klass is None:
+        raise ValueError(f"yaylib: {response_type!r} is not a model response")
+    if many:
+        return [build(klass, item) for item in data]
+    return build(klass, data)
+
+
+def _field_decoder(annotation: Any) -> Optional[Decoder]:
+    """How to decode a field on access, or None for fields validated up
+    front (no model inside).
+    """
+    if not _holds_model(annotation):
+        return None
+    tp = _strip_optional(annotation)
+    klass = _as_model(tp)
+    if klass is not None:
+        return lambda raw: build(klass, raw)
+    origin = typing.get_origin(tp)
+    args = typing.get_args(tp)
+    item = _as_model(args[0]) if origin is list and args else None
+    if item is not None:
+        return lambda raw: (
+            [build(item, v) for v in raw] if isinstance(raw, list)
+            else _eager(annotation, raw)
+        )
+    value = _as_model(args[1]) if origin is dict and len(args) == 2 else None
+    if value is not None:
+        return lambda raw: (
+            {k: build(value, v) for k, v in raw.items()} if isinstance(raw, dict)
+            else _eager(annotation, raw)
+        )
+    return lambda raw: _eager(annotation, raw)
+
+
+_adapters: Dict[Any, TypeAdapter[Any]] = {}
+
+
+def _eager(annotation: Any, raw: Any) -> Any:
+    adapter = _adapters.get(annotation)
+    if adapter is None:
+        adapter = _adapters[annotation] = TypeAdapter(annotation)
+    value = adapter.validate_python(raw)
+    _mark(value)
+    return value
+
+
+def _mark(value: Any) -> None:
+    if isinstance(value, BaseModel):
+        mark_all_fields_set(value)
+    elif isinstance(value, (list, tuple)):
+        for item in value:
+            _mark(item)
+    elif isinstance(value, dict):
+        for item in value.values():
+            _mark(item)
+
+
+def _strip_optional(tp: Any) -> Any:
+    if typing.get_origin(tp) is typing.Union:
+        args = [a for a in typing.get_args(tp) if a is not type(None)]
+        if len(args) == 1:
+            return args[0]
+    return tp
+
+
+def _as_model(tp: Any) -> Optional[Type[BaseModel]]:
+    if isinstance(tp, type) and typing.get_origin(tp) is None:
+        if issubclass(tp, BaseModel):
+            return tp
+    return None
+
+
+def _holds_model(tp: Any) -> bool:
+    if _as_model(tp) is not None:
+        return True
+    return any(_holds_model(arg) for arg in typing.get_args(tp))
@@ -0,0 +1,253 @@
+# Hand-maintained: keep in step with the operationIds in the OpenAPI
+# spec when operations are added, renamed or removed.
+# tests/test_response_cache.py checks it against the generated
+# operations' _*_serialize methods.
+#
+# Maps an upper-cased "METHOD path-template" to its operation id.
+# Path parameters keep their OpenAPI {placeholder} form; the transport
+# matches concrete request paths against these templates to label and
+# configure requests per operation rather than per raw path.
+OPERATIONS: dict[str, str] = {
+    "DELETE /v1/chat_rooms/{id}/pinned": "unpin_chat_room",
+    "DELETE /v1/chat_rooms/{room_id}/messages/{message_id}/delete": "delete_chat_message",
+    "DELETE /v1/group_mute/{id}/unmute/{user_id}": "unmute_group_user",
+    "DELETE /v1/groups/{group_id}/highlights/{post_id}": "unpin_group_highlight_post",
+    "DELETE /v1/groups/{id}/deputize": "remove_group_deputies",
+    "DELETE /v1/groups/{id}/leave": "leave_group",
+    "DELETE /v1/groups/{id}/related": "remove_related_groups",
+    "DELETE /v1/groups/{id}/transfer": "cancel_group_transfer",
+    "DELETE /v1/hidden/chats": "unhide_chats",
+    "DELETE /v1/hidden/users": "unhide_users",
+    "DELETE /v1/hidden/words": "delete_mute_keyword",
+    "DELETE /v1/pinned/groups/{id}": "unpin_group",
+    "DELETE /v1/pinned/reviews/{id}": "unpin_review",
+    "DELETE /v1/threads/{id}": "delete_thread",
+    "DELETE /v1/threads/{thread_id}/members/{id}": "remove_thread_member",
+    "DELETE /v1/users/reviews": "delete_my_reviews",
+    "DELETE /v1/users/{user_id}/bookmarks/{id}": "delete_bookmark",
+    "DELETE /v2/chat_rooms/{id}/background": "remove_chat_room_background",
+    "DELETE /v2/posts/group_pinned_post": "unpin_group_post",
+    "DELETE /v2/users/{user_id}/footprints/{footprint_id}": "delete_footprint",
+    "DELETE /v3/groups/{id}/cover": "remove_group_cover",
+    "DELETE /v3/groups/{id}/icon": "remove_group_icon",
+    "GET /api/apps/{app}": "get_app_config",
+    "GET /api/user_activities": "get_user_activities_v1",
+    "GET /api/v2/user_activities": "get_user_activities",
+    "GET /v1/buckets/presigned_urls": "get_bucket_presigned_urls",
+    "GET /v1/calls/bgm": "get_call_bgms",
+    "GET /v1/calls/phone_status/{opponent_id}": "get_phone_status",
+    "GET /v1/calls/{call_id}/gift_transactions": "get_call_gift_history",
+    "GET /v1/calls/{call_id}/users/invitable": "get_invitable_call_users",
+    "GET /v1/chat_rooms/main_list": "get_main_chat_rooms",
+    "GET /v1/chat_rooms/request_list": "get_chat_requests",
+    "GET /v1/chat_rooms/total_chat_request": "get_chat_request_count",
+    "GET /v1/chat_rooms/unread_status": "get_chat_unread_status",
+    "GET /v1/games/apps": "list_game_apps",
+    "GET /v1/games/apps/{app_id}/walkthroughs": "list_game_walkthroughs",
+    "GET /v1/genres": "list_genres",
+    "GET /v1/group_mute/{id}/muted_users": "list_muted_group_users",
+    "GET /v1/groups/categories": "list_group_categories",
+    "GET /v1/groups/created_quota": "get_group_create_quota",
+    "GET /v1/groups/joined_statuses": "get_joined_group_statuses",
+    "GET /v1/groups/unread_status": "get_group_unread_status",
+    "GET /v1/groups/user_group_list": "get_user_group_list",
+    "GET /v1/groups/{group_id}/gift_history": "get_group_gift_history",
+    "GET /v1/groups/{group_id}/gift_transactions": "get_group_gift_transactions",
+    "GET /v1/groups/{group_id}/highlights": "get_group_highlights",
+    "GET /v1/groups/{group_id}/received_gifts/{gift_id}/senders": (
+        "get_group_received_gift_senders"
+    ),
+    "GET /v1/groups/{group_id}/users/invitable": "get_invitable_group_users",
+    "GET /v1/groups/{id}": "get_group",
+    "GET /v1/groups/{id}/ban_list": "get_group_ban_list",
+    "GET /v1/groups/{id}/members/{userId}": "get_group_member",
+    "GET /v1/groups/{id}/relatable": "get_relatable_groups",
+    "GET /v1/groups/{id}/related": "get_related_groups",
+    "GET /v1/hidden/chats": "list_hidden_chats",
+    "GET /v1/hidden/users": "list_hidden_users",
+    "GET /v1/hidden/words": "list_mute_keywords",
+    "GET /v1/posts/active_call": "get_active_call_post",
+    "GET /v1/posts/{id}/likers": "get_post_likers",
+    "GET /v1/posts/{post_id}/gift_transactions": "get_post_gift_transactions",
+    "GET /v1/received_gifts": "list_received_gifts_v1",
+    "GET /v1/received_gifts/{gift_id}/senders": "get_received_gift_senders",
+    "GET /v1/received_gifts/{gift_transaction_uuid}": "get_received_gift_transaction",
+    "GET /v1/threads": "list_threads",
+    "GET /v1/threads/joined_statuses": "get_joined_thread_statuses",
+    "GET /v1/threads/{id}": "get_thread",
+    "GET /v1/threads/{id}/posts": "get_thread_posts",
+    "GET /v1/users/active_followings": "get_active_followings",
+    "GET /v1/users/additonal_notification_setting": "get_additional_notification_setting",
+    "GET /v1/users/block_ids": "get_blocked_user_ids",
+    "GET /v1/users/custom_definitions": "get_user_custom_definitions",
+    "GET /v1/users/default_settings": "get_default_settings",
+    "GET /v1/users/following_born_today": "get_followings_born_today",
+    "GET /v1/users/interests": "get_user_interests",
+    "GET /v1/users/list_id": "get_users_by_ids",
+    "GET /v1/users/policy_agreements": "get_policy_agreements",
+    "GET /v1/users/presigned_url": "get_user_presigned_url",
+    "GET /v1/users/qr_codes/{qr}": "get_user_by_qr",
+    "GET /v1/users/reset_counters": "get_reset_counters",
+    "GET /v1/users/reviews/mine": "get_my_reviews",
+    "GET /v1/users/search": "search_users",
+    "GET /v1/users/secret": "get_two_factor_auth_request_info",
+    "GET /v1/users/secret/status": "get_two_factor_auth_status",
+    "GET /v1/users/ws_token": "get_web_socket_token",
+    "GET /v1/users/{id}/follow_recommended": "get_recommended_follow_users",
+    "GET /v1/users/{user_id}/bookmarks": "get_bookmarked_posts",
+    "GET /v1/users/{user_id}/gift_transactions": "get_user_gift_transactions",
+    "GET /v2/calls/action_signature/validate": "validate_call_action_signature",
+    "GET /v2/calls/conferences/{call_id}": "get_conference_call",
+    "GET /v2/chat_rooms/update": "get_updated_chat_rooms",
+    "GET /v2/chat_rooms/{id}": "get_chat_room",
+    "GET /v2/chat_rooms/{id}/messages": "get_chat_messages",
+    "GET /v2/conversations/root_posts": "get_root_posts",
+    "GET /v2/conversations/{id}": "get_conversation",
+    "GET /v2/gifts": "list_gifts",
+    "GET /v2/groups": "list_groups",
+    "GET /v2/groups/mine": "list_my_groups",
+    "GET /v2/groups/{id}/members": "get_group_members",
+    "GET /v2/groups/{id}/posts/search": "search_group_posts",
+    "GET /v2/notification_settings/groups/{id}": "get_group_notification_settings",
+    "GET /v2/posts/call_followers_timeline": "get_call_followers_timeline",
+    "GET /v2/posts/call_timeline": "get_call_timeline",
+    "GET /v2/posts/following_timeline": "get_following_timeline",
+    "GET /v2/posts/group_timeline": "get_group_timeline",
+    "GET /v2/posts/mine": "get_my_posts",
+    "GET /v2/posts/multiple": "get_posts_by_ids",
+    "GET /v2/posts/recent_engagement": "get_recent_engagement_posts",
+    "GET /v2/posts/recommended_timeline": "get_recommended_timeline",
+    "GET /v2/posts/search": "search_posts",
+    "GET /v2/posts/tags/{tag}": "get_posts_by_tag",
+    "GET /v2/posts/url_metadata": "get_post_url_metadata",
+    "GET /v2/posts/user_timeline": "get_user_timeline",
+    "GET /v2/posts/{id}": "get_post",
+    "GET /v2/posts/{id}/reposts": "get_post_reposts",
+    "GET /v2/posts/{noreply_mode}timeline": "get_timeline",
+    "GET /v2/received_gifts": "list_received_gifts",
+    "GET /v2/sticker_packs": "list_sticker_packs",
+    "GET /v2/users/follow_requests": "get_follow_requests",
+    "GET /v2/users/follow_requests_count": "get_follow_request_count",
+    "GET /v2/users/fresh/{id}": "get_fresh_user",
+    "GET /v2/users/hima_users": "get_hima_users",
+    "GET /v2/users/info/{id}": "get_user_info",
+    "GET /v2/users/reviews/{id}": "get_user_reviews",
+    "GET /v2/users/timestamp": "get_user_timestamp",
+    "GET /v2/users/{id}": "get_user",
+    "GET /v3/calls/{call_id}/agora_rtm_token": "get_agora_rtm_token",
+    "GET /v3/users/footprints": "get_footprints",
+    "GET /v3/users/{id}/followers": "get_user_followers",
+    "GET /v3/users/{id}/followings": "get_user_followings",
+    "GET /{countryApiValue}/api/apps/{app}/popular_words": "get_popular_words",
+    "GET /{countryApiValue}/api/v2/banned_words": "get_banned_words",
+    "POST /api/v1/oauth/token": "oauth_token",
+    "POST /v1/calls/action_signature/generate": "generate_call_action_signature",
+    "POST /v1/calls/conference_calls/{call_id}/invite": "invite_to_conference_call",
+    "POST /v1/calls/leave_agora_channel": "leave_agora_channel",
+    "POST /v1/calls/leave_conference_call": "leave_conference_call",
+    "POST /v1/calls/{call_id}/bulk_invite": "bulk_invite_to_call",
+    "POST /v1/calls/{call_id}/bump": "bump_call",
+    "POST /v1/chat_rooms/accept_chat_request": "accept_chat_request",
+    "POST /v1/chat_rooms/mass_destroy": "delete_chat_rooms",
+    "POST /v1/chat_rooms/new": "create_chat_room_v1",
+    "POST /v1/chat_rooms/{id}/attachments_read": "read_chat_attachments",
+    "POST /v1/chat_rooms/{id}/pinned": "pin_chat_room",
+    "POST /v1/chat_rooms/{id}/videos_read": "read_chat_videos",
+    "POST /v1/email_verification_urls": "request_email_verification",
+    "POST /v1/group_mute/{id}/mute/{user_id}": "mute_group_user",
+    "POST /v1/groups/{group_id}/fire/{user_id}": "fire_group_user",
+    "POST /v1/groups/{id}/accept/{userId}": "accept_group_join_request",
+    "POST /v1/groups/{id}/ban/{userId}": "ban_group_user",
+    "POST /v1/groups/{id}/decline/{userId}": "decline_group_join_request",
+    "POST /v1/groups/{id}/invite": "invite_to_group",
+    "POST /v1/groups/{id}/join": "join_group",
+    "POST /v1/groups/{id}/request_walkthrough": "request_group_walkthrough",
+    "POST /v1/groups/{id}/set_title": "set_group_title",
+    "POST /v1/groups/{id}/take_over": "take_over_group",
+    "POST /v1/groups/{id}/unban/{userId}": "unban_group_user",
+    "POST /v1/groups/{id}/visit": "visit_group",
+    "POST /v1/hidden/chats": "hide_chats",
+    "POST /v1/hidden/users": "hide_users",
+    "POST /v1/hidden/words": "create_mute_keyword",
+    "POST /v1/pinned/groups": "pin_group",
+    "POST /v1/pinned/posts": "pin_post",
+    "POST /v1/pinned/reviews": "pin_review",
+    "POST /v1/posts/delete_all_post": "delete_all_posts",
+    "POST /v1/posts/recommended_tag": "get_recommended_post_tags",
+    "POST /v1/posts/validate": "validate_post",
+    "POST /v1/posts/videos/{videoId}/view": "view_post_video",
+    "POST /v1/posts/{id}/unlike": "unlike_post",
+    "POST /v1/threads": "create_thread",
+    "POST /v1/threads/{id}/posts": "create_thread_post",
+    "POST /v1/threads/{thread_id}/members/{id}": "add_thread_member",
+    "POST /v1/users/additonal_notification_setting": "update_additional_notification_setting",
+    "POST /v1/users/alive": "ping_alive",
+    "POST /v1/users/followings/chatable": "get_chatable_followings",
+    "POST /v1/users/hima": "set_hima",
+    "POST /v1/users/logout": "logout",
+    "POST /v1/users/policy_agreements/{type}": "agree_policy",
+    "POST /v1/users/reset_counters": "reset_counters",
+    "POST /v1/users/reviews": "create_review",
+    "POST /v1/users/{id}/block": "block_user",
+    "POST /v2/calls/invite": "invite_to_call",
+    "POST /v2/calls/start_conference_call": "start_conference_call",
+    "POST /v2/chat_rooms/{id}/invite": "invite_to_chat_room",
+    "POST /v2/chat_rooms/{id}/kick": "kick_from_chat_room",
+    "POST /v2/chat_rooms/{id}/messages/{message_id}/read": "read_chat_message",
+    "POST /v2/notification_settings/chat_rooms/{id}": "update_chat_room_notification_settings",
+    "POST /v2/notification_settings/groups/{id}": "update_group_notification_settings",
+    "POST /v2/posts/like": "like_posts",
+    "POST /v2/posts/mass_destroy": "delete_posts",
+    "POST /v2/posts/new_conference_call": "create_conference_call_post",
+    "POST /v2/posts/new_share_post": "create_share_post",
+    "POST /v2/surveys/{id}/vote": "vote_survey",
+    "POST /v2/users/blocked": "get_blocked_users",
+    "POST /v2/users/edit": "edit_user_v2",
+    "POST /v2/users/follow": "follow_users",
+    "POST /v2/users/remove_cover_image": "remove_cover_image",
+    "POST /v2/users/remove_profile_photo": "remove_profile_photo",
+    "POST /v2/users/resend_confirm_email": "resend_confirm_email",
+    "POST /v2/users/reviews/{id}": "reply_to_review",
+    "POST /v2/users/{id}/follow": "follow_user",
+    "POST /v2/users/{id}/unblock": "unblock_user",
+    "POST /v2/users/{id}/unfollow": "unfollow_user",
+    "POST /v2/users/{target_id}/follow_request": "request_follow",
+    "POST /v3/calls/conference_calls/{call_id}/kick": "kick_from_conference_call",
+    "POST /v3/chat_rooms/new": "create_chat_room",
+    "POST /v3/chat_rooms/{chat_room_id}/report": "report_chat_room",
+    "POST /v3/chat_rooms/{id}/edit": "update_chat_room",
+    "POST /v3/chat_rooms/{id}/messages/new": "send_chat_message",
+    "POST /v3/groups/new": "create_group",
+    "POST /v3/groups/{group_id}/deputize/mass": "deputize_group_users_mass",
+    "POST /v3/groups/{group_id}/report": "report_group",
+    "POST /v3/groups/{id}/transfer": "transfer_group",
+    "POST /v3/groups/{id}/update": "update_group",
+    "POST /v3/posts/new": "create_post",
+    "POST /v3/posts/repost": "repost",
+    "POST /v3/posts/{id}/move_to_thread": "move_post_to_thread",
+    "POST /v3/posts/{post_id}/report": "report_post",
+    "POST /v3/users/edit": "edit_user",
+    "POST /v3/users/login_update": "update_login",
+    "POST /v3/users/login_with_email": "login_with_email",
+    "POST /v3/users/{user_id}/report": "report_user",
+    "PUT /v1/calls/{call_id}": "update_call",
+    "PUT /v1/calls/{call_id}/users/{user_id}": "update_call_user",
+    "PUT /v1/groups/{group_id}/deputize/{user_id}/withdraw": "withdraw_group_deputy",
+    "PUT /v1/groups/{group_id}/highlights/{post_id}": "pin_group_highlight_post",
+    "PUT /v1/groups/{id}/deputize": "deputize_group_users",
+    "PUT /v1/groups/{id}/related": "update_related_groups",
+    "PUT /v1/groups/{id}/transfer": "accept_group_transfer",
+    "PUT /v1/groups/{id}/transfer/withdraw": "withdraw_group_transfer",
+    "PUT /v1/threads/{id}": "update_thread",
+    "PUT /v1/users/change_email": "change_email",
+    "PUT /v1/users/change_password": "change_password",
+    "PUT /v1/users/interests": "update_user_interests",
+    "PUT /v1/users/language": "update_language",
+    "PUT /v1/users/reset_password": "reset_password",
+    "PUT /v1/users/secret/disable": "disable_two_factor_auth",
+    "PUT /v1/users/secret/enable": "enable_two_factor_auth",
+    "PUT /v1/users/{user_id}/bookmarks/{id}": "create_bookmark",
+    "PUT /v2/posts/group_pinned_post": "pin_group_post",
+    "PUT /v3/posts/{id}": "update_post",
+    "PUT /v3/posts/{id}/move_to_thread/{thread_id}": "move_post_to_specific_thread",
+}
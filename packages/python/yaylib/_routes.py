@@ -0,0 +1,107 @@
+# Request-path -> operation lookup. Policies that are configured per
+# operation (response-cache TTLs, and anything else keyed the same way)
+# are written as "METHOD path-template" — the same spelling as the
+# HOST_ROUTES / OPERATIONS tables — while the transport only
+# sees concrete URLs (``/v2/users/123``). RouteTable bridges the two.
+#
+# The operation table it consumes lives in _operations.py.
+
+from __future__ import annotations
+
+import re
+from typing import Dict, Generic, List, Mapping, Optional, Pattern, Tuple, TypeVar
+
+from yaylib._operations import OPERATIONS
+
+V = TypeVar("V")
+
+_PLACEHOLDER = re.compile(r"\{[^}/]+\}")
+
+
+def _compile(template: str) -> Pattern[str]:
+    # A path parameter matches within one segment and may be empty
+    # (NoreplyMode.EMPTY renders "/v2/posts/{noreply_mode}timeline" as
+    # "/v2/posts/timeline").
+    out = []
+    pos = 0
+    for m in _PLACEHOLDER.finditer(template):
+        out.append(re.escape(template[pos:m.start()]))
+        out.append("[^/]*")
+        pos = m.end()
+    out.append(re.escape(template[pos:]))
+    return re.compile("".join(out) + r"\Z")
+
+
+def _split_key(key: str) -> Tuple[str, str]:
+    method, sep, path = key.partition(" ")
+    if not sep or not path.startswith("/"):
+        raise ValueError(
+            f'yaylib: route key must be "METHOD /path", got {key!r}'
+        )
+    return method.upper(), path
+
+
+class RouteTable(Generic[V]):
+    """Maps "METHOD path-template" keys to values and resolves concrete
+    request paths against them. Literal keys are an O(1) dict hit; a
+    templated path falls back to the compiled patterns of the same
+    method and segment count, most literal template first so
+    ``/v1/users/search`` never loses to ``/v1/users/{id}``.
+    """
+
+    def __init__(self, entries: Mapping[str, V]) -> None:
+        self._exact: Dict[str, V] = {}
+        patterns: List[Tuple[int, str, int, Pattern[str], V]] = []
+        for key, value in entries.items():
+            method, path = _split_key(key)
+            if _PLACEHOLDER.search(path) is None:
+                self._exact[f"{method} {path}"] = value
+            else:
+                literal = len(_PLACEHOLDER.sub("", path))
+                patterns.append(
+                    (literal, method, path.count("/"), _compile(path), value)
+                )
+        patterns.sort(key=lambda p: -p[0])
+        # A placeholder never spans a "/", so only templates with the
+        # request's segment count can match it.
+        self._patterns: Dict[Tuple[str, int], List[Tuple[Pattern[str], V]]] = {}
+        for _, method, segments, rx, value in patterns:
+            self._patterns.setdefault((method, segments), []).append((rx, value))
+
+    def __bool__(self) -> bool:
+        return bool(self._exact or self._patterns)
+
+    def lookup(self, method: str, path: str) -> Optional[V]:
+        method = method.upper()
+        hit = self._exact.get(f"{method} {path}")
+        if hit is not None:
+            return hit
+        for rx, value in self._patterns.get((method, path.count("/")), ()):
+            if rx.match(path):
+                return value
+        return None
+
+
+def require_known_operation(key: str) -> str:
+    """Normalize ``key`` and reject one that names no generated
+    operation — a typo in a policy table would otherwise silently
+    never match.
+    """
+    method, path = _split_key(key)
+    norm = f"{method} {path}"
+    if norm not in OPERATIONS:
+        raise ValueError(f"yaylib: no operation matches {key!r}")
+    return norm
+
+
+_operations: Optional[RouteTable[str]] = None
+
+
+def operation_of(method: str, path: str) -> Optional[str]:
+    """The generated operation id (``get_user``) serving ``method`` +
+    ``path``, or None for a path no operation declares.
+    """
+    global _operations
+    if _operations is None:
+        _operations = RouteTable(OPERATIONS)
+    return _operations.lookup(method, path)
@@ -0,0 +1,209 @@
+# Single-pass to_dict / to_json for the generated models. The generated
+# to_dict serializes a model with model_dump(exclude_none=True) — which
+# already serializes every nested model — then calls to_dict() again on
+# each nested model and list item (serializing that subtree once more,
+# at every level), and adds explicit nulls for the nullable fields that
+# were set. A Post with a user, likers and mentions is serialized three
+# or four times over.
+#
+# Here pydantic-core serializes the whole tree once; the result is then
+# walked along the model only where the generated code differs from
+# plain model_dump:
+#
+#   * nullable fields that are None but were set get an explicit null,
+#     appended after the other keys, as the generated code does;
+#   * None items of lists (and values of dicts) of models are dropped.
+#
+# Output is identical to the generated methods — same keys, same order,
+# same values; to_json still goes through json.dumps for byte-identical
+# text. install() puts both on a generated model class (and the model
+# classes nested in it); yaylib calls it for every class in
+# yaylib.models at import. The generated functions are kept
+# (generated_to_dict) and are the source of the per-class nullable field
+# list: a model with every field set to None, passed through the
+# generated to_dict, yields exactly the explicit nulls it emits.
+#
+# Hand-written; it relies on the generated models only through their
+# pydantic field tables and their generated to_dict.
+
+from __future__ import annotations
+
+import json
+import typing
+from typing import Any, Callable, Dict, Optional, Tuple, Type
+
+from pydantic import BaseModel
+
+# How a field holding models is serialized.
+_MODEL, _LIST, _DICT = 0, 1, 2
+
+ToDict = Callable[[BaseModel], Dict[str, Any]]
+
+
+class _Plan:
+    __slots__ = ("size", "nested", "nulls")
+
+    def __init__(
+        self,
+        size: int,
+        nested: Tuple[Tuple[str, str, int], ...],
+        nulls: Tuple[Tuple[str, str], ...],
+    ) -> None:
+        # number of fields
+        self.size = size
+        # (field name, JSON key, kind) of fields holding models
+        self.nested = nested
+        # (field name, JSON key) of nullable fields, in emitting order
+        self.nulls = nulls
+
+
+# generated model class -> its generated to_dict
+_generated: Dict[Type[BaseModel], ToDict] = {}
+# model class (lazy subclasses included) -> plan
+_plans: Dict[type, _Plan] = {}
+
+
+def to_dict(model: BaseModel) -> Dict[str, Any]:
+    """``model.to_dict()`` of a generated model, in one serialization."""
+    out = model.model_dump(by_alias=True, exclude_none=True)
+    _fix(model, out)
+    return out
+
+
+def to_json(model: BaseModel) -> str:
+    """``model.to_json()`` of a generated model."""
+    return json.dumps(to_dict(model))
+
+
+def generated_to_dict(cls: type) -> Optional[ToDict]:
+    """The generated to_dict of ``cls`` (or of its generated base)."""
+    base = _generated_base(cls)
+    return _generated[base] if base is not None else None
+
+
+def install(obj: Any) -> None:
+    """Replace to_dict / to_json of the generated model class ``obj``,
+    and of the model classes nested in its fields, with the single-pass
+    ones; anything else is ignored. yaylib calls this for each name in
+    yaylib.models.
+    """
+    if (
+        isinstance(obj, type)
+        and issubclass(obj, BaseModel)
+        and obj not in _generated
+        and "to_dict" in obj.__dict__
+    ):
+        _generated[obj] = obj.__dict__["to_dict"]
+        setattr(obj, "to_dict", to_dict)
+        setattr(obj, "to_json", to_json)
+        for info in obj.model_fields.values():
+            nested = _nested_model(info.annotation)
+            if nested is not None:
+                install(nested)
+
+
+def _generated_base(cls: type) -> Optional[Type[BaseModel]]:
+    for klass in cls.__mro__:
+        if klass in _generated:
+            return klass
+    # A generated model imported straight from its module (not through
+    # yaylib.models) and reached while serializing another one.
+    for klass in cls.__mro__:
+        install(klass)
+        if klass in _generated:
+            return klass
+    return None
+
+
+def _fix(model: BaseModel, out: Dict[str, Any]) -> None:
+    cls = type(model)
+    plan = _plans.get(cls)
+    if plan is None:
+        plan = _plans[cls] = _plan(cls)
+    values = model.__dict__
+    for name, key, kind in plan.nested:
+        value = values.get(name)
+        if not value:
+            continue
+        dumped = out[key]
+        if kind == _MODEL:
+            _fix(value, dumped)
+        elif kind == _LIST:
+            items = []
+            for item, item_out in zip(value, dumped):
+                if item:
+                    _fix(item, item_out)
+                    items.append(item_out)
+            out[key] = items
+        else:
+            entries = {}
+            for k, item in value.items():
+                if item:
+                    item_out = dumped[k]
+                    _fix(item, item_out)
+                    entries[k] = item_out
+            out[key] = entries
+    if plan.nulls:
+        fields_set = model.__pydantic_fields_set__
+        if len(fields_set) == plan.size:
+            # All set, as from_dict and the response decoders leave them.
+            for name, key in plan.nulls:
+                if values[name] is None:
+                    out[key] = None
+        else:
+            for name, key in plan.nulls:
+                if name in fields_set and values[name] is None:
+                    out[key] = None
+
+
+def _plan(cls: Type[BaseModel]) -> _Plan:
+    base = _generated_base(cls)
+    if base is None:
+        raise TypeError(f"{cls.__name__} is not a generated yaylib model")
+    fields = base.model_fields
+    nested = []
+    for name, info in fields.items():
+        kind = _kind(info.annotation)
+        if kind is not None:
+            nested.append((name, info.alias or name, kind))
+    # Every field None and set: the generated to_dict emits exactly the
+    # explicit nulls, in its order.
+    probe = base.model_construct(**{name: None for name in fields})
+    names = {info.alias or name: name for name, info in fields.items()}
+    nulls = tuple((names[key], key) for key in _generated[base](probe))
+    return _Plan(len(fields), tuple(nested), nulls)
+
+
+def _kind(annotation: Any) -> Optional[int]:
+    kind, _ = _classify(annotation)
+    return kind
+
+
+def _nested_model(annotation: Any) -> Optional[type]:
+    _, model = _classify(annotation)
+    return model
+
+
+def _classify(annotation: Any) -> Tuple[Optional[int], Optional[type]]:
+    tp = annotation
+    if typing.get_origin(tp) is typing.Union:
+        args = [a for a in typing.get_args(tp) if a is not type(None)]
+        if len(args) == 1:
+            tp = args[0]
+    if _is_model(tp):
+        return _MODEL, tp
+    origin = typing.get_origin(tp)
+    params = typing.get_args(tp)
+    if origin is list and len(params) == 1 and _is_model(params[0]):
+        return _LIST, params[0]
+    if origin is dict and len(params) == 2 and _is_model(params[1]):
+        return _DICT, params[1]
+    return None, None
+
+
+def _is_model(tp: Any) -> bool:
+    return (
+        isinstance(tp, type)
+        and typing.get_origin(tp) is None
+        and issubclass(tp, BaseModel)
+    )
@@ -0,0 +1,202 @@
+# Compiled request templates. Every generated operation builds its
+# request through ApiClient.param_serialize with the same path template
+# on every call, and the generic implementation re-derives everything
+# from scratch each time: it merges the default headers, runs
+# sanitize_for_serialization and parameters_to_tuples over every
+# parameter collection, and rescans the path once per placeholder. The
+# Client's ApiClient instead compiles each path template once into a
+# PathTemplate (literal chunks and placeholder names) and per call only
+# fills in the values (``serialize``); accept / content-type selection
+# is computed once per media-type list.
+#
+# The output is exactly ApiClient.param_serialize's. Requests using what
+# the fill-in does not cover — files, auth settings, collection formats
+# on path or header parameters, default headers or a cookie on the
+# ApiClient — go through the generic param_serialize unchanged.
+#
+# Hand-written; it relies on the generated code only through the
+# param_serialize signature.
+
+from __future__ import annotations
+
+import json
+import re
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+from urllib.parse import quote
+
+# Values sanitize_for_serialization returns unchanged (exact types: an
+# Enum member or a SecretStr is converted).
+_PLAIN = frozenset((str, int, float, bool))
+
+_PLACEHOLDER = re.compile(r"\{([^}]*)\}")
+
+Sanitize = Callable[[Any], Any]
+
+
+class PathTemplate:
+    """A resource path split into literal chunks and placeholders:
+    ``chunks[0] + value(names[0]) + chunks[1] + ...``.
+    """
+
+    __slots__ = ("path", "chunks", "names")
+
+    def __init__(self, path: str) -> None:
+        parts = _PLACEHOLDER.split(path)
+        self.path = path
+        self.chunks: Tuple[str, ...] = tuple(parts[0::2])
+        self.names: Tuple[str, ...] = tuple(parts[1::2])
+
+    def fill(
+        self, path_params: Optional[Dict[str, Any]], safe: str, sanitize: Sanitize
+    ) -> str:
+        if not self.names or not path_params:
+            return self.path
+        chunks = self.chunks
+        out = [chunks[0]]
+        for i, name in enumerate(self.names):
+            if name in path_params:
+                value = path_params[name]
+                if type(value) not in _PLAIN:
+                    value = sanitize(value)
+                out.append(quote(str(value), safe=safe))
+            else:
+                # Unfilled, as the generic path leaves it.
+                out.append("{" + name + "}")
+            out.append(chunks[i + 1])
+        return "".join(out)
+
+
+_templates: Dict[str, PathTemplate] = {}
+_media_types: Dict[Tuple[str, ...], Optional[str]] = {}
+
+
+def path_template(path: str) -> PathTemplate:
+    template = _templates.get(path)
+    if template is None:
+        template = _templates[path] = PathTemplate(path)
+    return template
+
+
+def select_media_type(types: Sequence[str]) -> Optional[str]:
+    """ApiClient.select_header_accept / select_header_content_type:
+    the first JSON type, else the first one; computed once per list.
+    """
+    key = tuple(types)
+    try:
+        return _media_types[key]
+    except KeyError:
+        pass
+    selected = None
+    if key:
+        selected = next((t for t in key if re.search("json", t, re.IGNORECASE)), key[0])
+    _media_types[key] = selected
+    return selected
+
+
+# parameters_to_tuples / parameters_to_url_query: collection format ->
+# delimiter ("multi" repeats the key instead; anything else is csv).
+_DELIMITERS = {"ssv": " ", "tsv": "\t", "pipes": "|"}
+
+
+def form_params(
+    params: List[Tuple[str, Any]], formats: Dict[str, str], sanitize: Sanitize
+) -> List[Tuple[str, Any]]:
+    """ApiClient.parameters_to_tuples of the sanitized ``params``."""
+    out: List[Tuple[str, Any]] = []
+    for key, value in params:
+        if type(value) not in _PLAIN:
+            value = sanitize(value)
+        fmt = formats.get(key) if formats else None
+        if fmt is None:
+            out.append((key, value))
+        elif fmt == "multi":
+            out.extend((key, item) for item in value)
+        else:
+            out.append((key, _DELIMITERS.get(fmt, ",").join(str(item) for item in value)))
+    return out
+
+
+def query_string(
+    params: List[Tuple[str, Any]], formats: Dict[str, str], sanitize: Sanitize
+) -> str:
+    """ApiClient.parameters_to_url_query of the sanitized ``params``."""
+    out = []
+    for key, value in params:
+        if type(value) not in _PLAIN:
+            value = sanitize(value)
+        # already URL-safe: no quote() needed
+        safe = False
+        if isinstance(value, bool):
+            value = "true" if value else "false"
+            safe = True
+        elif type(value) is int:
+            value = str(value)
+            safe = True
+        elif isinstance(value, (int, float)):
+            value = str(value)
+        elif isinstance(value, dict):
+            value = json.dumps(value)
+        fmt = formats.get(key) if formats else None
+        if fmt is None:
+            out.append(f"{key}={value if safe else quote(str(value))}")
+        elif fmt == "multi":
+            out.extend(f"{key}={item}" for item in value)
+        else:
+            joined = _DELIMITERS.get(fmt, ",").join(quote(str(item)) for item in value)
+            out.append(f"{key}={joined}")
+    return "&".join(out)
+
+
+def serialize(
+    api_client: Any,
+    method: str,
+    resource_path: str,
+    path_params: Optional[Dict[str, Any]],
+    query_params: Optional[List[Tuple[str, Any]]],
+    header_params: Optional[Dict[str, Any]],
+    body: Any,
+    post_params: Optional[List[Tuple[str, Any]]],
+    collection_formats: Optional[Dict[str, str]],
+    _host: Optional[str],
+) -> Optional[Tuple[str, str, Dict[str, Any], Any, Any]]:
+    """ApiClient.param_serialize for a request without files or auth
+    settings, on an ApiClient without default headers or cookie; None
+    when a path or header parameter has a collection format (the
+    generic path handles those).
+    """
+    formats = collection_formats or {}
+    if formats and (
+        any(k in formats for k in path_params or ())
+        or any(k in formats for k in header_params or ())
+    ):
+        return None
+    sanitize = api_client.sanitize_for_serialization
+    config = api_client.configuration
+
+    header_params = header_params or {}
+    for value in header_params.values():
+        if type(value) not in _PLAIN:
+            header_params = {
+                k: v if type(v) in _PLAIN else sanitize(v)
+                for k, v in header_params.items()
+            }
+            break
+
+    path = path_template(resource_path).fill(
+        path_params, config.safe_chars_for_path_param, sanitize
+    )
+
+    if post_params:
+        post_params = form_params(post_params, formats, sanitize)
+
+    if body:
+        body = sanitize(body)
+
+    if _host is None or config.ignore_operation_servers:
+        url = config.host + path
+    else:
+        url = _host + path
+    if query_params:
+        url += "?" + query_string(query_params, formats, sanitize)
+
+    return method, url, header_params, body, post_params
@@ -0,0 +1,51 @@
+# Schema warm-up. The generated models build their pydantic-core
+# validators and serializers when their modules are imported, except a
+# model whose forward references cannot be resolved at that point (a
+# cycle such as ThreadInfo -> Post -> ThreadInfo): it is left incomplete
+# and builds on first use, in the middle of a request. The Client's
+# fast-path decoders (yaylib._decode) are likewise set up per response
+# type on first use. warmup() does both up front, off the critical path:
+#
+#     threading.Thread(
+#         target=yaylib.warmup,
+#         kwargs={"models": ["PostsResponse", "UserResponse"]},
+#         daemon=True,
+#     ).start()
+#
+# Building is thread-safe (pydantic serializes it under a lock), and an
+# already built model is skipped.
+#
+# Deferring the builds done at import (pydantic's defer_build) is a
+# model_config option of the generated classes; it has to come from the
+# generator's model template, which is not part of this tree.
+#
+# Hand-written; it relies on the generated models only through
+# yaylib.models and pydantic's model_rebuild.
+
+from __future__ import annotations
+
+from typing import Iterable, Optional, Type, Union
+
+from pydantic import BaseModel
+
+import yaylib.models
+from yaylib import _decode
+from yaylib._decode import model_class
+
+
+def warmup(models: Optional[Iterable[Union[str, Type[BaseModel]]]] = None) -> None:
+    """Build the schemas of ``models`` — yaylib.models names or classes;
+    every generated model when None — and the Client's decoders for
+    them now, rather than on first use. Raises ValueError for a name
+    that is not a model in yaylib.models.
+    """
+    if models is None:
+        models = [n for n in vars(yaylib.models) if model_class(n) is not None]
+    for model in models:
+        klass = model_class(model) if isinstance(model, str) else model
+        if not (isinstance(klass, type) and issubclass(klass, BaseModel)):
+            raise ValueError(f"{model!r} is not a model in yaylib.models")
+        klass.model_rebuild()
+        if model_class(klass.__name__) is klass:
+            _decode.json_validator(klass.__name__)
+            _decode.python_validator(klass.__name__)
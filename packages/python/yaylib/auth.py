@@ -9,6 +9,7 @@ from __future__ import annotations
 
 from typing import Optional
 
+from yaylib.call_options import internal_call_options
 from yaylib.errors import as_api_error
 from yaylib.models.login_email_user_request import LoginEmailUserRequest
 from yaylib.models.login_user_response import LoginUserResponse
@@ -97,9 +98,10 @@ async def _execute_login(
     )
 
     try:
-        resp = await client.users_api.login_with_email(
-            login_email_user_request=body
-        )
+        with internal_call_options():
+            resp = await client.users_api.login_with_email(
+                login_email_user_request=body
+            )
     except Exception as err:  # noqa: BLE001
         raise as_api_error(err)
 
@@ -0,0 +1,90 @@
+# Per-host circuit breakers. Retries help with a blip; against a host
+# that is down they only tie up sockets and coroutines for the full
+# backoff schedule. A breaker counts consecutive failures per host
+# (primary API, cassandra, the presigned-upload host, ...):
+#
+#   closed    — sends pass; ``failure_threshold`` consecutive transport
+#               errors / 5xx open the circuit.
+#   open      — sends fail at once with ApiException(status=0) until
+#               ``open_duration`` has elapsed.
+#   half_open — up to ``half_open_probes`` sends go through; a success
+#               closes the circuit, a failure re-opens it.
+#
+# A 429 is not a host failure (the server answered, deliberately) and
+# does not count; a 5xx is one exactly when retries treat it as one
+# (yaylib.retry.is_server_error). Breakers live on the HttpCore, so Clients sharing a
+# core share host health. Opt-in via Client(circuit_breaker=...) or
+# HttpCore(circuit_breaker=...).
+#
+# Durations are in SECONDS.
+
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+@dataclass(frozen=True)
+class CircuitBreakerPolicy:
+    # Consecutive failures that open the circuit. Default: 5.
+    failure_threshold: int = 5
+    # How long an open circuit rejects sends before probing. Default: 10s.
+    open_duration: float = 10.0
+    # Concurrent probe sends allowed while half-open. Default: 1.
+    half_open_probes: int = 1
+
+
+class CircuitBreaker:
+    """The breaker of one host. ``allow`` before a send; then exactly
+    one of ``record_success`` / ``record_failure`` / ``record_abandoned``.
+    """
+
+    __slots__ = ("_policy", "state", "_failures", "_opened_at", "_probes")
+
+    def __init__(self, policy: CircuitBreakerPolicy) -> None:
+        self._policy = policy
+        self.state = CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probes = 0
+
+    def allow(self) -> bool:
+        if self.state == CLOSED:
+            return True
+        if self.state == OPEN:
+            if time.monotonic() - self._opened_at < self._policy.open_duration:
+                return False
+            self.state = HALF_OPEN
+            self._probes = 0
+        if self._probes >= self._policy.half_open_probes:
+            return False
+        self._probes += 1
+        return True
+
+    def record_success(self) -> None:
+        self._failures = 0
+        if self.state == HALF_OPEN:
+            self.state = CLOSED
+
+    def record_failure(self) -> None:
+        if self.state == HALF_OPEN:
+            self._open()
+            return
+        self._failures += 1
+        if self.state == CLOSED and self._failures >= self._policy.failure_threshold:
+            self._open()
+
+    def record_abandoned(self) -> None:
+        # The send was cancelled before an outcome (a hedge loser, a
+        # deadline): no verdict, but hand back a half-open probe slot.
+        if self.state == HALF_OPEN and self._probes > 0:
+            self._probes -= 1
+
+    def _open(self) -> None:
+        self.state = OPEN
+        self._opened_at = time.monotonic()
+        self._failures = 0
@@ -0,0 +1,123 @@
+# Opt-in response cache for safe GET operations whose payloads change
+# rarely (app config, gift / sticker catalogues, genres, ...). It sits
+# inside Transport.request, so a hit skips the network, the 401 refresh
+# and the retry loop, yet still hands a BufferedResponse to the
+# generated ``response_deserialize`` — a cached call returns exactly the
+# typed result a network call would.
+#
+# Entries are keyed by the final URL (after host routing), the Bearer
+# identity and the request headers, so two accounts sharing a process
+# never see each other's bodies. Only 2xx responses are stored. The
+# store is an LRU bounded by body bytes; TTLs are per operation.
+#
+# TTLs are in SECONDS, like RetryPolicy.
+
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Dict, Mapping, Optional, Tuple
+
+from yaylib._routes import RouteTable, require_known_operation
+
+if TYPE_CHECKING:
+    from yaylib.transport import BufferedResponse
+
+# (url, bearer, sorted request headers) — see Transport._get_key.
+CacheKey = Tuple[Any, ...]
+
+# Rarely-changing catalogue / config reads. Keys are "METHOD
+# path-template" exactly as in the OPERATIONS table (_operations.py).
+DEFAULT_CACHE_TTLS: Mapping[str, float] = {
+    "GET /api/apps/{app}": 300.0,  # get_app_config
+    "GET /v2/gifts": 300.0,  # list_gifts
+    "GET /v2/sticker_packs": 300.0,  # list_sticker_packs
+    "GET /v1/genres": 300.0,  # list_genres
+    "GET /{countryApiValue}/api/v2/banned_words": 300.0,  # get_banned_words
+    "GET /v1/groups/categories": 300.0,  # list_group_categories
+}
+
+
+@dataclass(frozen=True)
+class CachePolicy:
+    # "METHOD path-template" -> TTL seconds. Only GET operations may be
+    # listed; an unknown template raises ValueError at Client build.
+    ttls: Mapping[str, float] = field(
+        default_factory=lambda: dict(DEFAULT_CACHE_TTLS)
+    )
+    # Upper bound on the summed body bytes held. Least recently used
+    # entries are evicted first; a body larger than this is not cached.
+    max_bytes: int = 8 * 1024 * 1024
+
+
+@dataclass(frozen=True)
+class CacheStats:
+    hits: int
+    misses: int
+    entries: int
+    bytes: int
+
+
+class ResponseCache:
+    def __init__(self, policy: CachePolicy) -> None:
+        ttls: Dict[str, float] = {}
+        for key, ttl in policy.ttls.items():
+            norm = require_known_operation(key)
+            if not norm.startswith("GET "):
+                raise ValueError(f"yaylib: only GET operations are cacheable, got {key!r}")
+            if ttl > 0:
+                ttls[norm] = float(ttl)
+        self._ttls = RouteTable(ttls)
+        self._max_bytes = policy.max_bytes
+        # key -> (expires_at, size, response)
+        self._entries: "OrderedDict[CacheKey, Tuple[float, int, BufferedResponse]]" = OrderedDict()
+        self._bytes = 0
+        self._hits = 0
+        self._misses = 0
+
+    def ttl_for(self, path: str) -> Optional[float]:
+        return self._ttls.lookup("GET", path)
+
+    def get(self, key: CacheKey) -> Optional[BufferedResponse]:
+        entry = self._entries.get(key)
+        if entry is None:
+            self._misses += 1
+            return None
+        expires_at, size, resp = entry
+        if time.monotonic() >= expires_at:
+            self._evict(key, size)
+            self._misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self._hits += 1
+        return resp
+
+    def put(self, key: CacheKey, resp: BufferedResponse, ttl: float) -> None:
+        size = len(resp.data or b"")
+        old = self._entries.pop(key, None)
+        if old is not None:
+            self._bytes -= old[1]
+        if size > self._max_bytes:
+            return
+        self._entries[key] = (time.monotonic() + ttl, size, resp)
+        self._bytes += size
+        while self._bytes > self._max_bytes and self._entries:
+            oldest, (_, osize, _) = next(iter(self._entries.items()))
+            self._evict(oldest, osize)
+
+    def _evict(self, key: CacheKey, size: int) -> None:
+        del self._entries[key]
+        self._bytes -= size
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._bytes = 0
+
+    def stats(self) -> CacheStats:
+        return CacheStats(
+            hits=self._hits,
+            misses=self._misses,
+            entries=len(self._entries),
+            bytes=self._bytes,
+        )
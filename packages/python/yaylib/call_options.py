@@ -0,0 +1,157 @@
+# Per-call knobs for the hand-written transport layer. The generated
+# operation signatures are fixed (and validated by pydantic), so a
+# per-call option cannot ride in as an extra keyword argument; it is
+# carried by a context variable instead and read by the transport of
+# whichever Client serves the call:
+#
+#     with yaylib.call_options(bypass_cache=True):
+#         cfg = await client.get_app_config(app="yay")
+#
+#     with yaylib.deadline(5.0):
+#         await client.get_timeline(...)   # retries + refresh included
+#
+#     with yaylib.call_options(response_mode="dict"):
+#         page = await client.get_timeline(...)   # plain parsed JSON
+#
+#     with yaylib.call_options(fields={"posts": {"id": True, "user": {"id"}}}):
+#         page = await client.get_timeline(...)   # only those decoded
+#
+# Context variables follow the awaiting task (and are copied into
+# tasks spawned under them), so options never leak between concurrent
+# callers. Nested blocks override only the fields they name.
+
+from __future__ import annotations
+
+import contextlib
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass, replace
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+# What a generated operation returns for a JSON body: "model" — the
+# typed pydantic model (the default); "dict" — the parsed JSON as plain
+# dicts / lists, skipping model construction entirely; "lazy" — the
+# typed model with nested models decoded on first access (yaylib._lazy).
+# Status handling, the 2xx type fallback and error surfacing are the
+# same in all of them.
+RESPONSE_MODES: Tuple[str, ...] = ("model", "dict", "lazy")
+
+
+def check_response_mode(mode: str) -> str:
+    if mode not in RESPONSE_MODES:
+        raise ValueError(
+            f"yaylib: response_mode must be one of {RESPONSE_MODES}, got {mode!r}"
+        )
+    return mode
+
+
+@dataclass(frozen=True)
+class CallOptions:
+    # Skip the response cache lookup and go to the network. A fresh 2xx
+    # still refreshes the cached entry.
+    bypass_cache: bool = False
+    # Absolute time.monotonic() by which the whole call — every send,
+    # backoff sleep, pause-gate wait and 401 refresh — must finish.
+    # Past it the call raises ApiException(status=0, reason="deadline
+    # exceeded"); a backoff that would end past it is not slept, the
+    # response / error it would have retried surfaces instead. None
+    # means unbounded (each send still has its own timeout).
+    deadline: Optional[float] = None
+    # Overrides the Client's response_mode (see RESPONSE_MODES) for the
+    # calls in the block. None keeps the Client's.
+    response_mode: Optional[str] = None
+    # Field projection for model responses: only the named JSON keys
+    # are decoded, everything else is dropped before any model is built
+    # (and reads as None). A set / list names the kept keys; a dict maps
+    # each kept key to True (keep it whole) or to the projection of its
+    # value. A projection applies to each item of a list value:
+    #
+    #     {"posts": {"id": True, "text": True, "user": {"id", "nickname"}}}
+    #
+    # Keys are the JSON keys, i.e. the model's field aliases. Works in
+    # every response_mode; None decodes everything.
+    fields: Optional[Any] = None
+
+    def __post_init__(self) -> None:
+        if self.response_mode is not None:
+            check_response_mode(self.response_mode)
+        if self.fields is not None:
+            object.__setattr__(self, "fields", normalize_fields(self.fields))
+
+
+Projection = Dict[str, Optional["Projection"]]
+
+
+def normalize_fields(spec: Any) -> Projection:
+    """A ``fields`` projection as {key: None (keep whole) | projection}.
+    Raises TypeError for anything that is not a set / list / tuple of
+    keys or a dict of key -> True / projection.
+    """
+    if isinstance(spec, dict):
+        out: Projection = {}
+        for key, sub in spec.items():
+            if not isinstance(key, str):
+                raise TypeError(f"yaylib: fields keys must be str, got {key!r}")
+            keep_whole = sub is True or sub is None or sub is Ellipsis
+            out[key] = None if keep_whole else normalize_fields(sub)
+        return out
+    if isinstance(spec, (set, frozenset, list, tuple)):
+        return normalize_fields(dict.fromkeys(spec, True))
+    raise TypeError(
+        "yaylib: fields must be a set of keys or a dict of key -> True / "
+        f"projection, got {spec!r}"
+    )
+
+
+_DEFAULT = CallOptions()
+
+_current: ContextVar[CallOptions] = ContextVar(
+    "yaylib_call_options", default=_DEFAULT
+)
+
+
+def current_call_options() -> CallOptions:
+    return _current.get()
+
+
+@contextlib.contextmanager
+def call_options(**overrides) -> Iterator[CallOptions]:
+    """Apply ``overrides`` (CallOptions fields) to every SDK call made
+    inside the block. Unknown names raise TypeError.
+    """
+    opts = replace(_current.get(), **overrides)
+    token = _current.set(opts)
+    try:
+        yield opts
+    finally:
+        _current.reset(token)
+
+
+@contextlib.contextmanager
+def internal_call_options(*, keep_deadline: bool = True) -> Iterator[CallOptions]:
+    """For the SDK's own calls that read the typed model (login, upload
+    URLs, the X-Client-IP fetch...): fresh default options with
+    response_mode="model", so a caller's projection, dict mode or cache
+    bypass cannot reach them. The caller's deadline is kept unless
+    ``keep_deadline`` is False (background work not bound to the call).
+    """
+    at = _current.get().deadline if keep_deadline else None
+    opts = CallOptions(response_mode="model", deadline=at)
+    token = _current.set(opts)
+    try:
+        yield opts
+    finally:
+        _current.reset(token)
+
+
+@contextlib.contextmanager
+def deadline(seconds: float) -> Iterator[CallOptions]:
+    """Bound every SDK call made inside the block to finish within
+    ``seconds`` from now. An enclosing, earlier deadline is kept.
+    """
+    at = time.monotonic() + seconds
+    outer = _current.get().deadline
+    if outer is not None and outer < at:
+        at = outer
+    with call_options(deadline=at) as opts:
+        yield opts
@@ -4,49 +4,47 @@
 # ApiClient so the headers / refresh / retry transport is applied
 # uniformly. A flat promotion layer (PORTING.md §2) is generated in a
 # later step — for now the per-service handles are the stable surface,
-# matching the TypeScript port's ``client.usersAPI`` form.
+# matching the TypeScript port's ``client.usersAPI`` form. Each handle
+# is built on first access (_ApiHandle), so Client() sets up only the
+# services something uses.
 
 from __future__ import annotations
 
 import asyncio
 import contextlib
-import json
+import contextvars
+import functools
+import importlib
 import logging
+import re
+import time
 import uuid as _uuid
-from typing import List, Optional
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Generic,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+    cast,
+)
 
+import yaylib.offload as _offload
 import yaylib.upload as _upload
 import yaylib.signing as _signing
-from yaylib.models.signature_payload import SignaturePayload
-from urllib.parse import urlencode
-
-from yaylib.api.activities_api import ActivitiesApi
-from yaylib.api.apps_api import AppsApi
-from yaylib.api.auth_api import AuthApi
-from yaylib.api.buckets_api import BucketsApi
-from yaylib.api.calls_api import CallsApi
-from yaylib.api.chat_rooms_api import ChatRoomsApi
-from yaylib.api.conversations_api import ConversationsApi
-from yaylib.api.email_verification_urls_api import EmailVerificationUrlsApi
-from yaylib.api.games_api import GamesApi
-from yaylib.api.genres_api import GenresApi
-from yaylib.api.gifts_api import GiftsApi
-from yaylib.api.group_mute_api import GroupMuteApi
-from yaylib.api.groups_api import GroupsApi
-from yaylib.api.hidden_api import HiddenApi
-from yaylib.api.moderation_api import ModerationApi
-from yaylib.api.notification_settings_api import NotificationSettingsApi
-from yaylib.api.pinned_api import PinnedApi
-from yaylib.api.posts_api import PostsApi
-from yaylib.api.received_gifts_api import ReceivedGiftsApi
-from yaylib.api.sticker_packs_api import StickerPacksApi
-from yaylib.api.surveys_api import SurveysApi
-from yaylib.api.threads_api import ThreadsApi
-from yaylib.api.users_api import UsersApi
+from urllib.parse import urlencode, urlsplit
+
 from yaylib.api_client import ApiClient
 from yaylib.configuration import Configuration
 from yaylib.exceptions import ApiException
 from yaylib._facade import GeneratedFacade
+from yaylib import _decode, _lazy, _template
+from yaylib._routes import operation_of
 
 from yaylib._config import (
     DEFAULT_ACCEPT_LANGUAGE,
@@ -67,10 +65,62 @@ from yaylib._config import (
     build_device_info,
     build_user_agent,
 )
+from yaylib.cache import CachePolicy, CacheStats, ResponseCache
+from yaylib.call_options import (
+    check_response_mode,
+    current_call_options,
+    internal_call_options,
+)
+from yaylib.codec import JsonCodec, JsonInput, default_codec, get_codec
+from yaylib.connection import ConnectionOptions, HttpCore, PoolStats
+from yaylib.breaker import CircuitBreakerPolicy
+from yaylib.hedging import HedgePolicy, HedgeStats
+from yaylib.limiter import AdaptiveConcurrency, LimiterStats
+from yaylib.offload import DecodeOffloadPolicy
+from yaylib.metrics import (
+    CallMetrics,
+    MetricsRegistry,
+    bind_call_metrics,
+    unbind_call_metrics,
+)
+from yaylib.pause import PauseStats
 from yaylib.retry import DEFAULT_RETRY_POLICY, RetryPolicy
 from yaylib.session import Session, SessionStore
 from yaylib.tokens import Tokens, empty_tokens
-from yaylib.transport import Transport, TransportContext
+from yaylib.streaming import ListStream, StreamOpened
+from yaylib.transport import (
+    BufferedResponse,
+    StreamedResponse,
+    Transport,
+    TransportContext,
+)
+
+if TYPE_CHECKING:
+    from yaylib.api.activities_api import ActivitiesApi
+    from yaylib.api.apps_api import AppsApi
+    from yaylib.api.auth_api import AuthApi
+    from yaylib.api.buckets_api import BucketsApi
+    from yaylib.api.calls_api import CallsApi
+    from yaylib.api.chat_rooms_api import ChatRoomsApi
+    from yaylib.api.conversations_api import ConversationsApi
+    from yaylib.api.email_verification_urls_api import EmailVerificationUrlsApi
+    from yaylib.api.games_api import GamesApi
+    from yaylib.api.genres_api import GenresApi
+    from yaylib.api.gifts_api import GiftsApi
+    from yaylib.api.group_mute_api import GroupMuteApi
+    from yaylib.api.groups_api import GroupsApi
+    from yaylib.api.hidden_api import HiddenApi
+    from yaylib.api.moderation_api import ModerationApi
+    from yaylib.api.notification_settings_api import NotificationSettingsApi
+    from yaylib.api.pinned_api import PinnedApi
+    from yaylib.api.posts_api import PostsApi
+    from yaylib.api.received_gifts_api import ReceivedGiftsApi
+    from yaylib.api.sticker_packs_api import StickerPacksApi
+    from yaylib.api.surveys_api import SurveysApi
+    from yaylib.api.threads_api import ThreadsApi
+    from yaylib.api.users_api import UsersApi
+    from yaylib.models.signature_payload import SignaturePayload
+
 
 def _default_logger() -> logging.Logger:
     """The silent default. PORTING.md §12.2: the SDK is a library — with
@@ -94,6 +144,76 @@ def new_uuid_v4() -> str:
     return str(_uuid.uuid4())
 
 
+def _skip_argument_validation(api) -> None:
+    """Shadow every ``@validate_call`` operation of a generated API
+    handle with its undecorated function, bound to the handle: calls go
+    straight to the ``_*_serialize`` builder without pydantic
+    re-validating each argument. Arguments must then already have the
+    annotated types (enum members, model instances, ints for ints).
+    """
+    for name, fn in vars(type(api)).items():
+        inner = getattr(fn, "__wrapped__", None)
+        if inner is not None and not name.startswith("_"):
+            setattr(api, name, inner.__get__(api))
+
+
+_A = TypeVar("_A")
+
+
+class _ApiHandle(Generic[_A]):
+    """A per-service API handle (``client.users_api``), built on first
+    access — with validate_arguments=False that includes shadowing every
+    operation of the service. The instance is cached on the client, so
+    later accesses are plain attribute reads.
+    """
+
+    def __init__(self, class_name: str) -> None:
+        self.class_name = class_name
+        self.attr = ""
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.attr = name
+
+    def __get__(self, client: Optional["Client"], owner: type) -> _A:
+        if client is None:
+            return self  # type: ignore[return-value]
+        module = importlib.import_module(f"yaylib.api.{self.attr}")
+        api = getattr(module, self.class_name)(client._api_client)
+        if not client.validate_arguments:
+            _skip_argument_validation(api)
+        client._api_client.add_operations(type(api))
+        client.__dict__[self.attr] = api
+        return api
+
+
+_JSON_CONTENT_TYPE = re.compile(
+    r"^application/(json|[\w!#$&.+-^_]+\+json)\s*(;|$)", re.IGNORECASE
+)
+_CHARSET = re.compile(r"charset=([a-zA-Z\-\d]+)[\s;]?")
+
+
+class _Decoded:
+    """The outcome of decoding a body as ``response_type`` off the event
+    loop (yaylib.offload), in response mode ``mode`` with projection
+    ``fields``: a value, or the exception deserialize raised.
+    """
+
+    __slots__ = ("key", "value", "error")
+
+    def __init__(self, response_type: str, mode: str, fields, value, error) -> None:
+        self.key = (response_type, mode, fields)
+        self.value = value
+        self.error = error
+
+
+# The current call's body decoded off the loop: set by call_api, taken
+# by response_deserialize. Per call, not on the response — cached and
+# coalesced responses are shared by callers with other call options.
+_predecoded: contextvars.ContextVar[Optional[_Decoded]] = contextvars.ContextVar(
+    "yaylib_predecoded", default=None
+)
+
+
 class _WrappedApiClient(ApiClient):
     """ApiClient whose HTTP layer is our Transport. The generated
     ``__init__`` builds an aiohttp session eagerly (and so requires a
@@ -101,7 +221,15 @@ class _WrappedApiClient(ApiClient):
     constructible.
     """
 
-    def __init__(self, configuration: Configuration, transport: Transport):
+    def __init__(
+        self,
+        configuration: Configuration,
+        transport: Transport,
+        metrics: Optional[MetricsRegistry] = None,
+        response_mode: str = "model",
+        decode_offload: Optional[DecodeOffloadPolicy] = None,
+        json_codec: Optional[JsonCodec] = None,
+    ):
         self.configuration = configuration
         self.rest_client = transport
         # No default User-Agent: the transport composes and injects the
@@ -110,9 +238,297 @@ class _WrappedApiClient(ApiClient):
         self.default_headers = {}
         self.cookie = None
         self.client_side_validation = configuration.client_side_validation
+        self.metrics = metrics
+        self.response_mode = response_mode
+        self.decode_offload = decode_offload
+        # Response-body JSON decoder for the hand-written decode paths
+        # (dict / lazy modes, projection); takes bytes or str.
+        self.json_loads: Callable[[JsonInput], Any] = (
+            json_codec or default_codec()
+        ).loads
+        # Operation id -> 2xx response type, for offloaded decoding.
+        self._response_types: Dict[str, str] = {}
+
+    def add_operations(self, api_cls: type) -> None:
+        """Learn the response types of a generated API class's
+        operations (only needed for decode offloading).
+        """
+        if self.decode_offload is not None:
+            self._response_types.update(_offload.response_types(api_cls))
+
+    def param_serialize(
+        self,
+        method,
+        resource_path,
+        path_params=None,
+        query_params=None,
+        header_params=None,
+        body=None,
+        post_params=None,
+        files=None,
+        auth_settings=None,
+        collection_formats=None,
+        _host=None,
+        _request_auth=None,
+    ):
+        # Compiled path templates and a minimal per-call fill-in
+        # (yaylib._template); the generic path for what it does not cover.
+        request = None
+        if not (files or auth_settings or self.default_headers or self.cookie):
+            request = _template.serialize(
+                self, method, resource_path, path_params, query_params,
+                header_params, body, post_params, collection_formats, _host,
+            )
+        if request is None:
+            request = super().param_serialize(
+                method, resource_path, path_params, query_params,
+                header_params, body, post_params, files, auth_settings,
+                collection_formats, _host, _request_auth,
+            )
+        return request
+
+    def select_header_accept(self, accepts):
+        return _template.select_media_type(accepts)
+
+    def select_header_content_type(self, content_types):
+        return _template.select_media_type(content_types)
+
+    async def call_api(
+        self,
+        method,
+        url,
+        header_params=None,
+        body=None,
+        post_params=None,
+        _request_timeout=None,
+    ):
+        policy = self.decode_offload
+        if policy is None:
+            return await self._call_api(
+                method, url, header_params, body, post_params, _request_timeout
+            )
+        _predecoded.set(None)
+        resp = await self._call_api(
+            method, url, header_params, body, post_params, _request_timeout
+        )
+        if isinstance(resp, BufferedResponse):
+            _predecoded.set(await self._decode_off_loop(policy, resp, method, url))
+        return resp
+
+    async def _send(
+        self, method, url, header_params, body, post_params, _request_timeout
+    ) -> Union[BufferedResponse, StreamedResponse]:
+        # The generated call_api is annotated with RESTResponse; our
+        # Transport answers with its own response types.
+        resp = await super().call_api(
+            method, url, header_params, body, post_params, _request_timeout
+        )
+        return cast(Union[BufferedResponse, StreamedResponse], resp)
+
+    async def _call_api(
+        self, method, url, header_params, body, post_params, _request_timeout
+    ) -> Union[BufferedResponse, StreamedResponse]:
+        metrics = self.metrics
+        if metrics is None:
+            return await self._send(
+                method, url, header_params, body, post_params, _request_timeout
+            )
+        op = operation_of(method, urlsplit(url).path) or "unknown"
+        gauge = (("operation", op),)
+        call = CallMetrics()
+        token = bind_call_metrics(call)
+        metrics.add_gauge("yaylib_in_flight", gauge, 1)
+        started = time.monotonic()
+        status = 0
+        received = 0
+        try:
+            resp = await self._send(
+                method, url, header_params, body, post_params, _request_timeout
+            )
+            status = resp.status
+            received = len(resp.data or b"")
+            resp.operation = op
+            return resp
+        except ApiException as exc:
+            status = exc.status or 0
+            raise
+        finally:
+            unbind_call_metrics(token)
+            metrics.add_gauge("yaylib_in_flight", gauge, -1)
+            metrics.record_call(
+                op, call, time.monotonic() - started, status, received
+            )
+
+    async def _decode_off_loop(
+        self,
+        policy: DecodeOffloadPolicy,
+        resp: BufferedResponse,
+        method: str,
+        url: str,
+    ) -> Optional[_Decoded]:
+        """Decode a large 2xx JSON body in the offload executor and
+        return the outcome (yaylib.offload); None leaves it to decode
+        inline.
+        """
+        body = resp.data
+        if not 200 <= resp.status <= 299 or body is None or len(body) < policy.min_bytes:
+            return None
+        op = resp.operation or operation_of(method, urlsplit(url).path)
+        if op is None:
+            return None
+        response_type = self._response_types.get(op)
+        content_type = resp.getheader("content-type")
+        if (
+            response_type is None
+            or content_type is None
+            or not _JSON_CONTENT_TYPE.match(content_type)
+        ):
+            return None
+        # The body is decoded from its bytes here, so only UTF-8 is
+        # offloaded; other charsets take the inline (generated) path.
+        charset = _CHARSET.search(content_type)
+        if charset is not None and charset.group(1).lower() not in ("utf-8", "utf8"):
+            return None
+        opts = current_call_options()
+        mode = opts.response_mode or self.response_mode
+        if policy.dict_mode_only():
+            codec = self._offload_codec
+            if mode != "dict" or codec is None:
+                return None
+            job = functools.partial(_offload.load_dict, codec, body, opts.fields)
+            # Anything else is the pool failing, not the body.
+            body_errors: Tuple[Type[BaseException], ...] = (ValueError,)
+        else:
+            job = functools.partial(
+                contextvars.copy_context().run,
+                self.deserialize, body, response_type, content_type,
+            )
+            body_errors = (Exception,)
+        started = time.monotonic()
+        try:
+            pending = asyncio.get_running_loop().run_in_executor(policy.executor, job)
+        except RuntimeError:
+            return None  # executor shut down
+        try:
+            value = await pending
+        except body_errors as exc:
+            decoded = _Decoded(response_type, mode, opts.fields, None, exc)
+        except Exception:
+            return None
+        else:
+            decoded = _Decoded(response_type, mode, opts.fields, value, None)
+        if self.metrics is not None:
+            self.metrics.observe_decode(op, time.monotonic() - started)
+        return decoded
+
+    @functools.cached_property
+    def _offload_codec(self) -> Optional[str]:
+        return _offload.codec_name(self.json_loads)
+
+    def deserialize(self, response_text, response_type, content_type):
+        # Response modes and field projection (yaylib.call_options).
+        # Raising here surfaces a 2xx body as ApiException with the raw
+        # body, exactly like a model that fails to validate.
+        opts = current_call_options()
+        mode = opts.response_mode or self.response_mode
+        fields = opts.fields
+        decoded = _predecoded.get()
+        if decoded is not None and decoded.key == (response_type, mode, fields):
+            if decoded.error is not None:
+                raise decoded.error
+            return decoded.value
+        is_json = content_type is not None and bool(
+            _JSON_CONTENT_TYPE.match(content_type)
+        )
+        if mode == "model" and fields is None:
+            # Model and List[model] bodies are parsed and validated in
+            # one pass (yaylib._decode). Anything else, and any body the
+            # fast path rejects, takes the generated path.
+            validate = (
+                _decode.json_validator(response_type)
+                if is_json and response_text
+                else None
+            )
+            if validate is not None:
+                try:
+                    return validate(response_text)
+                except ValueError:
+                    pass
+            return super().deserialize(response_text, response_type, content_type)
+        if mode == "dict" and (is_json or content_type is None):
+            # The parsed JSON, no models.
+            try:
+                data = self.json_loads(response_text)
+            except ValueError:
+                if content_type is not None:
+                    raise
+            else:
+                return data if fields is None else _decode.project(data, fields)
+        elif is_json:
+            validate = _decode.python_validator(response_type)
+            if validate is not None:
+                data = self.json_loads(response_text)
+                if fields is not None:
+                    data = _decode.project(data, fields)
+                if mode == "lazy":
+                    return _lazy.decode(data, response_type)
+                return validate(data)
+        return super().deserialize(response_text, response_type, content_type)
+
+    def response_deserialize(self, response_data, response_types_map=None):
+        if isinstance(response_data, StreamedResponse):
+            # A streamed call (yaylib.streaming): the body is the
+            # ListStream's to read, not the generated operation's.
+            raise StreamOpened(response_data, response_types_map)
+        if _predecoded.get() is not None:
+            # Decoded off the loop (and its time observed there).
+            try:
+                return super().response_deserialize(response_data, response_types_map)
+            finally:
+                _predecoded.set(None)
+        metrics = self.metrics
+        if metrics is None:
+            return super().response_deserialize(response_data, response_types_map)
+        started = time.monotonic()
+        try:
+            return super().response_deserialize(response_data, response_types_map)
+        finally:
+            metrics.observe_decode(
+                getattr(response_data, "operation", None) or "unknown",
+                time.monotonic() - started,
+            )
 
 
 class Client(GeneratedFacade):
+    # Per-service API handles, built on first access.
+    activities_api: _ApiHandle[ActivitiesApi] = _ApiHandle("ActivitiesApi")
+    apps_api: _ApiHandle[AppsApi] = _ApiHandle("AppsApi")
+    auth_api: _ApiHandle[AuthApi] = _ApiHandle("AuthApi")
+    buckets_api: _ApiHandle[BucketsApi] = _ApiHandle("BucketsApi")
+    calls_api: _ApiHandle[CallsApi] = _ApiHandle("CallsApi")
+    chat_rooms_api: _ApiHandle[ChatRoomsApi] = _ApiHandle("ChatRoomsApi")
+    conversations_api: _ApiHandle[ConversationsApi] = _ApiHandle("ConversationsApi")
+    email_verification_urls_api: _ApiHandle[EmailVerificationUrlsApi] = _ApiHandle(
+        "EmailVerificationUrlsApi"
+    )
+    games_api: _ApiHandle[GamesApi] = _ApiHandle("GamesApi")
+    genres_api: _ApiHandle[GenresApi] = _ApiHandle("GenresApi")
+    gifts_api: _ApiHandle[GiftsApi] = _ApiHandle("GiftsApi")
+    group_mute_api: _ApiHandle[GroupMuteApi] = _ApiHandle("GroupMuteApi")
+    groups_api: _ApiHandle[GroupsApi] = _ApiHandle("GroupsApi")
+    hidden_api: _ApiHandle[HiddenApi] = _ApiHandle("HiddenApi")
+    moderation_api: _ApiHandle[ModerationApi] = _ApiHandle("ModerationApi")
+    notification_settings_api: _ApiHandle[NotificationSettingsApi] = _ApiHandle(
+        "NotificationSettingsApi"
+    )
+    pinned_api: _ApiHandle[PinnedApi] = _ApiHandle("PinnedApi")
+    posts_api: _ApiHandle[PostsApi] = _ApiHandle("PostsApi")
+    received_gifts_api: _ApiHandle[ReceivedGiftsApi] = _ApiHandle("ReceivedGiftsApi")
+    sticker_packs_api: _ApiHandle[StickerPacksApi] = _ApiHandle("StickerPacksApi")
+    surveys_api: _ApiHandle[SurveysApi] = _ApiHandle("SurveysApi")
+    threads_api: _ApiHandle[ThreadsApi] = _ApiHandle("ThreadsApi")
+    users_api: _ApiHandle[UsersApi] = _ApiHandle("UsersApi")
+
     # GeneratedFacade (PORTING.md §2) makes every operation reachable
     # as client.<op>, delegating to the per-service attribute. Client's
     # own hand-written methods below override the mixin via MRO (the
@@ -137,6 +553,19 @@ class Client(GeneratedFacade):
         session_store: Optional[SessionStore] = None,
         retry_policy: Optional[RetryPolicy] = None,
         logger: Optional[logging.Logger] = None,
+        connection_options: Optional[ConnectionOptions] = None,
+        http_core: Optional[HttpCore] = None,
+        coalesce_requests: bool = False,
+        pause_on_retry_window: bool = False,
+        response_cache: Optional[CachePolicy] = None,
+        adaptive_concurrency: Optional[AdaptiveConcurrency] = None,
+        hedging: Optional[HedgePolicy] = None,
+        circuit_breaker: Optional[CircuitBreakerPolicy] = None,
+        metrics: Optional[MetricsRegistry] = None,
+        json_codec: Union[str, JsonCodec, None] = "stdlib",
+        validate_arguments: bool = True,
+        response_mode: str = "model",
+        decode_offload: Optional[DecodeOffloadPolicy] = None,
     ) -> None:
         self.base_url = base_url or DEFAULT_BASE_URL
         self.cassandra_base_url = cassandra_base_url or DEFAULT_CASSANDRA_BASE_URL
@@ -162,6 +591,11 @@ class Client(GeneratedFacade):
         self.session_store = session_store
         self.retry_policy = retry_policy or DEFAULT_RETRY_POLICY
         self._logger = logger if logger is not None else _default_logger()
+        # JSON encode / decode for every body, error payload and event
+        # frame of this client (yaylib.codec). The default writes what
+        # json.dumps does; "orjson" / "msgspec" / "auto" opt in to a
+        # faster one.
+        self.json_codec = get_codec(json_codec)
 
         self._tokens: Tokens = empty_tokens()
         self._user_id = 0
@@ -190,35 +624,43 @@ class Client(GeneratedFacade):
             refresh=self._try_refresh,
             policy=self.retry_policy,
             on_response=self._maybe_fetch_client_ip,
+            connection_options=connection_options,
+            http_core=http_core,
+            coalesce=coalesce_requests,
+            pause_on_retry_window=pause_on_retry_window,
+            cache=(
+                ResponseCache(response_cache)
+                if response_cache is not None
+                else None
+            ),
+            adaptive_concurrency=adaptive_concurrency,
+            hedging=hedging,
+            circuit_breaker=circuit_breaker,
+            trace_connections=metrics is not None,
+            json_codec=self.json_codec,
         )
         self._transport = transport
         config = Configuration(host=self.base_url)
-        api_client = _WrappedApiClient(config, transport)
+        # "model" (typed pydantic models), "dict" (parsed JSON) or
+        # "lazy" (models decoding nested fields on access);
+        # call_options(response_mode=...) overrides it per call.
+        self.response_mode = check_response_mode(response_mode)
+        # Large response bodies decoded off the event loop
+        # (yaylib.offload); inline when None.
+        api_client = _WrappedApiClient(
+            config,
+            transport,
+            metrics,
+            self.response_mode,
+            decode_offload,
+            self.json_codec,
+        )
         self._api_client = api_client
 
-        self.activities_api = ActivitiesApi(api_client)
-        self.apps_api = AppsApi(api_client)
-        self.auth_api = AuthApi(api_client)
-        self.buckets_api = BucketsApi(api_client)
-        self.calls_api = CallsApi(api_client)
-        self.chat_rooms_api = ChatRoomsApi(api_client)
-        self.conversations_api = ConversationsApi(api_client)
-        self.email_verification_urls_api = EmailVerificationUrlsApi(api_client)
-        self.games_api = GamesApi(api_client)
-        self.genres_api = GenresApi(api_client)
-        self.gifts_api = GiftsApi(api_client)
-        self.group_mute_api = GroupMuteApi(api_client)
-        self.groups_api = GroupsApi(api_client)
-        self.hidden_api = HiddenApi(api_client)
-        self.moderation_api = ModerationApi(api_client)
-        self.notification_settings_api = NotificationSettingsApi(api_client)
-        self.pinned_api = PinnedApi(api_client)
-        self.posts_api = PostsApi(api_client)
-        self.received_gifts_api = ReceivedGiftsApi(api_client)
-        self.sticker_packs_api = StickerPacksApi(api_client)
-        self.surveys_api = SurveysApi(api_client)
-        self.threads_api = ThreadsApi(api_client)
-        self.users_api = UsersApi(api_client)
+        # Trusted-input mode: callers that pass already-typed arguments
+        # (high-QPS workers) skip @validate_call on every operation.
+        # Applied as each per-service handle is built (_ApiHandle).
+        self.validate_arguments = validate_arguments
 
     # ---- tokens / identity (PORTING.md §4) ----
 
@@ -247,6 +689,57 @@ class Client(GeneratedFacade):
     def client_ip(self) -> str:
         return self._client_ip
 
+    def pool_stats(self) -> List[PoolStats]:
+        """Acquired / idle socket counts per pooled host — a sizing aid
+        for ``ConnectionOptions`` under load. Empty before the first
+        request (pools are created lazily). With a shared ``http_core``
+        the counts cover every Client on that core.
+        """
+        return self._transport.pool_stats()
+
+    @property
+    def coalesced_requests(self) -> int:
+        """How many GETs were answered by joining an identical in-flight
+        request instead of going to the network (``coalesce_requests``).
+        """
+        return self._transport.coalesced_requests
+
+    def cache_stats(self) -> Optional[CacheStats]:
+        """Hit / miss / size counters of the response cache, or None
+        when the Client was built without ``response_cache``.
+        """
+        return self._transport.cache_stats()
+
+    def limiter_stats(self) -> Dict[str, LimiterStats]:
+        """Current window / in-flight / queued per route group of the
+        adaptive concurrency limiter (empty when it is not enabled).
+        """
+        return self._transport.limiter_stats()
+
+    def pause_stats(self) -> Optional[PauseStats]:
+        """How often, and for how long, the server's retry windows
+        (``retry_in`` / ``Retry-After``) paused this client's sends.
+        With a shared pause gate the figures cover every Client on the
+        HttpCore. None when neither ``pause_on_retry_window`` nor the
+        core's ``share_pause_gate`` is set.
+        """
+        return self._transport.pause_stats()
+
+    def hedge_stats(self) -> Optional[HedgeStats]:
+        """Hedged GET counters (None when hedging is not enabled)."""
+        return self._transport.hedge_stats()
+
+    @property
+    def metrics(self) -> Optional[MetricsRegistry]:
+        """The registry passed as ``metrics=`` (None when off)."""
+        return self._api_client.metrics
+
+    def circuit_states(self) -> Dict[str, str]:
+        """host -> "closed" / "open" / "half_open" for every host the
+        circuit breaker has seen (empty when it is not enabled).
+        """
+        return self._transport.circuit_states()
+
     def set_login_identity(self, email: str, user_id: int) -> None:
         """Internal — used by auth.py when activating a session."""
         self._current_email = email
@@ -256,7 +749,7 @@ class Client(GeneratedFacade):
         """Internal — used by auth.py when a restored session carries a
         persisted device UUID (PORTING.md §14)."""
         self._device_uuid = uuid
-        self._transport._ctx.device_uuid = uuid
+        self._transport.update_context(device_uuid=uuid)
 
     # ---- lifecycle ----
 
@@ -339,7 +832,8 @@ class Client(GeneratedFacade):
         values together — the server validates the hash against the
         timestamp it sees in the request.
         """
-        resp = await self.get_user_timestamp()
+        with internal_call_options():
+            resp = await self.get_user_timestamp()
         return self.generate_signed_info_at(resp.time)
 
     async def generate_call_action_signature(
@@ -349,11 +843,12 @@ class Client(GeneratedFacade):
         against a conference call. Pass the result straight to
         validate_call_action_signature, or read individual fields.
         """
-        resp = await self.calls_api.generate_call_action_signature(
-            conference_id=conference_id,
-            target_user_uuid=target_user_uuid,
-            action=action,
-        )
+        with internal_call_options():
+            resp = await self.calls_api.generate_call_action_signature(
+                conference_id=conference_id,
+                target_user_uuid=target_user_uuid,
+                action=action,
+            )
         return resp.signature_payload
 
     async def validate_call_action_signature(
@@ -409,6 +904,27 @@ class Client(GeneratedFacade):
             )
         return body, resp
 
+    # ---- streamed list responses (yaylib.streaming) ----
+
+    def stream_list(self, call, field: Optional[str] = None) -> ListStream:
+        """Stream the items of the list field ``field`` of a list
+        response as the body arrives, instead of buffering the body and
+        decoding it whole. ``call`` is the (not yet awaited) call of a
+        generated operation; ``field`` is the JSON key of the list, and
+        may be left out when the response has only one list of models::
+
+            async with client.stream_list(
+                client.get_user_followers(id=uid, number=1000)
+            ) as followers:
+                async for user in followers:
+                    ...
+            cursor = followers.next_page_value
+
+        An error status raises when the stream opens (``async with`` or
+        the first iteration), as from the call itself.
+        """
+        return ListStream(self._api_client, call, field)
+
     # ---- uploads (PORTING.md §8) ----
 
     def _upload_deps(self) -> "_UploadDeps":
@@ -524,9 +1040,14 @@ class Client(GeneratedFacade):
 
     async def _fetch_client_ip(self) -> None:
         try:
-            resp = await asyncio.wait_for(
-                self.users_api.get_user_timestamp(), timeout=30
-            )
+            # Spawned from inside a caller's request, so it inherits
+            # the caller's call options: reset them (this reads the
+            # model, unprojected) and drop the caller's deadline, which
+            # bounds that request, not this background fetch.
+            with internal_call_options(keep_deadline=False):
+                resp = await asyncio.wait_for(
+                    self.users_api.get_user_timestamp(), timeout=30
+                )
             ip = getattr(resp, "ip_address", "") or ""
             if ip:
                 self._client_ip = ip
@@ -635,7 +1156,7 @@ class Client(GeneratedFacade):
             )
             return False
         try:
-            parsed = json.loads(res.data)
+            parsed = self.json_codec.loads(res.data)
         except (ValueError, TypeError):
             self._logger.debug(
                 "token refresh failed",
@@ -703,15 +1224,17 @@ class _UploadDeps:
         return self._c._user_id
 
     async def get_presigned_urls(self, file_names):
-        resp = await self._c.buckets_api.get_bucket_presigned_urls(
-            file_names=file_names
-        )
+        with internal_call_options():
+            resp = await self._c.buckets_api.get_bucket_presigned_urls(
+                file_names=file_names
+            )
         return resp.presigned_urls or []
 
     async def get_video_presigned_url(self, video_file_name: str) -> str:
-        resp = await self._c.users_api.get_user_presigned_url(
-            video_file_name=video_file_name
-        )
+        with internal_call_options():
+            resp = await self._c.users_api.get_user_presigned_url(
+                video_file_name=video_file_name
+            )
         return resp.presigned_url or ""
 
     async def raw_put(self, url: str, body: bytes, content_type: str) -> None:
@@ -0,0 +1,139 @@
+# Pluggable JSON codec. Every JSON encode / decode the SDK does at
+# runtime — request bodies, untyped response bodies, error payloads
+# (``retry_in``, error_response_of), event-stream frames, the OAuth
+# refresh reply and the session file — goes through one of these, so
+# an installed fast parser speeds up all of them (typed model responses
+# are parsed by pydantic-core directly; see yaylib._decode):
+#
+#     Client(json_codec="orjson")     # or "msgspec", "auto"
+#
+# The default, "stdlib", writes exactly what json.dumps / json.dump
+# always have — request bodies and the session file are byte-for-byte
+# unchanged. The fast codecs are opt-in: they emit compact UTF-8 JSON
+# (no spaces, no \u escapes), which the server accepts alike. "auto"
+# picks orjson, then msgspec, then the standard library, by what is
+# importable. Decoding takes ``bytes`` directly — response bodies are
+# never decoded to ``str`` just to be parsed — and every decoder raises
+# ValueError on malformed input so callers can keep one
+# ``except ValueError``.
+
+from __future__ import annotations
+
+import json
+from typing import Any, Optional, Union
+
+JsonInput = Union[bytes, bytearray, memoryview, str]
+
+
+class JsonCodec:
+    """Standard-library codec; also the interface the others follow."""
+
+    name = "stdlib"
+
+    def loads(self, data: JsonInput) -> Any:
+        if isinstance(data, memoryview):
+            data = bytes(data)
+        return json.loads(data)
+
+    def dumps(self, obj: Any) -> bytes:
+        return json.dumps(obj).encode("utf-8")
+
+    def dumps_str(self, obj: Any) -> str:
+        return self.dumps(obj).decode("utf-8")
+
+    def dumps_pretty(self, obj: Any) -> bytes:
+        # Human-edited files (the session file): indented, stable order.
+        return json.dumps(obj, indent=2).encode("utf-8")
+
+    def __repr__(self) -> str:
+        return f"<JsonCodec {self.name}>"
+
+
+class OrjsonCodec(JsonCodec):
+    name = "orjson"
+
+    def __init__(self) -> None:
+        import orjson
+
+        self._orjson = orjson
+        self._opts = orjson.OPT_NON_STR_KEYS
+
+    def loads(self, data: JsonInput) -> Any:
+        return self._orjson.loads(data)
+
+    def dumps(self, obj: Any) -> bytes:
+        return self._orjson.dumps(obj, option=self._opts)
+
+    def dumps_pretty(self, obj: Any) -> bytes:
+        return self._orjson.dumps(
+            obj, option=self._opts | self._orjson.OPT_INDENT_2
+        )
+
+
+class MsgspecCodec(JsonCodec):
+    name = "msgspec"
+
+    def __init__(self) -> None:
+        import msgspec
+
+        self._decode = msgspec.json.decode
+        self._encode = msgspec.json.encode
+        self._error = msgspec.DecodeError
+
+    def loads(self, data: JsonInput) -> Any:
+        try:
+            return self._decode(data)
+        except self._error as exc:
+            raise ValueError(str(exc)) from exc
+
+    def dumps(self, obj: Any) -> bytes:
+        return self._encode(obj)
+
+
+_CODECS = {
+    "orjson": OrjsonCodec,
+    "msgspec": MsgspecCodec,
+    "stdlib": JsonCodec,
+}
+
+_default = JsonCodec()
+_fastest: Optional[JsonCodec] = None
+
+
+def get_codec(codec: Union[str, JsonCodec, None] = "stdlib") -> JsonCodec:
+    """Resolve ``codec`` — a name, "auto", None (= "stdlib") or a
+    JsonCodec instance — to a codec. Naming a codec whose package is
+    not installed raises ImportError; an unknown name raises ValueError.
+    """
+    if isinstance(codec, JsonCodec):
+        return codec
+    if codec is None or codec == "stdlib":
+        return default_codec()
+    if codec == "auto":
+        return fastest_codec()
+    factory = _CODECS.get(codec)
+    if factory is None:
+        raise ValueError(f"yaylib: unknown json codec {codec!r}")
+    return factory()
+
+
+def default_codec() -> JsonCodec:
+    """The standard-library codec every client uses unless told
+    otherwise; also the fallback where no client codec is at hand.
+    """
+    return _default
+
+
+def fastest_codec() -> JsonCodec:
+    """The "auto" codec, chosen once per process."""
+    global _fastest
+    if _fastest is None:
+        for factory in (OrjsonCodec, MsgspecCodec):
+            try:
+                _fastest = factory()
+                break
+            except ImportError:
+                continue
+        else:
+            _fastest = _default
+    return _fastest
@@ -0,0 +1,242 @@
+# Connection pooling for the transport. The generated RESTClientObject
+# sizes its connector from ``Configuration.connection_pool_maxsize``; the
+# Transport that replaces it (PORTING.md §17: connection pools are a
+# per-language detail) builds its own aiohttp connectors from
+# ``ConnectionOptions`` instead.
+#
+# Two pools are kept: "primary" serves the primary API host plus any
+# other origin the SDK talks to (presigned S3 uploads), "cassandra"
+# serves the auxiliary activity-feed host (see yaylib._host_routes). A
+# separate pool per host class is the only way to give the auxiliary
+# host its own per-host socket cap — aiohttp's ``limit_per_host`` is a
+# single number applied to every host of a connector.
+#
+# ``HttpCore`` owns the connectors (and with them the keep-alive
+# sockets and DNS caches) plus the TLS context. A core may be shared by
+# many Clients so the socket count follows concurrency rather than the
+# number of accounts; everything identity-bound (tokens, device UUID,
+# the TransportContext headers, cookies) stays on each Client's own
+# Transport and its lightweight per-client session.
+#
+# Durations are in SECONDS, like RetryPolicy.
+
+from __future__ import annotations
+
+import inspect
+import ssl as _ssl
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Union
+
+import aiohttp
+
+from yaylib.breaker import CircuitBreaker, CircuitBreakerPolicy
+from yaylib.pause import PauseGate
+
+POOL_PRIMARY = "primary"
+POOL_CASSANDRA = "cassandra"
+
+
+@dataclass(frozen=True)
+class ConnectionOptions:
+    # Total socket cap per pool (in use + idle). 0 means unlimited.
+    # Default: 100, the generated Configuration.connection_pool_maxsize.
+    limit: int = 100
+    # Per-host socket cap for the primary pool. 0 means unlimited.
+    limit_per_host: int = 0
+    # Per-host socket cap for the cassandra_base_url pool. 0 means
+    # unlimited.
+    cassandra_limit_per_host: int = 0
+    # How long an idle keep-alive socket stays pooled. None keeps
+    # aiohttp's default (15s).
+    keepalive_timeout: Optional[float] = None
+    # Resolver cache TTL. None caches forever; 0 disables the cache.
+    ttl_dns_cache: Optional[int] = 10
+    # TLS: True verifies with the default context, False disables
+    # verification, or pass a prepared ssl.SSLContext.
+    ssl: Union[bool, _ssl.SSLContext] = True
+    # Happy-eyeballs (RFC 8305) delay between address-family attempts.
+    # None disables it. Ignored on aiohttp builds without support.
+    happy_eyeballs_delay: Optional[float] = 0.25
+    # Close every socket after its response (no keep-alive).
+    force_close: bool = False
+
+
+DEFAULT_CONNECTION_OPTIONS = ConnectionOptions()
+
+
+@dataclass(frozen=True)
+class PoolStats:
+    """Socket occupancy of one host inside one pool."""
+
+    pool: str
+    host: str
+    port: Optional[int]
+    # Sockets currently carrying a request.
+    acquired: int
+    # Keep-alive sockets parked in the pool, ready for reuse.
+    idle: int
+
+
+_TCP_CONNECTOR_PARAMS = frozenset(
+    inspect.signature(aiohttp.TCPConnector.__init__).parameters
+)
+
+
+def build_connector(
+    opts: ConnectionOptions,
+    *,
+    limit_per_host: int,
+    ssl: Union[bool, _ssl.SSLContext, None] = None,
+) -> aiohttp.TCPConnector:
+    """Build a TCPConnector tuned by ``opts``. Must run inside the event
+    loop (aiohttp binds the connector to the running loop). ``ssl``
+    overrides ``opts.ssl`` (HttpCore passes its shared context).
+    """
+    kwargs: Dict[str, Any] = {
+        "limit": opts.limit,
+        "limit_per_host": limit_per_host,
+        "ttl_dns_cache": opts.ttl_dns_cache,
+        "use_dns_cache": opts.ttl_dns_cache != 0,
+        "ssl": opts.ssl if ssl is None else ssl,
+        "force_close": opts.force_close,
+    }
+    # keepalive_timeout conflicts with force_close in aiohttp.
+    if opts.keepalive_timeout is not None and not opts.force_close:
+        kwargs["keepalive_timeout"] = opts.keepalive_timeout
+    if "happy_eyeballs_delay" in _TCP_CONNECTOR_PARAMS:
+        kwargs["happy_eyeballs_delay"] = opts.happy_eyeballs_delay
+    return aiohttp.TCPConnector(**kwargs)
+
+
+def pool_stats(pool: str, connector: Optional[aiohttp.BaseConnector]) -> List[PoolStats]:
+    """Per-host acquired / idle socket counts of ``connector``.
+
+    aiohttp has no public occupancy API, so this reads the connector's
+    bookkeeping defensively: a build that renames those attributes
+    yields an empty list rather than an error.
+    """
+    if connector is None or connector.closed:
+        return []
+    acquired = getattr(connector, "_acquired_per_host", None) or {}
+    idle = getattr(connector, "_conns", None) or {}
+    out: List[PoolStats] = []
+    for key in set(acquired) | set(idle):
+        out.append(
+            PoolStats(
+                pool=pool,
+                host=getattr(key, "host", str(key)),
+                port=getattr(key, "port", None),
+                acquired=len(acquired.get(key, ())),
+                idle=len(idle.get(key, ())),
+            )
+        )
+    out.sort(key=lambda s: (s.host, s.port or 0))
+    return out
+
+
+class HttpCore:
+    """The shareable HTTP layer: one connector per pool, one TLS
+    context. Pass the same instance to many Clients::
+
+        async with HttpCore(ConnectionOptions(limit=200)) as core:
+            clients = [Client(http_core=core) for _ in accounts]
+            ...
+
+    With ``circuit_breaker`` set, every host reached through the core
+    gets a breaker (see yaylib.breaker) shared by all its Clients.
+
+    With ``share_pause_gate=True`` a retry window announced to one
+    Client (429 + ``retry_in`` / ``Retry-After``) pauses new sends of
+    every Client on the core; otherwise only Clients built with
+    ``pause_on_retry_window=True`` pause, each alone.
+
+    A Client never closes a core it was handed; close it yourself once
+    every Client using it is done. A Client built without ``http_core``
+    creates and owns a private one. All users of a core must run on the
+    same event loop (aiohttp binds connectors to the loop that created
+    them).
+    """
+
+    def __init__(
+        self,
+        connection_options: Optional[ConnectionOptions] = None,
+        *,
+        share_pause_gate: bool = False,
+        circuit_breaker: Optional[CircuitBreakerPolicy] = None,
+    ) -> None:
+        self._opts = connection_options or DEFAULT_CONNECTION_OPTIONS
+        self._connectors: Dict[str, aiohttp.TCPConnector] = {}
+        self._ssl_context: Optional[_ssl.SSLContext] = None
+        self._pause_gate = PauseGate() if share_pause_gate else None
+        self._breaker_policy = circuit_breaker
+        self._breakers: Dict[str, CircuitBreaker] = {}
+
+    @property
+    def connection_options(self) -> ConnectionOptions:
+        return self._opts
+
+    @property
+    def pause_gate(self) -> Optional[PauseGate]:
+        """The gate shared by every Client of this core, or None when
+        each Client keeps its own.
+        """
+        return self._pause_gate
+
+    def breaker(self, host: str) -> Optional[CircuitBreaker]:
+        """The circuit breaker of ``host`` (netloc), or None when the
+        core was built without ``circuit_breaker``.
+        """
+        policy = self._breaker_policy
+        if policy is None:
+            return None
+        breaker = self._breakers.get(host)
+        if breaker is None:
+            breaker = self._breakers[host] = CircuitBreaker(policy)
+        return breaker
+
+    def circuit_states(self) -> Dict[str, str]:
+        return {host: b.state for host, b in self._breakers.items()}
+
+    def _ssl(self) -> Union[bool, _ssl.SSLContext]:
+        # Build the verifying context once (loading the CA bundle is the
+        # expensive part) and hand the same object to every connector.
+        if self._opts.ssl is not True:
+            return self._opts.ssl
+        if self._ssl_context is None:
+            self._ssl_context = _ssl.create_default_context()
+        return self._ssl_context
+
+    def connector(self, pool: str) -> aiohttp.TCPConnector:
+        """The connector backing ``pool``, created on first use."""
+        conn = self._connectors.get(pool)
+        if conn is None or conn.closed:
+            opts = self._opts
+            limit_per_host = (
+                opts.cassandra_limit_per_host
+                if pool == POOL_CASSANDRA
+                else opts.limit_per_host
+            )
+            conn = build_connector(
+                opts, limit_per_host=limit_per_host, ssl=self._ssl()
+            )
+            self._connectors[pool] = conn
+        return conn
+
+    def pool_stats(self) -> List[PoolStats]:
+        out: List[PoolStats] = []
+        for pool, conn in self._connectors.items():
+            out.extend(pool_stats(pool, conn))
+        return out
+
+    async def close(self) -> None:
+        connectors = list(self._connectors.values())
+        self._connectors.clear()
+        for conn in connectors:
+            if not conn.closed:
+                await conn.close()
+
+    async def __aenter__(self) -> "HttpCore":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.close()
@@ -11,10 +11,10 @@
 
 from __future__ import annotations
 
-import json
 from dataclasses import dataclass
 from typing import Optional
 
+from yaylib.codec import JsonCodec, default_codec
 from yaylib.exceptions import ApiException as APIError
 from yaylib import _error_codes
 from yaylib._error_codes import *  # noqa: F401,F403 — generated ErrCode* constants
@@ -59,15 +59,19 @@ def _raw_body(err: object) -> Optional[str]:
     return None
 
 
-def error_response_of(err: object) -> Optional[ErrorResponse]:
+def error_response_of(
+    err: object, codec: Optional[JsonCodec] = None
+) -> Optional[ErrorResponse]:
     """Return the parsed payload when ``err`` is an APIError with a JSON
-    body, otherwise ``None`` (never raises).
+    body, otherwise ``None`` (never raises). ``codec`` parses the body —
+    pass ``client.json_codec`` to use the client's; the standard library
+    one by default.
     """
     text = _raw_body(err)
     if not text:
         return None
     try:
-        parsed = json.loads(text)
+        parsed = (codec or default_codec()).loads(text)
     except (ValueError, TypeError):
         return None
     if not isinstance(parsed, dict):
@@ -87,12 +91,13 @@ def error_response_of(err: object) -> Optional[ErrorResponse]:
     )
 
 
-def code_of(err: object) -> int:
+def code_of(err: object, codec: Optional[JsonCodec] = None) -> int:
     """Surface the server's ``error_code`` for match dispatch. Returns 0
     (the unknown / zero-ish code) when ``err`` is not an APIError or
-    carries no recognizable code. Never raises.
+    carries no recognizable code. Never raises. ``codec`` as for
+    error_response_of.
     """
-    r = error_response_of(err)
+    r = error_response_of(err, codec)
     if r is None or r.error_code is None:
         return 0
     return r.error_code
@@ -10,13 +10,14 @@ from __future__ import annotations
 
 import asyncio
 import contextlib
-import json
 import random
 from dataclasses import dataclass, field
 from typing import Any, Callable, Dict, List, Optional
 
 from aiohttp import WSMsgType
 
+from yaylib.call_options import internal_call_options
+
 DEFAULT_EVENT_STREAM_URL = "wss://cable.yay.space"
 
 _DEFAULT_SUBSCRIBE_TIMEOUT = 10.0
@@ -431,6 +432,7 @@ class EventStream:
         self, client, base: str, opts: EventStreamOptions
     ) -> None:
         self._client = client
+        self._codec = client.json_codec
         self._base = base or DEFAULT_EVENT_STREAM_URL
         self._opts = opts
         self._ws = None
@@ -443,7 +445,8 @@ class EventStream:
     # ---- connect / handshake ----
 
     async def _connect(self) -> None:
-        token_resp = await self._client.users_api.get_web_socket_token()
+        with internal_call_options():
+            token_resp = await self._client.users_api.get_web_socket_token()
         token = getattr(token_resp, "token", "") or ""
 
         sep = "&" if "?" in self._base else "?"
@@ -467,7 +470,7 @@ class EventStream:
                 WSMsgType.BINARY,
             ):
                 try:
-                    f = json.loads(msg.data)
+                    f = self._codec.loads(msg.data)
                 except (ValueError, TypeError):
                     continue
                 t = f.get("type")
@@ -590,7 +593,7 @@ class EventStream:
 
     def _dispatch(self, data) -> None:
         try:
-            f = json.loads(data)
+            f = self._codec.loads(data)
         except (ValueError, TypeError):
             return
         if not isinstance(f, dict):
@@ -626,7 +629,7 @@ class EventStream:
             return
         if isinstance(message, str):
             try:
-                message = json.loads(message)
+                message = self._codec.loads(message)
             except (ValueError, TypeError):
                 return
         if not isinstance(message, dict):
@@ -669,7 +672,7 @@ class EventStream:
         if ws is None:
             raise ConnectionError("yaylib: ws not connected")
         await ws.send_str(
-            json.dumps({"command": cmd, "identifier": identifier})
+            self._codec.dumps_str({"command": cmd, "identifier": identifier})
         )
 
     async def subscribe(self, channel: Channel) -> Subscription:
@@ -0,0 +1,131 @@
+# Hedged GETs for tail latency. A read that has not answered by the
+# operation's recent p95 latency is sent a second time — the connector
+# hands the copy a different pooled connection, since the first is
+# still busy — and whichever response lands first wins; the other send
+# is cancelled. A TokenBudget caps hedges to a fraction of requests so a
+# uniformly slow server is not sent double the traffic.
+#
+# Only operations listed in HedgePolicy.operations are hedged, and only
+# for methods RetryPolicy allows to retry (method_allows_retry) — a
+# hedge is a speculative retry. Opt-in via Client(hedging=HedgePolicy()).
+#
+# Latencies are in SECONDS.
+
+from __future__ import annotations
+
+import collections
+from dataclasses import dataclass
+from typing import Deque, Dict, Optional, Tuple
+
+from yaylib._routes import RouteTable, require_known_operation
+from yaylib.retry import TokenBudget
+
+# Latency-sensitive reads whose tail dominates perceived latency.
+DEFAULT_HEDGED_OPERATIONS: Tuple[str, ...] = (
+    "GET /v2/chat_rooms/{id}/messages",  # get_chat_messages
+    "GET /v2/posts/{noreply_mode}timeline",  # get_timeline
+    "GET /v2/posts/following_timeline",  # get_following_timeline
+    "GET /v2/conversations/{id}",  # get_conversation
+)
+
+
+@dataclass(frozen=True)
+class HedgePolicy:
+    # "METHOD path-template" keys of the operations to hedge.
+    operations: Tuple[str, ...] = DEFAULT_HEDGED_OPERATIONS
+    # Hedge once the first send has been out this long relative to the
+    # operation's observed latencies. Default: p95.
+    percentile: float = 0.95
+    # Delay used until ``min_samples`` latencies have been observed.
+    initial_delay: float = 0.5
+    # Never hedge sooner than this, however fast the operation usually
+    # is. Default: 20ms.
+    min_delay: float = 0.02
+    min_samples: int = 20
+    # Latencies kept per operation for the percentile.
+    window: int = 200
+    # Hedges allowed per hedgeable request (0.05 = 5%), and how many may
+    # be spent in a burst. See retry.TokenBudget.
+    budget_ratio: float = 0.05
+    budget_burst: int = 5
+
+
+@dataclass(frozen=True)
+class HedgeStats:
+    # Second copies sent.
+    hedged: int
+    # Of those, how many answered before the first send.
+    wins: int
+    # Hedges skipped because the budget was empty.
+    denied: int
+
+
+class _Latencies:
+    __slots__ = ("samples", "since", "threshold")
+
+    def __init__(self, window: int) -> None:
+        self.samples: Deque[float] = collections.deque(maxlen=window)
+        self.since = 0
+        self.threshold: Optional[float] = None
+
+
+class Hedger:
+    """Per-transport hedging state: which requests hedge, after how
+    long, and whether the budget allows one more.
+    """
+
+    # Recompute a percentile after this many new samples rather than
+    # sorting the window on every request.
+    _REFRESH_EVERY = 10
+
+    def __init__(self, policy: HedgePolicy) -> None:
+        self._policy = policy
+        self._ops = RouteTable(
+            {k: k for k in map(require_known_operation, policy.operations)}
+        )
+        self._latencies: Dict[str, _Latencies] = {}
+        self._budget = TokenBudget(policy.budget_ratio, policy.budget_burst)
+        self._hedged = 0
+        self._wins = 0
+
+    def operation(self, method: str, path: str) -> Optional[str]:
+        return self._ops.lookup(method, path)
+
+    def delay(self, op: str) -> float:
+        """How long the first send may run before a hedge is sent. Also
+        earns the op's share of the hedge budget.
+        """
+        self._budget.earn()
+        lat = self._latencies.get(op)
+        if lat is None or lat.threshold is None:
+            return self._policy.initial_delay
+        return max(self._policy.min_delay, lat.threshold)
+
+    def try_hedge(self) -> bool:
+        if self._budget.try_spend():
+            self._hedged += 1
+            return True
+        return False
+
+    def record_win(self) -> None:
+        self._wins += 1
+
+    def stats(self) -> HedgeStats:
+        return HedgeStats(
+            hedged=self._hedged, wins=self._wins, denied=self._budget.denied
+        )
+
+    def observe(self, op: str, latency: float) -> None:
+        policy = self._policy
+        lat = self._latencies.get(op)
+        if lat is None:
+            lat = self._latencies[op] = _Latencies(policy.window)
+        lat.samples.append(latency)
+        lat.since += 1
+        n = len(lat.samples)
+        if n >= policy.min_samples and (
+            lat.threshold is None or lat.since >= self._REFRESH_EVERY
+        ):
+            ordered = sorted(lat.samples)
+            lat.threshold = ordered[min(n - 1, int(n * policy.percentile))]
+            lat.since = 0
@@ -0,0 +1,162 @@
+# Adaptive concurrency limiting for the transport. RetryPolicy reacts to
+# a 429 one request at a time; under fan-out every coroutine hits the
+# limit together, sleeps together and retries together. The limiter
+# instead caps how many sends are in flight and moves that cap with the
+# server's feedback, AIMD style (as in TCP congestion control):
+#
+#   - a 429, a 5xx, a transport error, or a latency well above the
+#     observed baseline shrinks the window multiplicatively;
+#   - every other response grows it by ~1 per window's worth of
+#     successes (additive increase).
+#
+# Only one decrease is applied per "generation": responses to sends that
+# were already in flight when the window last shrank do not shrink it
+# again, so one burst of 429s halves the window once, not N times.
+#
+# Opt-in via Client(adaptive_concurrency=AdaptiveConcurrency(...)).
+# Latencies are in SECONDS.
+
+from __future__ import annotations
+
+import asyncio
+import collections
+from dataclasses import dataclass, field
+from typing import Deque, Dict, Mapping, Optional
+
+from yaylib._routes import RouteTable, require_known_operation
+
+DEFAULT_GROUP = "default"
+
+
+@dataclass(frozen=True)
+class AdaptiveConcurrency:
+    # Window the limiter starts from.
+    initial_limit: int = 20
+    # Floor and ceiling of the window.
+    min_limit: int = 1
+    max_limit: int = 200
+    # Multiplier applied to the window on congestion. Default: 0.5.
+    backoff_ratio: float = 0.5
+    # A response slower than this multiple of the baseline (the lowest
+    # recently observed latency) counts as congestion. 0 disables the
+    # latency signal so only 429 / 5xx / transport errors shrink the
+    # window.
+    latency_tolerance: float = 3.0
+    # Optional route groups, each with its own window:
+    # "METHOD path-template" -> group name. Unlisted requests share the
+    # "default" group.
+    groups: Mapping[str, str] = field(default_factory=dict)
+
+
+@dataclass(frozen=True)
+class LimiterStats:
+    limit: int
+    in_flight: int
+    queued: int
+
+
+class AdaptiveLimiter:
+    """One AIMD window. ``acquire`` waits FIFO for a free slot and
+    returns the generation stamp to pass back to ``release``.
+    """
+
+    def __init__(self, cfg: AdaptiveConcurrency) -> None:
+        self._cfg = cfg
+        self._limit = float(
+            min(max(cfg.initial_limit, cfg.min_limit), cfg.max_limit)
+        )
+        self._in_flight = 0
+        self._waiters: Deque["asyncio.Future[None]"] = collections.deque()
+        self._generation = 0
+        self._baseline: Optional[float] = None
+
+    @property
+    def limit(self) -> int:
+        return max(1, int(self._limit))
+
+    def stats(self) -> LimiterStats:
+        return LimiterStats(
+            limit=self.limit, in_flight=self._in_flight, queued=len(self._waiters)
+        )
+
+    async def acquire(self) -> int:
+        if self._in_flight < self.limit and not self._waiters:
+            self._in_flight += 1
+            return self._generation
+        fut: "asyncio.Future[None]" = asyncio.get_running_loop().create_future()
+        self._waiters.append(fut)
+        try:
+            await fut
+        except asyncio.CancelledError:
+            if fut.done() and not fut.cancelled():
+                # The slot was handed over just as we were cancelled.
+                self._in_flight -= 1
+                self._wake()
+            else:
+                self._waiters.remove(fut)
+            raise
+        return self._generation
+
+    def _wake(self) -> None:
+        while self._waiters and self._in_flight < self.limit:
+            fut = self._waiters.popleft()
+            if not fut.done():
+                self._in_flight += 1
+                fut.set_result(None)
+
+    def release(
+        self, generation: int, *, congested: bool, latency: Optional[float]
+    ) -> None:
+        self._in_flight -= 1
+        cfg = self._cfg
+        if not congested and latency is not None:
+            base = self._baseline
+            if base is None or latency < base:
+                self._baseline = latency
+            else:
+                # Let the baseline creep up slowly so a permanent shift
+                # in server latency is eventually accepted as normal.
+                self._baseline = base + (latency - base) * 0.01
+                if cfg.latency_tolerance > 0 and latency > base * cfg.latency_tolerance:
+                    congested = True
+        if congested:
+            if generation == self._generation:
+                self._limit = max(
+                    float(cfg.min_limit), self._limit * cfg.backoff_ratio
+                )
+                self._generation += 1
+        elif self._limit < cfg.max_limit:
+            self._limit = min(float(cfg.max_limit), self._limit + 1.0 / self._limit)
+        self._wake()
+
+    def abandon(self) -> None:
+        """Give a slot back without a verdict (the send was cancelled
+        before it finished), so the window neither grows nor shrinks.
+        """
+        self._in_flight -= 1
+        self._wake()
+
+
+class LimiterSet:
+    """The per-route-group windows of one transport."""
+
+    def __init__(self, cfg: AdaptiveConcurrency) -> None:
+        self._cfg = cfg
+        self._groups = RouteTable(
+            {require_known_operation(k): v for k, v in cfg.groups.items()}
+        )
+        self._limiters: Dict[str, AdaptiveLimiter] = {}
+
+    def for_request(self, method: str, path: str) -> AdaptiveLimiter:
+        group = (self._groups.lookup(method, path) if self._groups else None) or DEFAULT_GROUP
+        lim = self._limiters.get(group)
+        if lim is None:
+            lim = self._limiters[group] = AdaptiveLimiter(self._cfg)
+        return lim
+
+    def stats(self) -> Dict[str, LimiterStats]:
+        return {g: lim.stats() for g, lim in self._limiters.items()}
+
+
+def is_congestion_status(status: int) -> bool:
+    return status == 429 or 500 <= status <= 599
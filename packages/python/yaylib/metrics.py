@@ -0,0 +1,294 @@
+# In-process metrics for SDK calls, labelled by generated operation id
+# (``get_user``), never by raw path — ids in paths would blow up label
+# cardinality. Off by default; pass a registry to turn it on (one
+# registry may be shared by many Clients):
+#
+#     metrics = yaylib.MetricsRegistry()
+#     client = Client(metrics=metrics)
+#     ...
+#     text = yaylib.prometheus_text(metrics)   # serve it however you like
+#     data = metrics.snapshot()                # or read it as a dict
+#
+# Recorded per operation:
+#
+#   yaylib_call_phase_seconds{operation,phase}  histogram
+#       wait    — time in the transport not spent on the wire: pause
+#                 gate, concurrency window, backoff sleeps, token
+#                 refresh, coalesced / cached answers
+#       send    — request out until response headers in, summed over
+#                 attempts (hedged copies included)
+#       read    — response body read, summed over attempts
+#       decode  — typed deserialization of the body
+#   yaylib_responses_total{operation,status}    counter (0 = no response)
+#   yaylib_attempts_total / yaylib_retries_total / yaylib_refreshes_total
+#   yaylib_request_bytes_total / yaylib_response_bytes_total
+#   yaylib_in_flight{operation}                 gauge
+#
+# and, from the connection trace (yaylib.tracing):
+#
+#   yaylib_connection_phase_seconds{operation,phase}  histogram
+#       pool_wait / dns / connect / server
+#   yaylib_connections_total{operation,reused}        counter
+#
+# No network dependency: exporting is formatting text.
+#
+# Durations are in SECONDS.
+
+from __future__ import annotations
+
+import bisect
+from contextvars import ContextVar, Token
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+Labels = Tuple[Tuple[str, str], ...]
+
+# Prometheus client defaults, which suit API round-trips well.
+DEFAULT_BUCKETS: Tuple[float, ...] = (
+    0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0,
+)
+
+_PHASE = "yaylib_call_phase_seconds"
+_CONN_PHASE = "yaylib_connection_phase_seconds"
+_CONNS = "yaylib_connections_total"
+
+_HELP = {
+    _PHASE: "Time spent per SDK call phase.",
+    "yaylib_responses_total": "SDK calls by final HTTP status.",
+    "yaylib_attempts_total": "HTTP sends, retries and hedges included.",
+    "yaylib_retries_total": "Retries after 429 / 5xx / transport errors.",
+    "yaylib_refreshes_total": "401 token refreshes followed by a replay.",
+    "yaylib_request_bytes_total": "Request body bytes sent.",
+    "yaylib_response_bytes_total": "Response body bytes received.",
+    "yaylib_in_flight": "SDK calls currently in progress.",
+    _CONN_PHASE: "Connection phases of the sends of an SDK call.",
+    _CONNS: "Connections used by sends, by whether pooled ones were reused.",
+}
+
+
+class _Histogram:
+    __slots__ = ("counts", "sum", "count")
+
+    def __init__(self, n: int) -> None:
+        self.counts = [0] * (n + 1)  # last slot is +Inf
+        self.sum = 0.0
+        self.count = 0
+
+
+class MetricsRegistry:
+    """Counters, gauges and fixed-bucket histograms keyed by name and
+    label set. Not thread-safe; like the rest of the SDK it expects one
+    event loop.
+    """
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS) -> None:
+        self._buckets = tuple(sorted(buckets))
+        self._histograms: Dict[str, Dict[Labels, _Histogram]] = {}
+        self._counters: Dict[str, Dict[Labels, float]] = {}
+        self._gauges: Dict[str, Dict[Labels, float]] = {}
+
+    def observe(self, name: str, labels: Labels, value: float) -> None:
+        series = self._histograms.setdefault(name, {})
+        h = series.get(labels)
+        if h is None:
+            h = series[labels] = _Histogram(len(self._buckets))
+        h.counts[bisect.bisect_left(self._buckets, value)] += 1
+        h.sum += value
+        h.count += 1
+
+    def inc(self, name: str, labels: Labels, value: float = 1) -> None:
+        series = self._counters.setdefault(name, {})
+        series[labels] = series.get(labels, 0) + value
+
+    def add_gauge(self, name: str, labels: Labels, delta: float) -> None:
+        series = self._gauges.setdefault(name, {})
+        series[labels] = series.get(labels, 0) + delta
+
+    def record_call(
+        self,
+        operation: str,
+        call: "CallMetrics",
+        elapsed: float,
+        status: int,
+        response_bytes: int,
+    ) -> None:
+        """Fold one finished call (as measured by the ApiClient and the
+        transport) into the per-operation series.
+        """
+        op = (("operation", operation),)
+        wire = call.send + call.read
+        self.observe(_PHASE, op + (("phase", "wait"),), max(0.0, elapsed - wire))
+        if call.attempts:
+            self.observe(_PHASE, op + (("phase", "send"),), call.send)
+            self.observe(_PHASE, op + (("phase", "read"),), call.read)
+            self.inc("yaylib_attempts_total", op, call.attempts)
+        if call.retries:
+            self.inc("yaylib_retries_total", op, call.retries)
+        if call.refreshes:
+            self.inc("yaylib_refreshes_total", op, call.refreshes)
+        self.inc("yaylib_responses_total", op + (("status", str(status)),))
+        if call.request_bytes:
+            self.inc("yaylib_request_bytes_total", op, call.request_bytes)
+        if response_bytes:
+            self.inc("yaylib_response_bytes_total", op, response_bytes)
+        if call.pool_waits:
+            self.observe(_CONN_PHASE, op + (("phase", "pool_wait"),), call.pool_wait)
+        if call.dns_lookups:
+            self.observe(_CONN_PHASE, op + (("phase", "dns"),), call.dns)
+        if call.new_connections:
+            self.observe(_CONN_PHASE, op + (("phase", "connect"),), call.connect)
+            self.inc(_CONNS, op + (("reused", "false"),), call.new_connections)
+        if call.reused_connections:
+            self.inc(_CONNS, op + (("reused", "true"),), call.reused_connections)
+        if call.attempts and (call.new_connections or call.reused_connections):
+            self.observe(_CONN_PHASE, op + (("phase", "server"),), call.server)
+
+    def observe_decode(self, operation: str, elapsed: float) -> None:
+        self.observe(
+            _PHASE, (("operation", operation), ("phase", "decode")), elapsed
+        )
+
+    def clear(self) -> None:
+        self._histograms.clear()
+        self._counters.clear()
+        self._gauges.clear()
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Plain-dict copy of every series::
+
+            {"counters": {name: [{"labels": {...}, "value": n}, ...]},
+             "gauges": {...same shape...},
+             "histograms": {name: [{"labels": {...}, "buckets":
+                 {le: cumulative count, ..., "+Inf": n}, "sum": s,
+                 "count": n}, ...]}}
+        """
+        def plain(store):
+            return {
+                name: [
+                    {"labels": dict(labels), "value": value}
+                    for labels, value in series.items()
+                ]
+                for name, series in store.items()
+            }
+
+        histograms = {}
+        for name, series in self._histograms.items():
+            out = []
+            for labels, h in series.items():
+                out.append({
+                    "labels": dict(labels),
+                    "buckets": dict(zip(self._bucket_labels(), _cumulative(h.counts))),
+                    "sum": h.sum,
+                    "count": h.count,
+                })
+            histograms[name] = out
+        return {
+            "counters": plain(self._counters),
+            "gauges": plain(self._gauges),
+            "histograms": histograms,
+        }
+
+    def _bucket_labels(self) -> List[str]:
+        return [_format_value(b) for b in self._buckets] + ["+Inf"]
+
+
+def prometheus_text(registry: MetricsRegistry) -> str:
+    """Render ``registry`` in the Prometheus text exposition format
+    (version 0.0.4).
+    """
+    lines: List[str] = []
+
+    def header(name: str, kind: str) -> None:
+        help_text = _HELP.get(name)
+        if help_text:
+            lines.append(f"# HELP {name} {help_text}")
+        lines.append(f"# TYPE {name} {kind}")
+
+    for name, series in sorted(registry._counters.items()):
+        header(name, "counter")
+        for labels, value in sorted(series.items()):
+            lines.append(f"{name}{_format_labels(labels)} {_format_value(value)}")
+    for name, series in sorted(registry._gauges.items()):
+        header(name, "gauge")
+        for labels, value in sorted(series.items()):
+            lines.append(f"{name}{_format_labels(labels)} {_format_value(value)}")
+    bucket_labels = registry._bucket_labels()
+    for name, histograms in sorted(registry._histograms.items()):
+        header(name, "histogram")
+        for labels, h in sorted(histograms.items(), key=lambda item: item[0]):
+            for le, n in zip(bucket_labels, _cumulative(h.counts)):
+                lines.append(
+                    f"{name}_bucket{_format_labels(labels + (('le', le),))} {n}"
+                )
+            lines.append(f"{name}_sum{_format_labels(labels)} {_format_value(h.sum)}")
+            lines.append(f"{name}_count{_format_labels(labels)} {h.count}")
+    return "\n".join(lines) + "\n" if lines else ""
+
+
+def _cumulative(counts: List[int]) -> List[int]:
+    out, total = [], 0
+    for n in counts:
+        total += n
+        out.append(total)
+    return out
+
+
+def _format_value(v: float) -> str:
+    return str(int(v)) if float(v).is_integer() else repr(float(v))
+
+
+def _format_labels(labels: Labels) -> str:
+    if not labels:
+        return ""
+    body = ",".join(
+        '{}="{}"'.format(
+            k, v.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+        )
+        for k, v in labels
+    )
+    return "{" + body + "}"
+
+
+class CallMetrics:
+    """Per-call accumulator the transport adds wire time and attempt
+    counts to while the ApiClient measures the call as a whole.
+    """
+
+    __slots__ = (
+        "send", "read", "attempts", "retries", "refreshes", "request_bytes",
+        # Connection phases, filled by yaylib.tracing.
+        "pool_wait", "pool_waits", "dns", "dns_lookups", "connect",
+        "new_connections", "reused_connections", "server",
+    )
+
+    def __init__(self) -> None:
+        self.send = 0.0
+        self.read = 0.0
+        self.attempts = 0
+        self.retries = 0
+        self.refreshes = 0
+        self.request_bytes = 0
+        self.pool_wait = 0.0
+        self.pool_waits = 0
+        self.dns = 0.0
+        self.dns_lookups = 0
+        self.connect = 0.0
+        self.new_connections = 0
+        self.reused_connections = 0
+        self.server = 0.0
+
+
+_current: ContextVar[Optional[CallMetrics]] = ContextVar(
+    "yaylib_call_metrics", default=None
+)
+
+
+def current_call_metrics() -> Optional[CallMetrics]:
+    return _current.get()
+
+
+def bind_call_metrics(call: CallMetrics) -> Token[Optional[CallMetrics]]:
+    return _current.set(call)
+
+
+def unbind_call_metrics(token: Token[Optional[CallMetrics]]) -> None:
+    _current.reset(token)
@@ -0,0 +1,108 @@
+# Off-event-loop decoding of large responses. The generated operations
+# decode a body inline once it has arrived — JSON parsing plus pydantic
+# validation, ~10 ms for a 100-post timeline — and every other task on
+# the loop (the event-stream read pump included) waits for it. With
+#
+#     Client(decode_offload=DecodeOffloadPolicy())
+#
+# a 2xx JSON body of at least ``min_bytes`` is decoded in an executor
+# between receiving the response and handing it to the generated code;
+# smaller bodies stay inline, where the hand-off would cost more than it
+# saves. pydantic-core and the JSON parsers hold the GIL for stretches,
+# so a thread does not make decoding free, but the loop gets to run
+# between them instead of waiting out the whole body.
+#
+# The executor runs the same ApiClient.deserialize call the inline path
+# would, in a copy of the caller's context (call_options apply), and its
+# result — or the exception it raised — is picked up by the same call's
+# response_deserialize, which carries on exactly as inline: a body that
+# fails to validate still surfaces as ApiException with the raw body.
+# The result is kept per call, not on the response object, because the
+# response cache and request coalescing hand one response to callers
+# with different call options.
+#
+# A ProcessPoolExecutor only takes dict-mode bodies (response_mode=
+# "dict"): parsed JSON pickles cheaply, models and the call context do
+# not. Typed and lazy bodies then decode inline, as do bodies of
+# operations whose response type is not a model or a list of models.
+
+from __future__ import annotations
+
+import typing
+from concurrent.futures import Executor, ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
+
+from pydantic import BaseModel
+
+from yaylib import _decode
+from yaylib.codec import JsonCodec, get_codec
+
+
+@dataclass(frozen=True)
+class DecodeOffloadPolicy:
+    # Bodies of at least this many bytes are decoded off the loop.
+    # Default: 64 KiB (a few milliseconds of typed decoding).
+    min_bytes: int = 64 * 1024
+    # Where. None: the event loop's default executor (a thread pool).
+    executor: Optional[Executor] = None
+
+    def dict_mode_only(self) -> bool:
+        return isinstance(self.executor, ProcessPoolExecutor)
+
+
+_RAW_VARIANTS = ("_with_http_info", "_without_preload_content")
+_response_types: Dict[type, Dict[str, str]] = {}
+
+
+def response_types(api_cls: type) -> Dict[str, str]:
+    """Operation id -> 2xx response type ("Post", "List[Walkthrough]")
+    of a generated API class, for the operations returning a model or a
+    list of models; read from the operations' return annotations, which
+    the generator writes from the same schema as _response_types_map.
+    """
+    table = _response_types.get(api_cls)
+    if table is None:
+        table = {}
+        for name, fn in vars(api_cls).items():
+            inner = getattr(fn, "__wrapped__", None)
+            if inner is None or name.startswith("_") or name.endswith(_RAW_VARIANTS):
+                continue
+            response_type = _type_name(inner.__annotations__.get("return"))
+            if response_type is not None:
+                table[name] = response_type
+        _response_types[api_cls] = table
+    return table
+
+
+def _type_name(annotation: Any) -> Optional[str]:
+    if typing.get_origin(annotation) is list:
+        (item,) = typing.get_args(annotation)
+        name = _type_name(item)
+        return None if name is None else f"List[{name}]"
+    if (
+        isinstance(annotation, type)
+        and issubclass(annotation, BaseModel)
+        and _decode.model_class(annotation.__name__) is annotation
+    ):
+        return annotation.__name__
+    return None
+
+
+def codec_name(loads: Any) -> Optional[str]:
+    """The name a worker process can rebuild the codec of ``loads`` (a
+    JsonCodec.loads) from; None for a custom codec.
+    """
+    codec = getattr(loads, "__self__", None)
+    if isinstance(codec, JsonCodec) and type(codec) is type(get_codec(codec.name)):
+        return codec.name
+    return None
+
+
+def load_dict(codec: str, body: bytes, fields: Optional[Dict[str, Any]]) -> Any:
+    """Dict-mode decoding of ``body`` in a worker process: what
+    ApiClient.deserialize returns for a JSON body in response_mode
+    "dict".
+    """
+    data = get_codec(codec).loads(body)
+    return data if fields is None else _decode.project(data, fields)
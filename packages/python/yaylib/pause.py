@@ -0,0 +1,69 @@
+# Shared "pause until T" gate. A 429 (or 5xx) that carries a retry
+# window — a ``retry_in`` body field or a ``Retry-After`` header — is the
+# server telling the whole client to back off, not just the request that
+# happened to receive it. Without a gate only that request sleeps while
+# every concurrent call keeps sending and collects its own 429.
+#
+# Opt-in. With Client(pause_on_retry_window=True) the transport closes
+# the client's own gate for the announced window and every new send
+# waits on it first; HttpCore(share_pause_gate=True) makes all Clients
+# of a core share one (useful when they sit behind the same rate-limited
+# IP). Without either, only the request that got the window backs off.
+#
+# Durations are in SECONDS, like RetryPolicy.
+
+from __future__ import annotations
+
+import asyncio
+import time
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class PauseStats:
+    # Windows announced by the server (each close or extension).
+    pauses: int
+    # Sends that had to wait on a closed gate.
+    waits: int
+    # Summed length of the announced windows (overlaps counted once).
+    paused_seconds: float
+
+
+class PauseGate:
+    def __init__(self) -> None:
+        self._until = 0.0
+        self._pauses = 0
+        self._waits = 0
+        self._paused = 0.0
+
+    def pause_for(self, seconds: float) -> None:
+        """Close the gate for ``seconds`` from now. A window that ends
+        before the current one is ignored; a later one extends it.
+        """
+        if seconds <= 0:
+            return
+        now = time.monotonic()
+        until = now + seconds
+        if until <= self._until:
+            return
+        self._paused += until - max(now, self._until)
+        self._until = until
+        self._pauses += 1
+
+    def remaining(self) -> float:
+        return max(0.0, self._until - time.monotonic())
+
+    async def wait(self) -> None:
+        delay = self.remaining()
+        if delay <= 0:
+            return
+        self._waits += 1
+        # Loop: the window may be extended while we sleep.
+        while delay > 0:
+            await asyncio.sleep(delay)
+            delay = self.remaining()
+
+    def stats(self) -> PauseStats:
+        return PauseStats(
+            pauses=self._pauses, waits=self._waits, paused_seconds=self._paused
+        )
@@ -10,6 +10,9 @@
 #     over the computed exponential backoff (seconds).
 #   - Backoff is exponential with full jitter, clamped to ``max_delay``.
 #   - The zero value (``RetryPolicy(max_attempts=0)``) disables retry.
+#   - Optional (Python-only) retry budget: a token bucket shared by all
+#     requests of a client that caps retries to a fraction of first
+#     attempts, so an outage cannot multiply load by ``max_attempts``.
 #
 # Delays are expressed in SECONDS (Python idiom — Go uses
 # time.Duration, TS uses milliseconds). ``ReconnectPolicy`` (the
@@ -36,6 +39,15 @@ class RetryPolicy:
     # Allow retrying POST / PATCH on 5xx / transport errors. Default:
     # False. 429 retries on every method regardless.
     retry_on_post: bool = False
+    # Retry budget: each first attempt earns this many retry tokens and
+    # each retry spends one, so retries stay at most this fraction of
+    # recent traffic (0.1 = 10%). A retry with no token left fails fast
+    # with the response / error it would have retried. 0 disables the
+    # budget. Default: 0.
+    retry_budget_ratio: float = 0.0
+    # Bucket size: tokens available at start (so a quiet client can
+    # still retry) and the most that can be saved up. Default: 10.
+    retry_budget_burst: int = 10
 
 
 DEFAULT_RETRY_POLICY = RetryPolicy(
@@ -55,10 +67,17 @@ def method_allows_retry(method: str, policy: RetryPolicy) -> bool:
     return False
 
 
+def is_server_error(status: int) -> bool:
+    """True for a 5xx: the host's fault, as retries and the circuit
+    breaker (yaylib.breaker) both count it.
+    """
+    return 500 <= status <= 599
+
+
 def should_retry_status(status: int, method: str, policy: RetryPolicy) -> bool:
     if status == 429:
         return True
-    if 500 <= status <= 599:
+    if is_server_error(status):
         return method_allows_retry(method, policy)
     return False
 
@@ -75,3 +94,31 @@ def full_jitter_delay(
         policy.base_delay * (2 ** max(0, attempt - 1)),
     )
     return rand() * exp
+
+
+class TokenBudget:
+    """Token bucket capping extra sends (retries, hedges) to a fraction
+    of first attempts: ``earn`` once per first attempt, ``try_spend``
+    once per extra send. Starts full so a quiet client is not starved.
+    """
+
+    def __init__(self, ratio: float, burst: int) -> None:
+        self._ratio = ratio
+        self._capacity = float(max(1, burst))
+        self._tokens = self._capacity
+        self.denied = 0
+
+    @property
+    def tokens(self) -> float:
+        return self._tokens
+
+    def earn(self) -> None:
+        self._tokens = min(self._capacity, self._tokens + self._ratio)
+
+    def try_spend(self) -> bool:
+        """Take one token; False (and counted) when empty."""
+        if self._tokens >= 1.0:
+            self._tokens -= 1.0
+            return True
+        self.denied += 1
+        return False
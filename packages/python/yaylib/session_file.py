@@ -8,10 +8,10 @@ from __future__ import annotations
 
 import asyncio
 import dataclasses
-import json
 import os
 from typing import Optional
 
+from yaylib.codec import JsonCodec, default_codec
 from yaylib.session import (
     NoSessionError,
     Session,
@@ -46,8 +46,9 @@ class FileSessionStore(SessionStore):
     updates. Cross-process safety is not provided (PORTING.md §5).
     """
 
-    def __init__(self, path: str) -> None:
+    def __init__(self, path: str, json_codec: Optional[JsonCodec] = None) -> None:
         self._path = path
+        self._codec = json_codec or default_codec()
         # Created lazily so construction works outside a running loop
         # (Client is built synchronously).
         self._lock: Optional[asyncio.Lock] = None
@@ -89,12 +90,12 @@ class FileSessionStore(SessionStore):
 
     def _read_all(self) -> dict:
         try:
-            with open(self._path, "r", encoding="utf-8") as fh:
-                text = fh.read()
+            with open(self._path, "rb") as fh:
+                raw = fh.read()
         except FileNotFoundError:
             return {"sessions": {}}
         try:
-            parsed = json.loads(text) if text else {}
+            parsed = self._codec.loads(raw) if raw else {}
         except ValueError as err:
             raise ValueError(
                 f"yaylib: failed to parse session file {self._path}: {err}"
@@ -111,8 +112,8 @@ class FileSessionStore(SessionStore):
         # if it didn't exist yet.
         fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
         try:
-            with os.fdopen(fd, "w", encoding="utf-8") as fh:
-                json.dump(data, fh, indent=2)
+            with os.fdopen(fd, "wb") as fh:
+                fh.write(self._codec.dumps_pretty(data))
         except BaseException:
             try:
                 os.unlink(tmp)
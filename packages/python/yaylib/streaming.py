@@ -0,0 +1,461 @@
+# Streamed list responses. A generated operation buffers the whole body
+# and decodes it once the last byte is in, so a 500-item timeline page
+# costs its full transfer time before the first post is usable, plus
+# the raw body and every decoded model in memory at once. A ListStream
+# parses the body as it arrives and yields the items of one list field
+# as each of them completes:
+#
+#     async with client.stream_list(
+#         client.get_timeline(noreply_mode=NoreplyMode.EMPTY, number=500),
+#         "posts",
+#     ) as stream:
+#         async for post in stream:        # Post, one at a time
+#             ...
+#     cursor = stream.next_page_value
+#
+# The call is sent as usual — headers, 401 refresh, retries, circuit
+# breaker, concurrency limiter and deadline all apply — except that a
+# 2xx body is not read by the transport (and so is neither cached,
+# coalesced nor hedged). An error status still raises from the first
+# iteration / ``async with``, as it does from the call itself.
+#
+# Items come out in the call's response mode (call_options apply, as
+# they stood when the stream opened): models by default, parsed JSON in
+# "dict" mode, lazy models in "lazy" mode; a field projection applies to
+# each item. Everything else in the body — next_page_value, the other
+# list fields — is kept aside, undecoded, until the body ends and is
+# then decoded as ``page``: the response model without the streamed
+# field. An item that does not validate, and a body that is not
+# well-formed JSON, raise ApiException carrying the offending item or
+# the unparsed rest of the body.
+#
+# Leave the ``async with`` block (or aclose()) to give up early; the
+# connection is dropped rather than drained. The request timeout covers
+# reading the body; a call_options deadline covers getting the response.
+#
+# Hand-written; it relies on the generated code only through the
+# operations' response type maps and the models' field tables.
+
+from __future__ import annotations
+
+import asyncio
+import json
+import re
+import typing
+from collections import deque
+from typing import Any, Callable, Coroutine, Deque, Dict, List, Optional, Tuple
+
+import aiohttp
+from pydantic import BaseModel
+
+from yaylib import _decode, _lazy
+from yaylib.call_options import current_call_options
+from yaylib.exceptions import ApiException
+from yaylib.transport import StreamedResponse, bind_streaming, unbind_streaming
+
+
+class StreamOpened(Exception):
+    """Raised by the ApiClient through the generated operation once a
+    streamed call has its 2xx response: carries the response and the
+    operation's response types map to the ListStream awaiting it.
+    """
+
+    def __init__(self, response: StreamedResponse, response_types_map) -> None:
+        super().__init__()
+        self.response = response
+        self.response_types_map = response_types_map or {}
+
+
+class ListStream:
+    """The items of one list field of a response, decoded as the body
+    arrives (see the module comment). Built by Client.stream_list.
+    """
+
+    def __init__(
+        self, api_client, call: Coroutine[Any, Any, Any], field: Optional[str]
+    ) -> None:
+        self._api_client = api_client
+        self._call = call
+        self._field = field
+        self._resp: Optional[StreamedResponse] = None
+        self._parser: Optional[_ListParser] = None
+        self._pending: Deque[bytes] = deque()
+        self._decode_item: Optional[Callable[[bytes], Any]] = None
+        self._decode_page: Optional[Callable[[bytes], Any]] = None
+        self._done = False
+        # The rest of the response once the body has been read: a model
+        # of the response type without the streamed field (or the
+        # parsed JSON in "dict" mode). None until then.
+        self.page: Any = None
+
+    @property
+    def field(self) -> Optional[str]:
+        """The JSON key of the streamed list (known once opened)."""
+        return self._field
+
+    @property
+    def next_page_value(self) -> Optional[str]:
+        """The page's cursor; None until the body has been read, or
+        when the response has none.
+        """
+        page = self.page
+        if isinstance(page, dict):
+            return page.get("next_page_value")
+        return getattr(page, "next_page_value", None)
+
+    async def __aenter__(self) -> "ListStream":
+        await self._open()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.aclose()
+
+    def __aiter__(self) -> "ListStream":
+        return self
+
+    async def __anext__(self) -> Any:
+        if self._resp is None and not self._done:
+            await self._open()
+        while not self._pending:
+            if self._done:
+                raise StopAsyncIteration
+            await self._read()
+        raw = self._pending.popleft()
+        # Items are only queued when there is a decoder for them.
+        decode_item = self._decode_item
+        assert decode_item is not None
+        try:
+            return decode_item(raw)
+        except Exception:
+            await self.aclose()
+            raise ApiException.from_response(
+                http_resp=self._resp, body=raw.decode("utf-8", "replace"), data=None
+            )
+
+    async def aclose(self) -> None:
+        """Stop reading; drops the connection if the body is unread."""
+        if self._resp is None:
+            if not self._done:
+                # Never opened: the call was never awaited.
+                self._call.close()
+        elif not self._done:
+            self._resp.close()
+        self._done = True
+        self._pending.clear()
+
+    async def _open(self) -> None:
+        token = bind_streaming()
+        try:
+            result = await self._call
+        except StreamOpened as opened:
+            resp = opened.response
+            types_map = opened.response_types_map
+        else:
+            if isinstance(result, StreamedResponse):
+                result.close()
+            raise TypeError(
+                "yaylib: stream_list needs a call of a generated operation that "
+                "decodes its response (not a *_without_preload_content one)"
+            )
+        finally:
+            self._done = True
+            unbind_streaming(token)
+        try:
+            self._start(resp, types_map)
+        except BaseException:
+            resp.close()
+            raise
+        self._resp = resp
+        self._done = False
+
+    def _start(self, resp: StreamedResponse, types_map: Dict[str, Any]) -> None:
+        response_type = _response_type(types_map, resp.status)
+        klass = _decode.model_class(response_type) if response_type is not None else None
+        if response_type is None or klass is None:
+            raise TypeError(
+                f"yaylib: stream_list needs an operation returning a model, "
+                f"not {response_type!r}"
+            )
+        field, item_type = _list_field(klass, self._field)
+        opts = current_call_options()
+        mode = opts.response_mode or self._api_client.response_mode
+        fields = opts.fields
+        loads = self._api_client.json_loads
+        if fields is None:
+            self._decode_item = _decoder(loads, item_type, mode, None)
+        elif field in fields:
+            self._decode_item = _decoder(loads, item_type, mode, fields[field])
+        else:
+            # Projected away: the items are parsed over, not decoded.
+            self._decode_item = None
+        self._decode_page = _decoder(loads, response_type, mode, fields)
+        self._field = field
+        self._parser = _ListParser(field)
+
+    async def _read(self) -> None:
+        # Only reached once _open has set these.
+        resp, parser, decode_page = self._resp, self._parser, self._decode_page
+        assert resp is not None and parser is not None and decode_page is not None
+        try:
+            chunk = await resp.content.readany()
+        except (aiohttp.ClientError, asyncio.TimeoutError) as exc:
+            await self.aclose()
+            raise ApiException(status=0, reason=str(exc)) from exc
+        try:
+            if chunk:
+                items = parser.feed(chunk)
+                if self._decode_item is not None:
+                    self._pending.extend(items)
+                return
+            rest = parser.close()
+        except ValueError:
+            await self.aclose()
+            raise ApiException.from_response(
+                http_resp=resp, body=parser.unparsed().decode("utf-8", "replace"), data=None
+            )
+        self._done = True
+        resp.release()
+        try:
+            self.page = decode_page(rest)
+        except Exception:
+            raise ApiException.from_response(
+                http_resp=resp, body=rest.decode("utf-8", "replace"), data=None
+            )
+
+
+def _response_type(types_map: Dict[str, Any], status: int) -> Optional[str]:
+    # The generated response_deserialize's lookup: the exact status,
+    # then "2XX", then the single documented success type.
+    response_type = types_map.get(str(status)) or types_map.get(f"{str(status)[0]}XX")
+    if response_type:
+        return response_type
+    success = {v for k, v in types_map.items() if v is not None and k[:1] == "2"}
+    return next(iter(success)) if len(success) == 1 else None
+
+
+def _list_field(klass: type, field: Optional[str]) -> Tuple[str, str]:
+    """(JSON key, item model name) of the list field ``field`` of
+    ``klass`` — its only list-of-models field when ``field`` is None.
+    """
+    candidates = {}
+    for name, info in klass.model_fields.items():  # type: ignore[attr-defined]
+        item = _list_item(info.annotation)
+        if item is not None:
+            candidates[info.alias or name] = item
+    if field is None and len(candidates) == 1:
+        field = next(iter(candidates))
+    if field is None or field not in candidates:
+        raise ValueError(
+            f"yaylib: {klass.__name__} has no list field {field!r} to stream; "
+            f"one of {sorted(candidates)}"
+        )
+    return field, candidates[field]
+
+
+def _list_item(annotation: Any) -> Optional[str]:
+    # Optional[List[Model]] -> "Model"
+    if typing.get_origin(annotation) is list:
+        (item,) = typing.get_args(annotation)
+        if isinstance(item, type) and issubclass(item, BaseModel):
+            return item.__name__
+        return None
+    if typing.get_origin(annotation) is typing.Union:
+        for arg in typing.get_args(annotation):
+            item = _list_item(arg)
+            if item is not None:
+                return item
+    return None
+
+
+def _decoder(
+    loads: Callable[[bytes], Any], type_name: str, mode: str, fields: Optional[Dict[str, Any]]
+) -> Callable[[bytes], Any]:
+    """JSON bytes -> value of ``type_name`` in response mode ``mode``,
+    projected by ``fields``; what ApiClient.deserialize returns for a
+    body of that type.
+    """
+    if mode == "dict":
+        if fields is None:
+            return loads
+        return lambda body: _decode.project(loads(body), fields)
+    if mode == "lazy":
+        if fields is None:
+            return lambda body: _lazy.decode(loads(body), type_name)
+        return lambda body: _lazy.decode(_decode.project(loads(body), fields), type_name)
+    if fields is None:
+        validate_json = _decode.json_validator(type_name)
+        if validate_json is not None:
+            return validate_json
+    else:
+        validate = _decode.python_validator(type_name)
+        if validate is not None:
+            return lambda body: validate(_decode.project(loads(body), fields))
+    raise TypeError(f"yaylib: {type_name!r} is not a model")
+
+
+# _WS, _SKIP and _SKIP_NESTED match the empty string, so their match()
+# never returns None.
+_WS = re.compile(rb"[ \t\n\r]*")
+# The rest of a string after its opening quote, closing quote included.
+_STRING_TAIL = re.compile(rb'[^"\\]*(?:\\.[^"\\]*)*"', re.DOTALL)
+# What a value scan steps over in one go: everything but brackets,
+# commas and a string that has not been received in full. Inside a
+# container commas do not matter and are stepped over too.
+_SKIP = re.compile(rb'(?:[^\[\]{}",]+|"[^"\\]*(?:\\.[^"\\]*)*")*', re.DOTALL)
+_SKIP_NESTED = re.compile(rb'(?:[^\[\]{}"]+|"[^"\\]*(?:\\.[^"\\]*)*")*', re.DOTALL)
+
+_QUOTE, _COMMA, _COLON = ord('"'), ord(","), ord(":")
+_OPEN = frozenset(b"[{")
+_LBRACE, _RBRACE, _LBRACKET, _RBRACKET = b"{}[]"
+
+(
+    _START,  # before the body's "{"
+    _KEY,  # at a member's key, or the closing "}"
+    _COLON_NEXT,  # after a key
+    _VALUE,  # after a key's ":"
+    _MEMBER,  # inside a member's value (kept raw)
+    _ITEMS,  # in the streamed array, between items
+    _ITEM,  # inside an item
+    _NEXT,  # after a member: "," or "}"
+    _DONE,  # after the closing "}"
+) = range(9)
+
+
+class _ListParser:
+    """Incremental scanner for a JSON object body. feed() returns the
+    raw bytes of each item of the array under ``field`` as soon as it is
+    complete; every other member is kept raw, and close() returns them
+    as a JSON object. Values are skipped over, not parsed: only string
+    boundaries and bracket depth are tracked, a regex search at a time.
+    """
+
+    def __init__(self, field: str) -> None:
+        self.field = field
+        self._buf = bytearray()
+        self._state = _START
+        # Start of the member / item being read: nothing before it is
+        # needed any more.
+        self._mark = 0
+        self._pos = 0
+        self._depth = 0
+        self._key: Optional[str] = None
+        self._members: List[bytes] = []
+
+    def feed(self, chunk: bytes) -> List[bytes]:
+        buf = self._buf
+        if self._mark:
+            del buf[:self._mark]
+            self._pos -= self._mark
+            self._mark = 0
+        buf += chunk
+        items: List[bytes] = []
+        while True:
+            state = self._state
+            if state == _ITEM or state == _MEMBER:
+                end = self._value_end()
+                if end < 0:
+                    return items
+                if state == _ITEM:
+                    items.append(bytes(buf[self._mark:end]))
+                    self._state = _ITEMS
+                else:
+                    self._members.append(bytes(buf[self._mark:end]))
+                    self._state = _NEXT
+                self._pos = self._mark = end
+                continue
+            pos = _WS.match(buf, self._pos).end()  # type: ignore[union-attr]
+            self._pos = pos
+            if pos == len(buf):
+                return items
+            c = buf[pos]
+            if state == _ITEMS:
+                if c == _RBRACKET:
+                    self._state = _NEXT
+                    self._pos = self._mark = pos + 1
+                elif c == _COMMA:
+                    self._pos = self._mark = pos + 1
+                else:
+                    self._state = _ITEM
+                    self._mark = pos
+                    self._depth = 0
+            elif state == _KEY:
+                if c == _RBRACE and self._key is None:
+                    self._state = _DONE
+                    self._pos = self._mark = pos + 1
+                    continue
+                if c != _QUOTE:
+                    raise ValueError("expected a key")
+                tail = _STRING_TAIL.match(buf, pos + 1)
+                if tail is None:
+                    return items
+                self._key = json.loads(bytes(buf[pos:tail.end()]))
+                self._state = _COLON_NEXT
+                self._mark = pos
+                self._pos = tail.end()
+            elif state == _COLON_NEXT:
+                if c != _COLON:
+                    raise ValueError("expected ':'")
+                self._state = _VALUE
+                self._pos = pos + 1
+            elif state == _VALUE:
+                if c == _LBRACKET and self._key == self.field:
+                    self._state = _ITEMS
+                    self._pos = self._mark = pos + 1
+                else:
+                    self._state = _MEMBER
+                    self._depth = 0
+            elif state == _NEXT:
+                if c == _COMMA:
+                    self._state = _KEY
+                elif c == _RBRACE:
+                    self._state = _DONE
+                else:
+                    raise ValueError("expected ',' or '}'")
+                self._pos = self._mark = pos + 1
+            elif state == _START:
+                if c != _LBRACE:
+                    raise ValueError("expected a JSON object")
+                self._state = _KEY
+                self._pos = self._mark = pos + 1
+            else:
+                raise ValueError("data after the JSON object")
+
+    def close(self) -> bytes:
+        """The members other than the streamed array, as a JSON object."""
+        if self._state != _DONE:
+            raise ValueError("truncated JSON body")
+        return b"{" + b",".join(self._members) + b"}"
+
+    def unparsed(self) -> bytes:
+        return bytes(self._buf[self._mark:])
+
+    def _value_end(self) -> int:
+        # End of the value starting at _mark (scanned from _pos at
+        # bracket depth _depth), or -1 when it needs more data.
+        buf = self._buf
+        pos = self._pos
+        depth = self._depth
+        while True:
+            skip = _SKIP_NESTED if depth else _SKIP
+            pos = skip.match(buf, pos).end()  # type: ignore[union-attr]
+            if pos == len(buf) or buf[pos] == _QUOTE:
+                self._pos, self._depth = pos, depth
+                return -1
+            c = buf[pos]
+            if c in _OPEN:
+                depth += 1
+            elif depth == 0:
+                # A string / number / true / false / null, ended by the
+                # "," or bracket after it.
+                return _rstrip_ws(buf, self._mark, pos)
+            else:
+                depth -= 1
+                if depth == 0:
+                    return pos + 1
+            pos += 1
+
+
+def _rstrip_ws(buf: bytearray, start: int, end: int) -> int:
+    while end > start and buf[end - 1] in b" \t\n\r":
+        end -= 1
+    return end
@@ -0,0 +1,95 @@
+# Connection-phase tracing through aiohttp's TraceConfig hooks. When a
+# metrics registry is configured the transport's sessions carry this
+# trace config, and every send adds its connection phases to the
+# call's CallMetrics (yaylib.metrics):
+#
+#   pool_wait — queued for a free connection (the pool limit was hit)
+#   dns       — resolver lookups (cache hits cost nothing)
+#   connect   — opening a new connection: DNS + TCP + TLS handshake
+#   server    — request headers sent until response headers received
+#
+# plus whether each send reused a pooled connection or opened a new one,
+# which shows keep-alive efficiency and pool starvation directly.
+#
+# The callbacks find the call through ``trace_request_ctx``, which
+# Transport._raw sets to the CallMetrics; sends without one (metrics
+# off, the unmetered refresh path) are ignored.
+
+from __future__ import annotations
+
+import time
+from typing import Optional
+
+import aiohttp
+
+from yaylib.metrics import CallMetrics
+
+
+def build_trace_config() -> aiohttp.TraceConfig:
+    config = aiohttp.TraceConfig()
+    config.on_connection_queued_start.append(_queued_start)
+    config.on_connection_queued_end.append(_queued_end)
+    config.on_dns_resolvehost_start.append(_dns_start)
+    config.on_dns_resolvehost_end.append(_dns_end)
+    config.on_connection_create_start.append(_create_start)
+    config.on_connection_create_end.append(_create_end)
+    config.on_connection_reuseconn.append(_reused)
+    config.on_request_headers_sent.append(_headers_sent)
+    config.on_request_end.append(_request_end)
+    config.freeze()
+    return config
+
+
+def _call(ctx) -> Optional[CallMetrics]:
+    call = ctx.trace_request_ctx
+    return call if isinstance(call, CallMetrics) else None
+
+
+async def _queued_start(session, ctx, params) -> None:
+    ctx.queued_at = time.monotonic()
+
+
+async def _queued_end(session, ctx, params) -> None:
+    call = _call(ctx)
+    if call is not None:
+        call.pool_wait += time.monotonic() - ctx.queued_at
+        call.pool_waits += 1
+
+
+async def _dns_start(session, ctx, params) -> None:
+    ctx.dns_at = time.monotonic()
+
+
+async def _dns_end(session, ctx, params) -> None:
+    call = _call(ctx)
+    if call is not None:
+        call.dns += time.monotonic() - ctx.dns_at
+        call.dns_lookups += 1
+
+
+async def _create_start(session, ctx, params) -> None:
+    ctx.create_at = time.monotonic()
+
+
+async def _create_end(session, ctx, params) -> None:
+    call = _call(ctx)
+    if call is not None:
+        call.connect += time.monotonic() - ctx.create_at
+        call.new_connections += 1
+
+
+async def _reused(session, ctx, params) -> None:
+    call = _call(ctx)
+    if call is not None:
+        call.reused_connections += 1
+
+
+async def _headers_sent(session, ctx, params) -> None:
+    ctx.sent_at = time.monotonic()
+
+
+async def _request_end(session, ctx, params) -> None:
+    call = _call(ctx)
+    sent_at = getattr(ctx, "sent_at", None)
+    if call is not None and sent_at is not None:
+        call.server += time.monotonic() - sent_at
@@ -13,12 +13,13 @@ from __future__ import annotations
 
 import asyncio
 import base64
-import json
+import email.utils
 import logging
 import re
 import time
+from contextvars import ContextVar, Token
 from dataclasses import dataclass
-from typing import Awaitable, Callable, Optional
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
 
 from urllib.parse import urlsplit, urlunsplit
 
@@ -26,10 +27,36 @@ import aiohttp
 from multidict import CIMultiDict
 
 from yaylib._host_routes import HOST_ROUTES
+from yaylib.cache import CacheKey, CacheStats, ResponseCache
+from yaylib.call_options import current_call_options
+from yaylib.codec import JsonCodec, default_codec
+from yaylib.breaker import (
+    CircuitBreaker,
+    CircuitBreakerPolicy,
+)
+from yaylib.hedging import Hedger, HedgePolicy, HedgeStats
+from yaylib.metrics import current_call_metrics
+from yaylib.tracing import build_trace_config
+from yaylib.pause import PauseGate, PauseStats
+from yaylib.limiter import (
+    AdaptiveConcurrency,
+    LimiterSet,
+    LimiterStats,
+    is_congestion_status,
+)
+from yaylib.connection import (
+    POOL_CASSANDRA,
+    POOL_PRIMARY,
+    ConnectionOptions,
+    HttpCore,
+    PoolStats,
+)
 from yaylib.exceptions import ApiException, ApiValueError
 from yaylib.retry import (
+    TokenBudget,
     RetryPolicy,
     full_jitter_delay,
+    is_server_error,
     method_allows_retry,
     should_retry_status,
 )
@@ -130,6 +157,9 @@ class BufferedResponse:
         self.reason = reason
         self._headers = headers
         self.data = data
+        # Generated operation id, set by the ApiClient when metrics are
+        # on so response_deserialize can label the decode phase.
+        self.operation: Optional[str] = None
 
     async def read(self) -> bytes:
         return self.data
@@ -150,6 +180,61 @@ class BufferedResponse:
         return self._headers.get(name, default)
 
 
+class StreamedResponse:
+    """A 2xx response whose body has not been read: what the transport
+    returns while streaming is bound (yaylib.streaming). Whoever takes
+    it reads ``content`` and must release() it once the body is read,
+    or close() it to drop the connection.
+    """
+
+    def __init__(self, resp: aiohttp.ClientResponse):
+        self.status = resp.status
+        self.reason = resp.reason
+        self._headers = CIMultiDict(resp.headers)
+        self.content = resp.content
+        self._resp = resp
+        # Nothing is buffered; kept for the RESTResponse shape.
+        self.data = None
+        self.operation: Optional[str] = None
+
+    async def read(self) -> bytes:
+        # The generated operations read the body before decoding it;
+        # here the stream's reader does, so this reads nothing.
+        return b""
+
+    @property
+    def response(self):
+        return self
+
+    def getheaders(self) -> "CIMultiDict[str]":
+        return self._headers
+
+    def getheader(self, name: str, default=None):
+        return self._headers.get(name, default)
+
+    def release(self) -> None:
+        self._resp.release()
+
+    def close(self) -> None:
+        self._resp.close()
+
+
+# Set around a call whose 2xx body is read incrementally by the caller
+# (yaylib.streaming): its request hands back a StreamedResponse instead
+# of buffering the body, and skips what needs a buffered body — the
+# response cache, coalescing and hedging. Error responses are still
+# buffered, so refresh, retries and error surfacing are as usual.
+_streaming: ContextVar[bool] = ContextVar("yaylib_streaming", default=False)
+
+
+def bind_streaming() -> Token[bool]:
+    return _streaming.set(True)
+
+
+def unbind_streaming(token: Token[bool]) -> None:
+    _streaming.reset(token)
+
+
 def _find_header(headers: dict, name: str) -> Optional[str]:
     lname = name.lower()
     for k in headers:
@@ -158,13 +243,6 @@ def _find_header(headers: dict, name: str) -> Optional[str]:
     return None
 
 
-def _set_if_absent(headers: dict, key: str, value: str) -> None:
-    if not value:
-        return
-    if _find_header(headers, key) is None:
-        headers[key] = value
-
-
 def _timeout(_request_timeout) -> aiohttp.ClientTimeout:
     if _request_timeout is None:
         return aiohttp.ClientTimeout(total=5 * 60)
@@ -178,6 +256,48 @@ def _timeout(_request_timeout) -> aiohttp.ClientTimeout:
     return aiohttp.ClientTimeout(total=5 * 60)
 
 
+def _deadline_exceeded() -> ApiException:
+    return ApiException(status=0, reason="deadline exceeded")
+
+
+def _fits(deadline: Optional[float], delay: float) -> bool:
+    # True when sleeping ``delay`` still leaves time before the deadline.
+    return deadline is None or time.monotonic() + delay < deadline
+
+
+async def _within(deadline: Optional[float], aw, *, shield: bool = False):
+    # Await ``aw`` but give up at the call's deadline (CallOptions).
+    # ``shield`` keeps shared work (the refresh single-flight, a
+    # coalesced round-trip) running for its other waiters.
+    if deadline is None:
+        return await aw
+    remaining = deadline - time.monotonic()
+    if remaining <= 0:
+        if asyncio.iscoroutine(aw):
+            aw.close()
+        raise _deadline_exceeded()
+    if shield:
+        aw = asyncio.shield(aw)
+    try:
+        return await asyncio.wait_for(aw, remaining)
+    except asyncio.TimeoutError:
+        if time.monotonic() < deadline:
+            raise  # the send's own timeout, not ours
+        raise _deadline_exceeded() from None
+
+
+async def _streamed(resp: aiohttp.ClientResponse):
+    # A 2xx body is left for the caller; anything else is buffered like
+    # any other response (the retry / refresh / error paths need it).
+    if 200 <= resp.status <= 299:
+        return StreamedResponse(resp)
+    try:
+        body = await resp.read()
+    finally:
+        resp.release()
+    return BufferedResponse(resp.status, resp.reason, CIMultiDict(resp.headers), body)
+
+
 class Transport:
     """Drop-in replacement for the generated ``RESTClientObject``."""
 
@@ -188,31 +308,109 @@ class Transport:
         refresh: RefreshFn,
         policy: RetryPolicy,
         on_response: Optional[Callable[[], None]] = None,
+        connection_options: Optional[ConnectionOptions] = None,
+        http_core: Optional[HttpCore] = None,
+        coalesce: bool = False,
+        pause_on_retry_window: bool = False,
+        cache: Optional[ResponseCache] = None,
+        adaptive_concurrency: Optional[AdaptiveConcurrency] = None,
+        hedging: Optional[HedgePolicy] = None,
+        circuit_breaker: Optional[CircuitBreakerPolicy] = None,
+        trace_connections: bool = False,
+        json_codec: Optional[JsonCodec] = None,
     ) -> None:
         self._ctx = ctx
+        # (key, lowercased key, value) runs; see _header_block.
+        self._static_headers: Optional[
+            Tuple[Tuple[Tuple[str, str, str], ...], Tuple[Tuple[str, str, str], ...]]
+        ] = None
+        self._basic_auth: Optional[str] = None
+        self._codec = json_codec or default_codec()
         self._refresh = refresh
         self._policy = policy
+        self._retry_budget = (
+            TokenBudget(policy.retry_budget_ratio, policy.retry_budget_burst)
+            if policy.retry_budget_ratio > 0
+            else None
+        )
         # Fired after any non-timestamp request gets a response — drives
         # the Client's lazy X-Client-IP fetch (PORTING.md §12).
         self._on_response = on_response
-        self._session: Optional[aiohttp.ClientSession] = None
+        if http_core is not None and connection_options is not None:
+            raise ValueError(
+                "yaylib: pass connection_options to the HttpCore, not "
+                "alongside it"
+            )
+        if http_core is not None and circuit_breaker is not None:
+            raise ValueError(
+                "yaylib: pass circuit_breaker to the HttpCore, not "
+                "alongside it"
+            )
+        # A caller-supplied core is shared and outlives this transport;
+        # otherwise we own a private one.
+        self._owns_core = http_core is None
+        self._core = http_core or HttpCore(
+            connection_options, circuit_breaker=circuit_breaker
+        )
+        # Per-client sessions over the core's shared connectors: the
+        # cookie jar stays per identity while sockets are pooled.
+        self._sessions: Dict[str, aiohttp.ClientSession] = {}
+        # Connection-phase hooks feeding the metrics registry.
+        self._trace_configs = (
+            [build_trace_config()] if trace_connections else None
+        )
+        # Opt-in single-flight of identical in-flight GETs.
+        self._coalesce = coalesce
+        self._inflight: Dict[Tuple[Any, ...], "asyncio.Task[BufferedResponse]"] = {}
+        self._coalesced_count = 0
+        self._cache = cache
+        # Opt-in gate holding back new sends while a retry window the
+        # server announced is open; a core's shared gate turns it on too.
+        self._pause = self._core.pause_gate or (
+            PauseGate() if pause_on_retry_window else None
+        )
+        self._hedger = Hedger(hedging) if hedging is not None else None
+        self._limiters = (
+            LimiterSet(adaptive_concurrency)
+            if adaptive_concurrency is not None
+            else None
+        )
+
+    def _pool_for(self, url: str) -> str:
+        netloc = urlsplit(url).netloc
+        cassandra = self._ctx.cassandra_base_url
+        if netloc and cassandra and netloc == urlsplit(cassandra).netloc:
+            return POOL_CASSANDRA
+        return POOL_PRIMARY
 
-    def _ensure_session(self) -> aiohttp.ClientSession:
+    def _ensure_session(self, pool: str = POOL_PRIMARY) -> aiohttp.ClientSession:
         # Created lazily inside the running loop — Client is built
         # synchronously and aiohttp refuses a session without a loop.
-        if self._session is None or self._session.closed:
-            self._session = aiohttp.ClientSession()
-        return self._session
+        session = self._sessions.get(pool)
+        if session is None or session.closed:
+            session = aiohttp.ClientSession(
+                connector=self._core.connector(pool),
+                connector_owner=False,
+                trace_configs=self._trace_configs,
+            )
+            self._sessions[pool] = session
+        return session
+
+    def pool_stats(self) -> List[PoolStats]:
+        return self._core.pool_stats()
 
     async def close(self) -> None:
-        if self._session is not None and not self._session.closed:
-            await self._session.close()
-            self._session = None
+        sessions = list(self._sessions.values())
+        self._sessions.clear()
+        for session in sessions:
+            if not session.closed:
+                await session.close()
+        if self._owns_core:
+            await self._core.close()
 
     # ---- body serialization (mirrors the generated rest.py) ----
 
-    @staticmethod
-    def _serialize_body(headers: dict, body, post_params):
+    def _serialize_body(self, headers: Dict[str, str], body, post_params):
         if post_params and body:
             raise ApiValueError(
                 "body parameter cannot be used with post_params parameter."
@@ -220,7 +418,7 @@ class Transport:
         ct_key = _find_header(headers, "content-type")
         content_type = headers[ct_key] if ct_key else "application/json"
         if re.search("json", content_type, re.IGNORECASE):
-            return json.dumps(body) if body is not None else None
+            return self._codec.dumps(body) if body is not None else None
         if content_type == "application/x-www-form-urlencoded":
             return aiohttp.FormData(post_params or [])
         if content_type == "multipart/form-data":
@@ -233,7 +431,7 @@ class Transport:
                     )
                 else:
                     if isinstance(v, dict):
-                        v = json.dumps(v)
+                        v = self._codec.dumps_str(v)
                     elif isinstance(v, int):
                         v = str(v)
                     data.add_field(k, v)
@@ -249,27 +447,70 @@ class Transport:
 
     # ---- header injection (PORTING.md §12) ----
 
+    def _header_block(self):
+        # The injected headers fixed per client, as (key, lowercased key,
+        # value) runs before and after the per-request X-Client-IP; built
+        # once, dropped by update_context.
+        block = self._static_headers
+        if block is None:
+            ctx = self._ctx
+
+            def entries(*pairs):
+                return tuple((k, k.lower(), v) for k, v in pairs if v)
+
+            block = self._static_headers = (
+                entries(
+                    ("User-Agent", ctx.user_agent),
+                    ("X-App-Version", ctx.app_version),
+                    ("X-Device-Info", ctx.device_info),
+                    ("X-Device-UUID", ctx.device_uuid),
+                ),
+                entries(
+                    ("X-Connection-Type", ctx.connection_type),
+                    ("X-Connection-Speed", ctx.connection_speed),
+                    ("Accept-Language", ctx.accept_language),
+                ),
+            )
+        return block
+
+    def update_context(self, **changes) -> None:
+        """Set TransportContext fields (``device_uuid=...``)."""
+        for name, value in changes.items():
+            setattr(self._ctx, name, value)
+        self._static_headers = None
+        self._basic_auth = None
+
+    def _basic_authorization(self) -> str:
+        basic = self._basic_auth
+        if basic is None:
+            token = base64.b64encode(self._ctx.api_key.encode("utf-8")).decode("ascii")
+            basic = self._basic_auth = f"Basic {token}"
+        return basic
+
     def _build_headers(self, base: dict, url: str) -> dict:
         headers = dict(base)
-        ctx = self._ctx
-        _set_if_absent(headers, "User-Agent", ctx.user_agent)
-        _set_if_absent(headers, "X-App-Version", ctx.app_version)
-        _set_if_absent(headers, "X-Device-Info", ctx.device_info)
-        _set_if_absent(headers, "X-Device-UUID", ctx.device_uuid)
-        _set_if_absent(headers, "X-Client-IP", ctx.client_ip())
-        _set_if_absent(headers, "X-Connection-Type", ctx.connection_type)
-        _set_if_absent(headers, "X-Connection-Speed", ctx.connection_speed)
-        _set_if_absent(headers, "Accept-Language", ctx.accept_language)
+        # lowercased name -> first key spelling it, for set-if-absent
+        present = {k.lower(): k for k in reversed(base)} if base else {}
+        before, after = self._header_block()
+        for key, lkey, value in before:
+            if lkey not in present:
+                headers[key] = value
+        client_ip = self._ctx.client_ip()
+        if client_ip and "x-client-ip" not in present:
+            headers["X-Client-IP"] = client_ip
+        for key, lkey, value in after:
+            if lkey not in present:
+                headers[key] = value
 
         # X-Timestamp must be fresh per request (never cached).
-        ts_key = _find_header(headers, "x-timestamp")
+        ts_key = present.get("x-timestamp")
         if ts_key:
             del headers[ts_key]
         headers["X-Timestamp"] = str(int(time.time()))
 
         # Normalize JSON Content-Type to the exact casing / spacing the
         # server expects.
-        ct_key = _find_header(headers, "content-type")
+        ct_key = present.get("content-type")
         if ct_key is None:
             headers["Content-Type"] = "application/json;charset=UTF-8"
         elif headers[ct_key].lower().startswith("application/json"):
@@ -277,32 +518,208 @@ class Transport:
 
         # Authorization: Basic for oauth/token*, Bearer for everything
         # else. Caller-provided Authorization wins (set-if-absent).
-        if _find_header(headers, "authorization") is None:
+        if "authorization" not in present:
             if _is_oauth_token_path(url):
-                token = base64.b64encode(
-                    ctx.api_key.encode("utf-8")
-                ).decode("ascii")
-                headers["Authorization"] = f"Basic {token}"
+                headers["Authorization"] = self._basic_authorization()
             else:
-                access = ctx.access_token()
+                access = self._ctx.access_token()
                 if access:
                     headers["Authorization"] = f"Bearer {access}"
         return headers
 
     async def _raw(
-        self, method: str, url: str, headers: dict, data, timeout
+        self,
+        method: str,
+        url: str,
+        headers: Dict[str, str],
+        data,
+        timeout,
+        metered: bool = True,
+        stream: bool = False,
     ) -> BufferedResponse:
-        session = self._ensure_session()
-        async with session.request(
-            method, url, headers=headers, data=data, timeout=timeout
-        ) as resp:
-            body = await resp.read()
-            return BufferedResponse(
-                resp.status,
-                resp.reason,
-                CIMultiDict(resp.headers),
-                body,
+        host = urlsplit(url).netloc
+        breaker = self._core.breaker(host)
+        if breaker is not None:
+            state = breaker.state
+            allowed = breaker.allow()
+            if breaker.state != state:
+                self._log_circuit(host, breaker.state)
+            if not allowed:
+                raise ApiException(status=0, reason=f"circuit open for {host}")
+        session = self._ensure_session(self._pool_for(url))
+        call = current_call_metrics() if metered else None
+        started = headers_at = time.monotonic() if call is not None else 0.0
+        try:
+            if stream:
+                resp = await session.request(
+                    method,
+                    url,
+                    headers=headers,
+                    data=data,
+                    timeout=timeout,
+                    trace_request_ctx=call,
+                )
+                if call is not None:
+                    headers_at = time.monotonic()
+                out = await _streamed(resp)
+            else:
+                async with session.request(
+                    method,
+                    url,
+                    headers=headers,
+                    data=data,
+                    timeout=timeout,
+                    trace_request_ctx=call,
+                ) as resp:
+                    if call is not None:
+                        headers_at = time.monotonic()
+                    body = await resp.read()
+                    out = BufferedResponse(
+                        resp.status,
+                        resp.reason,
+                        CIMultiDict(resp.headers),
+                        body,
+                    )
+        except (aiohttp.ClientError, asyncio.TimeoutError):
+            if breaker is not None:
+                self._record_circuit(host, breaker, False)
+            raise
+        except BaseException:
+            if breaker is not None:
+                breaker.record_abandoned()
+            raise
+        if breaker is not None:
+            self._record_circuit(host, breaker, not is_server_error(out.status))
+        if call is not None:
+            call.send += headers_at - started
+            call.read += time.monotonic() - headers_at
+            call.attempts += 1
+        return out
+
+    def _record_circuit(self, host: str, breaker: CircuitBreaker, ok: bool) -> None:
+        state = breaker.state
+        if ok:
+            breaker.record_success()
+        else:
+            breaker.record_failure()
+        if breaker.state != state:
+            self._log_circuit(host, breaker.state)
+
+    def _log_circuit(self, host: str, state: str) -> None:
+        if self._ctx.logger is not None:
+            self._ctx.logger.warning(
+                "circuit breaker state changed",
+                extra={"event": "circuit_state", "host": host, "state": state},
+            )
+
+    async def _send(
+        self, method: str, url: str, headers: Dict[str, str], data, timeout, stream: bool = False
+    ) -> BufferedResponse:
+        # One attempt of the wrapped path: wait out any retry window the
+        # server has announced, then go through the adaptive concurrency
+        # window when one is configured.
+        pause = self._pause
+        if pause is not None:
+            await pause.wait()
+        limiters = self._limiters
+        if limiters is None:
+            resp = await self._attempt(method, url, headers, data, timeout, stream)
+        else:
+            resp = await self._send_limited(
+                limiters, method, url, headers, data, timeout, stream
             )
+        if pause is not None and (resp.status == 429 or 500 <= resp.status <= 599):
+            wait = self._retry_hint_seconds(resp, self._codec)
+            if wait is not None:
+                pause.pause_for(min(wait, self._policy.max_delay))
+        return resp
+
+    async def _send_limited(
+        self,
+        limiters: LimiterSet,
+        method: str,
+        url: str,
+        headers: Dict[str, str],
+        data,
+        timeout,
+        stream: bool = False,
+    ) -> BufferedResponse:
+        limiter = limiters.for_request(method, urlsplit(url).path)
+        generation = await limiter.acquire()
+        started = time.monotonic()
+        try:
+            resp = await self._attempt(method, url, headers, data, timeout, stream)
+        except asyncio.CancelledError:
+            limiter.abandon()
+            raise
+        except BaseException:
+            limiter.release(generation, congested=True, latency=None)
+            raise
+        limiter.release(
+            generation,
+            congested=is_congestion_status(resp.status),
+            latency=time.monotonic() - started,
+        )
+        return resp
+
+    async def _attempt(
+        self, method: str, url: str, headers: Dict[str, str], data, timeout, stream: bool = False
+    ) -> BufferedResponse:
+        hedger = self._hedger
+        if stream:
+            # A losing copy could not be cancelled once its body is the
+            # caller's to read.
+            return await self._raw(method, url, headers, data, timeout, stream=True)
+        if hedger is None or not method_allows_retry(method, self._policy):
+            return await self._raw(method, url, headers, data, timeout)
+        op = hedger.operation(method, urlsplit(url).path)
+        if op is None:
+            return await self._raw(method, url, headers, data, timeout)
+        return await self._hedged(hedger, op, method, url, headers, data, timeout)
+
+    async def _hedged(
+        self,
+        hedger: Hedger,
+        op: str,
+        method: str,
+        url: str,
+        headers: Dict[str, str],
+        data,
+        timeout,
+    ) -> BufferedResponse:
+        # First send; if it is still out after the op's threshold and
+        # the budget allows, a second copy races it. The first success
+        # wins and the other send is cancelled. A failed send only
+        # loses if the other one is still running.
+        started = time.monotonic()
+        first = asyncio.ensure_future(
+            self._raw(method, url, headers, data, timeout)
+        )
+        pending = {first}
+        try:
+            done, pending = await asyncio.wait(pending, timeout=hedger.delay(op))
+            if not done and hedger.try_hedge():
+                pending.add(asyncio.ensure_future(
+                    self._raw(method, url, headers, data, timeout)
+                ))
+            while True:
+                if not done:
+                    done, pending = await asyncio.wait(
+                        pending, return_when=asyncio.FIRST_COMPLETED
+                    )
+                for task in done:
+                    if task.exception() is None:
+                        if task is not first:
+                            hedger.record_win()
+                        hedger.observe(op, time.monotonic() - started)
+                        return task.result()
+                if not pending:
+                    # Every copy failed: surface the first send's error.
+                    return first.result()
+                done = set()
+        finally:
+            for task in pending:
+                task.cancel()
 
     async def send_unwrapped(
         self, method: str, url: str, headers: dict, data, timeout=None
@@ -313,16 +730,19 @@ class Transport:
         UNWRAPPED HTTP client) so it can never recurse back into the
         refresh hook.
         """
+        # Not metered: a refresh is "wait" time of the call it serves.
         return await self._raw(
-            method.upper(), url, headers, data, _timeout(timeout)
+            method.upper(), url, headers, data, _timeout(timeout), metered=False
         )
 
     @staticmethod
-    def _retry_in_seconds(resp: BufferedResponse) -> Optional[float]:
+    def _retry_in_seconds(
+        resp: BufferedResponse, codec: Optional[JsonCodec] = None
+    ) -> Optional[float]:
         if not resp.data:
             return None
         try:
-            parsed = json.loads(resp.data)
+            parsed = (codec or default_codec()).loads(resp.data)
         except (ValueError, TypeError):
             return None
         if not isinstance(parsed, dict):
@@ -332,6 +752,31 @@ class Transport:
             return float(v)
         return None
 
+    @staticmethod
+    def _retry_after_seconds(resp: BufferedResponse) -> Optional[float]:
+        # RFC 9110 §10.2.3: delay-seconds or an HTTP-date.
+        value = resp.getheader("Retry-After")
+        if not value:
+            return None
+        value = value.strip()
+        if value.isdigit():
+            return float(value)
+        try:
+            when = email.utils.parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        if when is None or when.tzinfo is None:
+            return None
+        return max(0.0, when.timestamp() - time.time())
+
+    @classmethod
+    def _retry_hint_seconds(
+        cls, resp: BufferedResponse, codec: Optional[JsonCodec] = None
+    ) -> Optional[float]:
+        # The body's retry_in wins; Retry-After is the HTTP-level fallback.
+        wait = cls._retry_in_seconds(resp, codec)
+        return wait if wait is not None else cls._retry_after_seconds(resp)
+
     async def request(
         self,
         method,
@@ -346,6 +791,110 @@ class Transport:
         # origin before anything else so header injection, the 401
         # refresh-and-replay, and retries all act on the final URL.
         url = _route_host(method, url, self._ctx)
+        if _streaming.get():
+            # Only this request streams (and skips the cache and
+            # coalescing): the refresh it may run and the work it kicks
+            # off in the background read their bodies as usual.
+            token = _streaming.set(False)
+            try:
+                return await self._request(
+                    method, url, headers, body, post_params, _request_timeout,
+                    stream=True,
+                )
+            finally:
+                _streaming.reset(token)
+        if method != "GET" or body is not None or post_params:
+            return await self._request(
+                method, url, headers, body, post_params, _request_timeout
+            )
+
+        cache = self._cache
+        ttl = cache.ttl_for(urlsplit(url).path) if cache is not None else None
+        key = self._get_key(url, headers) if (ttl or self._coalesce) else ()
+        if cache is not None and ttl is not None and not current_call_options().bypass_cache:
+            hit = cache.get(key)
+            if hit is not None:
+                return hit
+        if self._coalesce:
+            resp = await self._coalesced(key, url, headers, _request_timeout)
+        else:
+            resp = await self._request(
+                method, url, headers, None, None, _request_timeout
+            )
+        if cache is not None and ttl is not None and 200 <= resp.status <= 299:
+            cache.put(key, resp, ttl)
+        return resp
+
+    def _get_key(self, url: str, headers) -> CacheKey:
+        # Identity of a GET for coalescing and caching. It carries the
+        # Bearer so two identities never share a body.
+        return (
+            url,
+            self._ctx.access_token(),
+            tuple(sorted((headers or {}).items())),
+        )
+
+    async def _coalesced(
+        self, key: CacheKey, url, headers, _request_timeout
+    ) -> BufferedResponse:
+        # Single-flight for identical GETs: the first caller starts the
+        # round-trip as a task, later callers with the same key await
+        # that task and share its BufferedResponse (read-only, so safe
+        # to hand out more than once).
+        task = self._inflight.get(key)
+        if task is not None:
+            self._coalesced_count += 1
+            # The round-trip runs under the first caller's deadline; a
+            # joiner still gives up at its own.
+            return await _within(
+                current_call_options().deadline, task, shield=True
+            )
+        task = asyncio.ensure_future(
+            self._request("GET", url, headers, None, None, _request_timeout)
+        )
+        self._inflight[key] = task
+
+        def _done(t: "asyncio.Task[BufferedResponse]") -> None:
+            if self._inflight.get(key) is t:
+                del self._inflight[key]
+            # Every waiter may have been cancelled; retrieve the outcome
+            # so asyncio does not log it as never retrieved.
+            if not t.cancelled():
+                t.exception()
+
+        task.add_done_callback(_done)
+        # shield: one waiter being cancelled must not cancel the shared
+        # round-trip under the others.
+        return await asyncio.shield(task)
+
+    @property
+    def coalesced_requests(self) -> int:
+        return self._coalesced_count
+
+    def cache_stats(self) -> Optional[CacheStats]:
+        return self._cache.stats() if self._cache is not None else None
+
+    def limiter_stats(self) -> Dict[str, LimiterStats]:
+        return self._limiters.stats() if self._limiters is not None else {}
+
+    def pause_stats(self) -> Optional[PauseStats]:
+        return self._pause.stats() if self._pause is not None else None
+
+    def hedge_stats(self) -> Optional[HedgeStats]:
+        return self._hedger.stats() if self._hedger is not None else None
+
+    def circuit_states(self) -> Dict[str, str]:
+        return self._core.circuit_states()
+
+    def _spend_retry(self) -> bool:
+        # Retries past the budget fall through to the no-retry path, so
+        # the caller sees the original response / transport error.
+        budget = self._retry_budget
+        return budget is None or budget.try_spend()
+
+    async def _request(
+        self, method, url, headers, body, post_params, _request_timeout, stream=False
+    ) -> BufferedResponse:
         base_headers = dict(headers or {})
         data = self._serialize_body(base_headers, body, post_params)
         timeout = _timeout(_request_timeout)
@@ -356,6 +905,12 @@ class Transport:
 
         attempt = 1  # number of sends performed (initial counts as 1)
         did_refresh = False
+        deadline = current_call_options().deadline
+        call = current_call_metrics()
+        if call is not None and isinstance(data, (str, bytes)):
+            call.request_bytes += len(data)
+        if self._retry_budget is not None:
+            self._retry_budget.earn()
 
         while True:
             send_headers = self._build_headers(base_headers, url)
@@ -377,21 +932,33 @@ class Transport:
                     },
                 )
 
+            # A retry window the server announced that outlasts the
+            # deadline fails now instead of being waited out.
+            if (
+                deadline is not None
+                and self._pause is not None
+                and time.monotonic() + self._pause.remaining() >= deadline
+            ):
+                raise _deadline_exceeded()
+
             try:
-                resp = await self._raw(
-                    method, url, send_headers, data, timeout
+                resp = await _within(
+                    deadline,
+                    self._send(method, url, send_headers, data, timeout, stream),
                 )
             except asyncio.CancelledError:
                 raise
             except aiohttp.ClientError as exc:
+                delay = min(
+                    full_jitter_delay(attempt, policy), policy.max_delay
+                )
                 if (
                     retry_enabled
                     and method_allows_retry(method, policy)
                     and attempt < policy.max_attempts
+                    and _fits(deadline, delay)
+                    and self._spend_retry()
                 ):
-                    delay = min(
-                        full_jitter_delay(attempt, policy), policy.max_delay
-                    )
                     if self._ctx.logger is not None:
                         self._ctx.logger.debug(
                             "retrying request",
@@ -406,6 +973,8 @@ class Transport:
                         )
                     await asyncio.sleep(delay)
                     attempt += 1
+                    if call is not None:
+                        call.retries += 1
                     continue
                 raise ApiException(status=0, reason=str(exc)) from exc
 
@@ -420,8 +989,10 @@ class Transport:
             # successful refresh is OUTSIDE the retry budget — it mirrors
             # the Go/TS split where refresh and retry are separate hooks.
             if resp.status == 401 and not is_oauth and not did_refresh:
-                if await self._refresh(stale_access):
+                if await _within(deadline, self._refresh(stale_access), shield=True):
                     did_refresh = True
+                    if call is not None:
+                        call.refreshes += 1
                     continue
                 return resp
 
@@ -430,12 +1001,14 @@ class Transport:
                 and should_retry_status(resp.status, method, policy)
                 and attempt < policy.max_attempts
             ):
-                body_wait = self._retry_in_seconds(resp)
+                body_wait = self._retry_in_seconds(resp, self._codec)
                 delay = (
                     body_wait
                     if body_wait is not None
                     else full_jitter_delay(attempt, policy)
                 )
+                if not _fits(deadline, delay) or not self._spend_retry():
+                    return resp
                 if self._ctx.logger is not None:
                     self._ctx.logger.debug(
                         "retrying request",
@@ -450,6 +1023,8 @@ class Transport:
                     )
                 await asyncio.sleep(delay)
                 attempt += 1
+                if call is not None:
+                    call.retries += 1
                 continue
 
             return resp
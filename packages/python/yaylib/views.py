@@ -0,0 +1,211 @@
+# Compact read-only views of the hottest models. A pydantic Post costs
+# several KB (a __dict__ of ~60 entries, a model_fields_set of the same
+# size, validate_assignment machinery); services that hold large working
+# sets of posts or users can keep these instead:
+#
+#     with yaylib.call_options(response_mode="dict"):
+#         page = await client.get_timeline(...)
+#     posts = [PostView.from_dict(p) for p in page["posts"]]
+#
+#     view = PostView.from_model(post)      # and back: view.to_model()
+#
+# A view class has one __slot__ per model field (same names), is frozen,
+# and is built from the model's pydantic field table at import, so it
+# never drifts from the generated model. Nested fields whose model has a
+# view hold views (Post.user -> RealmUserView, likers -> a tuple of
+# them); other nested models stay parsed JSON (dicts), lists become
+# tuples. from_dict takes the server's JSON as-is, without validation —
+# to_model() validates, via Model.from_dict.
+
+from __future__ import annotations
+
+import enum
+import typing
+from dataclasses import FrozenInstanceError
+from typing import Any, Dict, List, Optional, Tuple, Type, cast
+
+from pydantic import BaseModel
+
+from yaylib.models.post import Post
+from yaylib.models.realm_chat_room import RealmChatRoom
+from yaylib.models.realm_message import RealmMessage
+from yaylib.models.realm_user import RealmUser
+
+# How a field is carried: as-is (JSON), as a view, or a tuple of views.
+_PLAIN, _VIEW, _VIEWS = 0, 1, 2
+
+
+class _View:
+    __slots__: Tuple[str, ...] = ()
+
+    # Set per view class.
+    _model: Type[BaseModel]
+    # (slot, JSON key, kind, view class or None) per field; built on
+    # first use, once every view class exists.
+    _plan: Optional[Tuple[Tuple[str, str, int, Any], ...]] = None
+
+    def __init__(self, **values: Any) -> None:
+        unknown = set(values).difference(self.__slots__)
+        if unknown:
+            raise TypeError(
+                f"{type(self).__name__}: unknown fields {sorted(unknown)}"
+            )
+        for name in self.__slots__:
+            object.__setattr__(self, name, values.get(name))
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> Any:
+        """A view of the model's parsed JSON object (unvalidated)."""
+        view = object.__new__(cls)
+        for name, key, kind, target in _plan_of(cls):
+            value = data.get(key)
+            if value is not None:
+                if kind == _VIEW:
+                    value = target.from_dict(value)
+                elif kind == _VIEWS:
+                    value = tuple(target.from_dict(v) for v in value)
+                elif type(value) is list:
+                    value = tuple(value)
+            object.__setattr__(view, name, value)
+        return view
+
+    @classmethod
+    def from_model(cls, model: BaseModel) -> Any:
+        view = object.__new__(cls)
+        values = model.__dict__
+        for name, _, kind, target in _plan_of(cls):
+            value = values.get(name)
+            if value is not None:
+                if kind == _VIEW:
+                    value = target.from_model(value)
+                elif kind == _VIEWS:
+                    value = tuple(target.from_model(v) for v in value)
+                else:
+                    value = _as_json(value)
+            object.__setattr__(view, name, value)
+        return view
+
+    def to_dict(self) -> Dict[str, Any]:
+        """The JSON object of the view; None fields are omitted."""
+        out: Dict[str, Any] = {}
+        for name, key, kind, _ in _plan_of(type(self)):
+            value = getattr(self, name)
+            if value is None:
+                continue
+            if kind == _VIEW:
+                value = value.to_dict()
+            elif kind == _VIEWS:
+                value = [v.to_dict() for v in value]
+            elif type(value) is tuple:
+                value = list(value)
+            out[key] = value
+        return out
+
+    def to_model(self) -> Any:
+        """The full (validated) pydantic model."""
+        # from_dict is on every generated model, not on BaseModel.
+        return cast(Any, self._model).from_dict(self.to_dict())
+
+    if typing.TYPE_CHECKING:
+        # Fields are the model's, set per view class.
+        def __getattr__(self, name: str) -> Any: ...
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise FrozenInstanceError(f"cannot assign to field {name!r}")
+
+    def __delattr__(self, name: str) -> None:
+        raise FrozenInstanceError(f"cannot delete field {name!r}")
+
+    def __eq__(self, other: Any) -> bool:
+        if type(other) is not type(self):
+            return NotImplemented
+        return all(getattr(self, n) == getattr(other, n) for n in self.__slots__)
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        args = ", ".join(
+            f"{n}={getattr(self, n)!r}"
+            for n in self.__slots__
+            if getattr(self, n) is not None
+        )
+        return f"{type(self).__name__}({args})"
+
+    def __reduce__(self):
+        return _restore, (type(self), tuple(getattr(self, n) for n in self.__slots__))
+
+
+def _restore(cls: Type[_View], values: Tuple[Any, ...]) -> Any:
+    view = object.__new__(cls)
+    for name, value in zip(cls.__slots__, values):
+        object.__setattr__(view, name, value)
+    return view
+
+
+def _as_json(value: Any) -> Any:
+    # A model value in the JSON shape from_dict would have stored.
+    if isinstance(value, BaseModel):
+        return value.model_dump(mode="json", by_alias=True, exclude_none=True)
+    if isinstance(value, enum.Enum):
+        return value.value
+    if isinstance(value, list):
+        return tuple(_as_json(v) for v in value)
+    if isinstance(value, dict):
+        return {k: _as_json(v) for k, v in value.items()}
+    return value
+
+
+def _make(model: Type[BaseModel], doc: str) -> Type[_View]:
+    view = type(
+        model.__name__ + "View",
+        (_View,),
+        {
+            "__slots__": tuple(model.model_fields),
+            "__doc__": doc,
+            "__module__": __name__,
+            "_model": model,
+        },
+    )
+    return cast(Type[_View], view)
+
+
+PostView = _make(Post, "Read-only slotted view of Post.")
+RealmUserView = _make(RealmUser, "Read-only slotted view of RealmUser.")
+RealmMessageView = _make(RealmMessage, "Read-only slotted view of RealmMessage.")
+RealmChatRoomView = _make(RealmChatRoom, "Read-only slotted view of RealmChatRoom.")
+
+_VIEWS_BY_MODEL: Dict[type, Type[_View]] = {
+    Post: PostView,
+    RealmUser: RealmUserView,
+    RealmMessage: RealmMessageView,
+    RealmChatRoom: RealmChatRoomView,
+}
+
+
+def _plan_of(cls: Type[_View]) -> Tuple[Tuple[str, str, int, Any], ...]:
+    plan = cls.__dict__.get("_plan")
+    if plan is None:
+        entries: List[Tuple[str, str, int, Any]] = []
+        for name, info in cls._model.model_fields.items():
+            kind, target = _kind(info.annotation)
+            entries.append((name, info.alias or name, kind, target))
+        plan = tuple(entries)
+        type.__setattr__(cls, "_plan", plan)
+    return plan
+
+
+def _kind(annotation: Any) -> Tuple[int, Any]:
+    tp = annotation
+    if typing.get_origin(tp) is typing.Union:
+        args = [a for a in typing.get_args(tp) if a is not type(None)]
+        if len(args) == 1:
+            tp = args[0]
+    view = _VIEWS_BY_MODEL.get(tp)
+    if view is not None:
+        return _VIEW, view
+    if typing.get_origin(tp) is list:
+        (item,) = typing.get_args(tp)
+        view = _VIEWS_BY_MODEL.get(item)
+        if view is not None:
+            return _VIEWS, view
+    return _PLAIN, None